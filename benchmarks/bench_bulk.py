@@ -0,0 +1,48 @@
+# benchmarks/bench_bulk.py
+"""Compara a importação tarefa a tarefa com a API em lote do TaskController.
+
+Uso:
+    python benchmarks/bench_bulk.py [tarefas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tasklist"))
+
+from controller.task_controller import TaskController  # noqa: E402
+from model.task_model import TaskModel  # noqa: E402
+
+
+def generate(count):
+    """Gera dicionários de tarefas para importação."""
+    for i in range(count):
+        yield {"description": f"Tarefa {i}", "start_date": "2024-01-01", "end_date": "2024-12-31"}
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    # A inserção uma a uma é medida em uma amostra menor
+    sample = min(count, 5_000)
+    with tempfile.TemporaryDirectory() as tmp:
+        controller = TaskController(TaskModel(os.path.join(tmp, "one.db")))
+        start = time.perf_counter()
+        for task in generate(sample):
+            controller.add_task(**task)
+        one_by_one = (time.perf_counter() - start) / sample
+        controller.close()
+
+        controller = TaskController(TaskModel(os.path.join(tmp, "bulk.db")))
+        start = time.perf_counter()
+        controller.add_tasks(generate(count))
+        bulk = (time.perf_counter() - start) / count
+        controller.close()
+
+    print(f"uma a uma: {1 / one_by_one:10.0f} tarefas/s (estimado {one_by_one * count:.1f}s para {count})")
+    print(f"em lote:   {1 / bulk:10.0f} tarefas/s ({bulk * count:.1f}s para {count})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/bench_connection.py
+"""Compara conexão por chamada com as conexões persistentes do TaskModel.
+
+Uso:
+    python benchmarks/bench_connection.py [operações]
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tasklist"))
+
+from model.task_model import TaskModel  # noqa: E402
+
+
+def connect_per_call(db_path, ops):
+    """Reproduz o comportamento antigo: uma conexão nova por operação."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                description TEXT NOT NULL,
+                start_date TEXT,
+                end_date TEXT,
+                status TEXT
+            );
+        """)
+    start = time.perf_counter()
+    for i in range(ops):
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO tasks (description, start_date, end_date, status) VALUES (?, ?, ?, ?);",
+                (f"Tarefa {i}", None, None, "Pendente"),
+            )
+            conn.commit()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("SELECT id, description, start_date, end_date, status FROM tasks WHERE id = ?;", (i + 1,)).fetchall()
+    return time.perf_counter() - start
+
+
+def pooled(db_path, ops):
+    """Executa as mesmas operações usando o TaskModel com conexões persistentes."""
+    model = TaskModel(db_path)
+    start = time.perf_counter()
+    for i in range(ops):
+        model.add_task(f"Tarefa {i}")
+        with model.connections.reader() as conn:
+            conn.execute("SELECT id, description, start_date, end_date, status FROM tasks WHERE id = ?;", (i + 1,)).fetchall()
+    elapsed = time.perf_counter() - start
+    model.close()
+    return elapsed
+
+
+def main():
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as tmp:
+        before = connect_per_call(os.path.join(tmp, "before.db"), ops)
+        after = pooled(os.path.join(tmp, "after.db"), ops)
+    print(f"conexão por chamada: {ops / before:10.0f} ops/s")
+    print(f"conexões persistentes: {ops / after:8.0f} ops/s")
+    print(f"ganho: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/bench_records.py
+"""Compara memória e tempo de leitura entre dicionários, TaskRecord e iter_tasks.
+
+Uso:
+    python benchmarks/bench_records.py [tarefas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tasklist"))
+
+from model.task_model import COLUMNS, TaskModel  # noqa: E402
+
+
+def as_dicts(model):
+    """Reproduz o formato antigo: um dicionário de 5 chaves por linha."""
+    with model.connections.reader() as conn:
+        rows = conn.execute(f"SELECT {COLUMNS} FROM tasks;").fetchall()
+    return [
+        {"id": row[0], "description": row[1], "start_date": row[2], "end_date": row[3], "status": row[4]}
+        for row in rows
+    ]
+
+
+def streamed(model):
+    """Percorre todas as tarefas com iter_tasks, sem guardar a lista."""
+    count = 0
+    for _ in model.iter_tasks():
+        count += 1
+    return count
+
+
+def measure(label, func, model):
+    """Mede tempo e pico de memória de uma função de leitura."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(model)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    print(f"{label:<14} {elapsed * 1e3:9.1f} ms  pico {peak / 2**20:8.1f} MiB")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        model = TaskModel(os.path.join(tmp, "records.db"))
+        model.add_tasks((f"Tarefa {i}", "2024-01-01", None, "Em Andamento") for i in range(count))
+        print(f"tarefas: {count}")
+        measure("dicionários", as_dicts, model)
+        measure("TaskRecord", lambda m: m.get_tasks(), model)
+        measure("iter_tasks", streamed, model)
+        model.close()
+
+
+if __name__ == "__main__":
+    main()
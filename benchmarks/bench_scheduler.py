@@ -0,0 +1,88 @@
+# benchmarks/bench_scheduler.py
+"""Custo do agendador de mudanças de status em relação ao tamanho da tabela.
+
+Para cada tamanho, cria um banco em que apenas algumas tarefas mudam de status
+no dia seguinte e mede a execução do agendador nesse dia (gravação das mudanças
+e releitura do heap). Compara com a alternativa de varrer todas as tarefas em
+aberto e recalcular o status de cada uma.
+
+Uso:
+    python benchmarks/bench_scheduler.py [tamanhos] [mudanças por dia]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tasklist"))
+
+from controller.status_scheduler import StatusScheduler  # noqa: E402
+from controller.task_controller import TaskController  # noqa: E402
+from model.task_model import STATUS_PENDING, TaskModel  # noqa: E402
+
+
+def seed(model, size, due, today):
+    """Cria ``size`` tarefas pendentes, das quais ``due`` começam amanhã."""
+    tomorrow = today + timedelta(days=1)
+    rng = random.Random(size)
+    rows = []
+    for i in range(size - due):
+        start = today + timedelta(days=rng.randint(2, 3650))
+        rows.append((f"Tarefa {i}", start.isoformat(), (start + timedelta(days=30)).isoformat(), STATUS_PENDING))
+    for i in range(due):
+        rows.append((f"Amanhã {i}", tomorrow.isoformat(), (tomorrow + timedelta(days=7)).isoformat(), STATUS_PENDING))
+    model.add_tasks(rows)
+
+
+def full_scan(controller, day):
+    """Alternativa por varredura: recalcula o status de todas as tarefas em aberto.
+
+    Returns:
+        int: Quantidade de tarefas cujo status mudaria.
+    """
+    return sum(
+        controller.calculate_status(task.start_date, task.end_date, day) != task.status
+        for task in controller.iter_tasks(status=STATUS_PENDING)
+    )
+
+
+def run(size, due):
+    today = date.today()
+    tomorrow = today + timedelta(days=1)
+    with tempfile.TemporaryDirectory() as tmp:
+        model = TaskModel(os.path.join(tmp, "scheduler.db"))
+        seed(model, size, due, today)
+        controller = TaskController(model)
+        scheduler = StatusScheduler(controller)
+
+        start = time.perf_counter()
+        scheduler.run_once(today)
+        load = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = full_scan(controller, tomorrow)
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        changed = scheduler.run_once(tomorrow)
+        tick = time.perf_counter() - start
+        model.close()
+
+    status = "OK" if changed == expected == due else "DIVERGENTE"
+    print(f"{size:>9} tarefas: leitura inicial {load * 1e3:7.2f} ms | dia com {changed} mudanças: "
+          f"agendador {tick * 1e3:7.2f} ms, varredura {scan * 1e3:8.2f} ms -> {status}")
+    return status == "OK"
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1].split(",")] if len(sys.argv) > 1 else [10_000, 100_000, 500_000]
+    due = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    ok = all([run(size, due) for size in sizes])
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
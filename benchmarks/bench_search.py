@@ -0,0 +1,49 @@
+# benchmarks/bench_search.py
+"""Mede a latência da busca por prefixo (FTS5) comparada ao LIKE.
+
+Uso:
+    python benchmarks/bench_search.py [tarefas]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tasklist"))
+
+from model.task_model import TaskModel  # noqa: E402
+
+WORDS = (
+    "relatório mensal reunião cliente orçamento revisar enviar contrato planejar "
+    "projeto compras mercado pagar conta estudar python ligar médico treino"
+).split()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    # O último termo é raro: o LIKE precisa varrer a tabela inteira
+    queries = ["rel", "orç", "contrato env", "pyth", "méd lig", str(count - 7)]
+    with tempfile.TemporaryDirectory() as tmp:
+        model = TaskModel(os.path.join(tmp, "search.db"))
+        model.add_tasks(
+            (" ".join(rng.sample(WORDS, 4)) + f" {i}", None, None, "Pendente") for i in range(count)
+        )
+        print(f"tarefas: {count}")
+        for query in queries:
+            runs = 20
+            start = time.perf_counter()
+            for _ in range(runs):
+                model.search_tasks(query, limit=50)
+            fts = (time.perf_counter() - start) / runs
+            start = time.perf_counter()
+            model.get_tasks(text=query.split()[0], limit=50)
+            like = time.perf_counter() - start
+            print(f"{query!r:<16} fts5 {fts * 1e3:7.2f} ms   like {like * 1e3:7.2f} ms")
+        model.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# benchmarks/bench_startup.py
+"""Mede o tempo de importação e o tempo até o primeiro quadro do aplicativo.
+
+Cada medida roda em um interpretador novo, para incluir o custo das importações:
+
+- ``python -X importtime``: tempo acumulado das importações de ``main`` e dos
+  módulos mais caros;
+- tempo até o primeiro quadro: da importação de ``main`` até o esqueleto ser
+  adicionado à página, até a aplicação substituí-lo e até a primeira página de
+  tarefas ser carregada.
+
+Uso:
+    python benchmarks/bench_startup.py [tarefas] [repetições]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+TASKLIST_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "tasklist"))
+
+# Executado em um interpretador novo, dentro de um diretório com o banco populado
+FIRST_FRAME = r"""
+import time
+start = time.perf_counter()
+
+import asyncio
+import json
+import sys
+
+sys.path.insert(0, sys.argv[1])
+import main
+imported = time.perf_counter()
+
+
+class RecordingPage:
+    # Registra o instante de cada page.add (um quadro enviado ao cliente)
+
+    def __init__(self):
+        self.controls = []
+        self.frames = []
+
+    def add(self, *controls):
+        self.controls.extend(controls)
+        self.frames.append(time.perf_counter())
+
+    def update(self):
+        self.frames.append(time.perf_counter())
+
+    def run_task(self, handler, *args):
+        return asyncio.get_running_loop().create_task(handler(*args))
+
+
+async def run():
+    page = RecordingPage()
+    await main.main(page)
+    app = page.controls[-1]
+    # Fora de um cliente Flet, update() executa apenas before_update
+    app.update = app.before_update
+    await app.load_initial()
+    loaded = time.perf_counter()
+    app.controller.close()
+    return page, loaded
+
+
+page, loaded = asyncio.run(run())
+print(json.dumps({
+    "import_ms": (imported - start) * 1e3,
+    "first_frame_ms": (page.frames[0] - start) * 1e3,
+    "app_ready_ms": (page.frames[1] - start) * 1e3,
+    "first_page_ms": (loaded - start) * 1e3,
+}))
+"""
+
+
+def import_times(module):
+    """Lê a saída de ``-X importtime`` para a importação de um módulo.
+
+    Returns:
+        tuple: Tempo acumulado total (ms) e os dez módulos mais caros.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=TASKLIST_DIR, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative) / 1e3, name.rstrip()))
+    # Módulos de nível mais alto: sem recuo no nome
+    total = sum(ms for ms, name in rows if not name.startswith("  "))
+    top = sorted(rows, reverse=True)[:10]
+    return total, top
+
+
+def seed(db_path, count):
+    """Cria o banco usado pelo aplicativo com ``count`` tarefas."""
+    sys.path.insert(0, TASKLIST_DIR)
+    from model.task_model import TaskModel
+
+    model = TaskModel(db_path)
+    model.add_tasks((f"Tarefa {i}", "2024-01-01", "2024-12-31", "Em Andamento") for i in range(count))
+    model.close()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    total, top = import_times("main")
+    print(f"import main: {total:8.1f} ms (acumulado)")
+    for ms, name in top:
+        print(f"  {ms:8.1f} ms  {name.strip()}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # O aplicativo usa o banco padrão, relativo ao diretório atual
+        seed(os.path.join(tmp, "taskslist.db"), count)
+        runs = []
+        for _ in range(repeat):
+            process = subprocess.run(
+                [sys.executable, "-c", FIRST_FRAME, TASKLIST_DIR],
+                cwd=tmp, capture_output=True, text=True, check=True,
+            )
+            runs.append(json.loads(process.stdout.splitlines()[-1]))
+
+    print(f"tarefas: {count}, repetições: {repeat} (mediana)")
+    for key in ("import_ms", "first_frame_ms", "app_ready_ms", "first_page_ms"):
+        values = sorted(run[key] for run in runs)
+        print(f"{key:<16} {values[len(values) // 2]:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# benchmarks/bench_sync.py
+"""Teste de carga da sincronização entre sessões pelo barramento de mudanças.
+
+Cria várias sessões do TodoApp no mesmo processo (como o Flet faz no modo web),
+todas com a primeira página carregada, e faz escritas a partir de outra sessão.
+Mede o tempo até cada sessão aplicar a mudança e o custo de CPU por mudança,
+comparado com o de recarregar a primeira página em todas as sessões.
+
+Uso:
+    python benchmarks/bench_sync.py [sessões] [escritas]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tasklist"))
+
+from controller.async_task_controller import AsyncTaskController  # noqa: E402
+from controller.task_controller import TaskController  # noqa: E402
+from model.task_model import STATUS_COMPLETED, TaskModel  # noqa: E402
+from view.todo_view import TodoApp  # noqa: E402
+
+
+def percentile(values, fraction):
+    """Percentil de uma lista ordenada."""
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def open_session(db_path, applied):
+    """Cria uma sessão do TodoApp que registra o instante de cada mudança aplicada."""
+    app = TodoApp(AsyncTaskController(TaskController(TaskModel(db_path)), readers=1))
+    # Fora de um cliente Flet, update() executa apenas before_update
+    app.update = app.before_update
+    apply_changes = app.apply_changes
+
+    async def recorded(changes):
+        await apply_changes(changes)
+        now = time.perf_counter()
+        for change in changes:
+            applied.setdefault((change.kind, change.task_id), []).append(now)
+
+    # A assinatura, feita em load_initial, usa o atributo da instância
+    app.apply_changes = recorded
+    await app.load_initial()
+    return app
+
+
+async def write(writer, step, task_ids):
+    """Faz uma escrita (inserção, renomeação, conclusão ou exclusão) e devolve sua chave."""
+    kind = step % 4
+    if kind == 0:
+        result = await writer.add_task(f"Nova tarefa {step}")
+        task_ids.append(result["task"].id)
+        return ("insert", result["task"].id)
+    task_id = task_ids.pop(0)
+    if kind == 1:
+        await writer.rename_task(task_id, f"Renomeada {step}")
+        task_ids.append(task_id)
+        return ("update", task_id)
+    if kind == 2:
+        await writer.update_statuses([(task_id, STATUS_COMPLETED)])
+        task_ids.append(task_id)
+        return ("status", task_id)
+    await writer.delete_task(task_id)
+    return ("delete", task_id)
+
+
+async def run(sessions, writes):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "sync.db")
+        model = TaskModel(db_path)
+        model.add_tasks((f"Tarefa {i}", None, None, "Pendente") for i in range(2_000))
+        # Tarefas da primeira página, visíveis em todas as sessões
+        task_ids = [task.id for task in model.get_tasks(limit=50)]
+
+        applied = {}
+        apps = [await open_session(db_path, applied) for _ in range(sessions)]
+        writer = AsyncTaskController(TaskController(TaskModel(db_path)), readers=1)
+
+        started = {}
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        for step in range(writes):
+            start = time.perf_counter()
+            key = await write(writer, step, task_ids)
+            started[key] = start
+            await asyncio.sleep(0.005)
+        # Aguarda as últimas mudanças chegarem a todas as sessões
+        deadline = time.perf_counter() + 10
+        while time.perf_counter() < deadline and any(len(applied.get(key, ())) < sessions for key in started):
+            await asyncio.sleep(0.01)
+        delta_cpu = time.process_time() - cpu
+        delta_wall = time.perf_counter() - wall
+
+        latencies = sorted(t - started[key] for key in started for t in applied.get(key, ()))
+        slowest = sorted(max(applied.get(key, [float("inf")])) - started[key] for key in started)
+        counts = await writer.count_tasks()
+        consistent = sum(
+            (app.active_count, app.completed_count) == (counts["active"], counts["completed"]) for app in apps
+        )
+
+        # Comparação: recarregar contadores e primeira página em todas as sessões
+        reloads = 20
+        cpu_reload = time.process_time()
+        for _ in range(reloads):
+            for app in apps:
+                app.task_controls.clear()
+                app.tasks.controls.clear()
+                app.pager.reset()
+                await app.load_initial()
+        reload_cost = (time.process_time() - cpu_reload) / reloads
+
+        for app in apps:
+            app.controller.close()
+        writer.close()
+        model.close()
+
+    delivered = len(latencies)
+    print(f"sessões: {sessions}, escritas: {writes} em {delta_wall:.1f}s")
+    print(f"mudanças aplicadas: {delivered} de {sessions * writes}")
+    print(f"latência (escrita -> sessão): p50 {percentile(latencies, 0.5) * 1e3:.2f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1e3:.2f} ms")
+    print(f"todas as sessões atualizadas: p50 {percentile(slowest, 0.5) * 1e3:.2f} ms, "
+          f"p99 {percentile(slowest, 0.99) * 1e3:.2f} ms")
+    print(f"CPU por mudança (todas as sessões): {delta_cpu / writes * 1e3:.2f} ms")
+    print(f"CPU por recarga completa (todas as sessões): {reload_cost * 1e3:.2f} ms")
+    print(f"contadores corretos: {consistent} de {sessions} sessões")
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    writes = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    asyncio.run(run(sessions, writes))
+
+
+if __name__ == "__main__":
+    main()
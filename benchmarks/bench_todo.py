@@ -0,0 +1,67 @@
+# benchmarks/bench_todo.py
+"""Mede a latência de marcar e limpar tarefas no TodoApp com muitas tarefas.
+
+Uso:
+    python benchmarks/bench_todo.py [tarefas]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tasklist"))
+
+from controller.async_task_controller import AsyncTaskController  # noqa: E402
+from controller.task_controller import TaskController  # noqa: E402
+from model.task_model import TaskModel  # noqa: E402
+from view.todo_view import TodoApp  # noqa: E402
+
+
+async def build_app(db_path, count):
+    """Cria um TodoApp com todas as tarefas carregadas, fora de uma página Flet."""
+    controller = TaskController(TaskModel(db_path))
+    controller.add_tasks({"description": f"Tarefa {i}"} for i in range(count))
+    app = TodoApp(AsyncTaskController(controller))
+    app.pager.page_size = 1000
+    while await app.load_more_tasks():
+        pass
+    # Sem página, update() executa apenas a lógica de before_update
+    app.update = app.before_update
+    return app
+
+
+async def run(count):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = await build_app(os.path.join(tmp, "todo.db"), count)
+        tasks = list(app.tasks.controls)
+
+        # Marca metade das tarefas, uma a uma
+        toggled = tasks[::2]
+        start = time.perf_counter()
+        for task in toggled:
+            task.display_task.value = True
+            await task.status_changed(None)
+        toggle = (time.perf_counter() - start) / len(toggled)
+
+        start = time.perf_counter()
+        await app.clear_clicked(None)
+        clear = time.perf_counter() - start
+
+        await app.status_buffer.flush()
+        app.controller.close()
+    return toggled, toggle, clear
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    toggled, toggle, clear = asyncio.run(run(count))
+
+    print(f"tarefas: {count}")
+    print(f"marcar: {toggle * 1e6:8.1f} µs por tarefa")
+    print(f"limpar {len(toggled)} concluídas: {clear * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# benchmarks/bench_updates.py
+"""Atualizações enviadas ao cliente em rajadas de operações no TodoApp.
+
+Executa rajadas típicas (marcar várias tarefas, editar várias tarefas, limpar
+as concluídas e receber mudanças de outra sessão) com o UpdateScheduler em três
+modos: sem agrupamento (uma atualização por chamada, como antes), agrupando por
+ciclo do loop de eventos e agrupando por quadro (1/60 s).
+
+A página é substituída por uma que conta as chamadas de ``update`` e estima os
+bytes enviados como o Flet faz: só as propriedades que mudaram desde o último
+envio de cada controle, mais um envelope por mensagem.
+
+Uso:
+    python benchmarks/bench_updates.py [tarefas] [tamanho da rajada]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tasklist"))
+
+from controller.async_task_controller import AsyncTaskController  # noqa: E402
+from controller.task_controller import TaskController  # noqa: E402
+from model.task_model import TaskModel  # noqa: E402
+from view.todo_view import TodoApp  # noqa: E402
+from view.update_scheduler import FRAME, UpdateScheduler  # noqa: E402
+
+# Propriedades dos controles consideradas na estimativa de bytes
+PROPERTIES = ("value", "label", "text", "visible")
+
+# Tamanho estimado, em bytes, do envelope de cada mensagem enviada ao cliente
+MESSAGE_OVERHEAD = 64
+
+MODES = {"sem agrupamento": None, "por ciclo": 0.0, "por quadro": FRAME}
+
+
+class RecordingPage:
+    """Página substituta que conta as atualizações e estima os bytes enviados."""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.updates = 0
+        self.bytes = 0
+        self._sent = {}
+
+    def update(self, *controls):
+        self.updates += 1
+        self.bytes += MESSAGE_OVERHEAD
+        for control in controls:
+            self._walk(control)
+
+    def _walk(self, control):
+        # O Flet chama before_update de cada controle do trecho atualizado
+        before_update = getattr(control, "before_update", None)
+        if before_update is not None:
+            before_update()
+        state = json.dumps(
+            [type(control).__name__] + [str(getattr(control, name, None)) for name in PROPERTIES],
+            ensure_ascii=False,
+        )
+        if self._sent.get(id(control)) != state:
+            self._sent[id(control)] = state
+            self.bytes += len(state.encode())
+        for child in getattr(control, "controls", None) or ():
+            self._walk(child)
+
+
+async def settle(delay):
+    """Aguarda o envio das atualizações agendadas."""
+    await asyncio.sleep((delay or 0) + 0.01)
+
+
+async def run_mode(db_path, count, burst, delay):
+    """Executa as rajadas em um modo e devolve as métricas de cada uma."""
+    controller = TaskController(TaskModel(db_path))
+    app = TodoApp(AsyncTaskController(controller, readers=1))
+    page = RecordingPage(asyncio.get_running_loop())
+    app.updates = UpdateScheduler(page, delay=delay)
+    app.pager.page_size = count
+    await app.load_initial()
+    await settle(delay)
+    tasks = list(app.tasks.controls)
+    remote = AsyncTaskController(TaskController(TaskModel(db_path)), readers=1)
+
+    async def toggle():
+        for task in tasks[:burst]:
+            task.display_task.value = not task.completed
+            await task.status_changed(None)
+        await app.status_buffer.flush()
+
+    async def edit():
+        for task in tasks[burst:burst * 2]:
+            task.edit_clicked(None)
+
+    async def clear():
+        await app.clear_clicked(None)
+
+    async def deltas():
+        for i in range(burst):
+            await remote.add_task(f"Remota {i}")
+
+    results = {}
+    for name, action in (("marcar", toggle), ("editar", edit), ("limpar", clear), ("mudanças remotas", deltas)):
+        updates, sent, requests = page.updates, page.bytes, app.updates.requests
+        start = time.perf_counter()
+        await action()
+        await settle(delay)
+        results[name] = {
+            "requests": app.updates.requests - requests,
+            "updates": page.updates - updates,
+            "bytes": page.bytes - sent,
+            "ms": (time.perf_counter() - start) * 1e3,
+        }
+
+    await app.status_buffer.flush()
+    remote.close()
+    app.controller.close()
+    return results
+
+
+async def run(count, burst):
+    report = {}
+    for mode, delay in MODES.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "updates.db")
+            TaskModel(db_path).add_tasks((f"Tarefa {i}", None, None, "Pendente") for i in range(count))
+            report[mode] = await run_mode(db_path, count, burst, delay)
+    return report
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    burst = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    report = asyncio.run(run(count, burst))
+
+    print(f"tarefas: {count}, rajadas de {burst} operações")
+    for mode, results in report.items():
+        print(f"[{mode}]")
+        for name, result in results.items():
+            per_flush = result["bytes"] / result["updates"] if result["updates"] else 0
+            print(f"  {name:<17} pedidos {result['requests']:>4} | envios {result['updates']:>4} | "
+                  f"{result['bytes']:>7} bytes ({per_flush:,.0f} por envio) | {result['ms']:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# benchmarks/bench_write_queue.py
+"""Teste de estresse com vários processos gravando no mesmo banco.
+
+Cada processo abre suas próprias conexões e dispara escritas a partir de várias
+threads, primeiro com uma transação por escrita e depois pela WriteQueue (group
+commit). Ao final, confere se todas as tarefas confirmadas estão no banco.
+
+Uma última rodada passa pelo TaskController: cada thread usa seu próprio
+controlador (e cache) sobre a mesma fila, renomeia sua tarefa e lê a da thread
+vizinha. Depois que todos os processos terminam, confere se algum cache ainda
+guarda uma tarefa diferente da gravada no banco.
+
+Uso:
+    python benchmarks/bench_write_queue.py [processos] [threads] [escritas por thread]
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tasklist"))
+
+from controller.task_controller import TaskController  # noqa: E402
+from db.write_queue import WriteQueue  # noqa: E402
+from model.task_model import TaskModel  # noqa: E402
+
+
+def worker(db_path, mode, threads, writes, results, barrier):
+    """Processo de escrita: grava ``threads * writes`` tarefas e devolve as métricas."""
+    model = TaskModel(db_path)
+    write_queue = WriteQueue(model.connections) if mode != "direct" else None
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    controllers, own = [], []
+    if mode == "controller":
+        # Um controlador por thread, todos na mesma fila, e uma tarefa de cada um
+        controllers = [TaskController(model, write_queue=write_queue) for _ in range(threads)]
+        own = [controller.add_task(f"{mode} {os.getpid()} {thread}")["task"].id
+               for thread, controller in enumerate(controllers)]
+
+    def run(thread):
+        local, failed = [], []
+        for i in range(writes):
+            description = f"{mode} {os.getpid()} {thread} {i}"
+            start = time.perf_counter()
+            try:
+                if controllers:
+                    controller = controllers[thread]
+                    controller.add_task(description)
+                    controller.rename_task(own[thread], description)
+                    controller.get_task(own[(thread + 1) % threads])
+                elif write_queue is None:
+                    model.add_task(description, None, None)
+                else:
+                    write_queue.submit(model.add_task, description, None, None).result()
+            except Exception as exc:
+                failed.append(str(exc))
+                continue
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+            errors.extend(failed)
+
+    pool = [threading.Thread(target=run, args=(thread,)) for thread in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+    stale = 0
+    if controllers:
+        # Sem escritas de outros processos, que limpariam os caches e esconderiam o erro
+        barrier.wait()
+        stale = sum(
+            controller.get_task(task_id) != model.get_task(task_id)
+            for controller in controllers
+            for task_id in own
+        )
+
+    stats = {}
+    if write_queue is not None:
+        write_queue.close()
+        stats = write_queue.stats()
+    model.close()
+    results.put({"latencies": latencies, "errors": errors, "queue": stats, "created": len(own), "stale": stale})
+
+
+def run_mode(db_path, mode, processes, threads, writes):
+    """Executa uma rodada do teste e imprime as métricas agregadas.
+
+    Returns:
+        tuple: Quantidade de tarefas confirmadas e de leituras desatualizadas no cache.
+    """
+    results = multiprocessing.Queue()
+    barrier = multiprocessing.Barrier(processes)
+    pool = [
+        multiprocessing.Process(target=worker, args=(db_path, mode, threads, writes, results, barrier))
+        for _ in range(processes)
+    ]
+    start = time.perf_counter()
+    for process in pool:
+        process.start()
+    reports = [results.get() for _ in pool]
+    for process in pool:
+        process.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for report in reports for latency in report["latencies"])
+    errors = [error for report in reports for error in report["errors"]]
+    groups = sum(report["queue"].get("groups", 0) for report in reports)
+    retries = sum(report["queue"].get("retries", 0) for report in reports)
+    created = sum(report["created"] for report in reports)
+    stale = sum(report["stale"] for report in reports)
+
+    print(f"[{mode}]")
+    print(f"  escritas confirmadas: {len(latencies)} em {elapsed:.1f}s ({len(latencies) / elapsed:.0f}/s)")
+    if latencies:
+        p50 = latencies[len(latencies) // 2] * 1e3
+        p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+        print(f"  latência: p50 {p50:.2f} ms, p99 {p99:.2f} ms, máx {latencies[-1] * 1e3:.2f} ms")
+    if groups:
+        print(f"  transações: {groups} ({len(latencies) / groups:.1f} escritas cada), novas tentativas: {retries}")
+    if mode == "controller":
+        print(f"  tarefas desatualizadas nos caches: {stale}")
+    print(f"  erros: {len(errors)}" + (f" (ex.: {errors[0]})" if errors else ""))
+    return len(latencies) + created, stale
+
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    writes = int(sys.argv[3]) if len(sys.argv) > 3 else 250
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "stress.db")
+        TaskModel(db_path).close()
+        print(f"{processes} processos x {threads} threads x {writes} escritas")
+        confirmed = stale = 0
+        for mode in ("direct", "queue", "controller"):
+            mode_confirmed, mode_stale = run_mode(db_path, mode, processes, threads, writes)
+            confirmed += mode_confirmed
+            stale += mode_stale
+
+        model = TaskModel(db_path)
+        stored = model.count_tasks()
+        model.close()
+    ok = stored == confirmed and not stale
+    print(f"tarefas no banco: {stored}, confirmadas: {confirmed} -> {'OK' if ok else 'DIVERGENTE'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
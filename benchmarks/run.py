@@ -0,0 +1,332 @@
+# benchmarks/run.py
+"""Suíte de benchmarks dos caminhos críticos do modelo, do controlador e das views.
+
+Cria bancos com 1 mil, 100 mil e 1 milhão de tarefas e mede:
+
+- vazão das operações de CRUD do ``TaskModel``;
+- latência do ``get_tasks`` (primeira página, filtros, ordenação e página profunda);
+- custo da validação do ``TaskController`` em relação à gravação direta no modelo;
+- tempo de montagem do ``TodoApp`` (``before_update``) e do ``TaskApp`` (``load_tasks``).
+
+Os resultados são gravados em JSON, para comparar execuções entre commits.
+
+Uso:
+    task bench
+    python benchmarks/run.py [--sizes 1000,100000] [--data-dir DIR] [--output ARQUIVO]
+    python benchmarks/run.py --compare antes.json depois.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tasklist"))
+
+from controller.async_task_controller import AsyncTaskController  # noqa: E402
+from controller.task_controller import TaskController  # noqa: E402
+from model.task_model import (  # noqa: E402
+    STATUS_COMPLETED,
+    STATUS_IN_PROGRESS,
+    STATUS_OVERDUE,
+    STATUS_PENDING,
+    TaskModel,
+)
+
+SIZES = (1_000, 100_000, 1_000_000)
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# Vocabulário das descrições geradas: repete palavras como uma lista real
+WORDS = (
+    "revisar", "relatório", "enviar", "orçamento", "reunião", "cliente", "corrigir",
+    "erro", "planejar", "sprint", "atualizar", "documentação", "pagar", "conta",
+    "comprar", "material", "ligar", "fornecedor", "preparar", "apresentação",
+)
+STATUSES = (STATUS_PENDING, STATUS_IN_PROGRESS, STATUS_OVERDUE, STATUS_COMPLETED)
+
+
+def generate(count, offset=0):
+    """Gera tarefas determinísticas no formato aceito por ``TaskModel.add_tasks``."""
+    base = date(2024, 1, 1)
+    for i in range(offset, offset + count):
+        start = base + timedelta(days=i % 365)
+        description = f"{WORDS[i % 20]} {WORDS[(i * 7) % 20]} {WORDS[(i * 13) % 20]} {i}"
+        yield description, start.isoformat(), (start + timedelta(days=7 + i % 30)).isoformat(), STATUSES[i % 4]
+
+
+def seed(db_path, count, batch_size=50_000):
+    """Cria (ou reaproveita) um banco com ``count`` tarefas.
+
+    Returns:
+        float: Segundos gastos para popular o banco (0 quando reaproveitado).
+    """
+    if os.path.exists(db_path):
+        model = TaskModel(db_path)
+        existing = model.count_tasks()
+        model.close()
+        if existing == count:
+            return 0.0
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+    model = TaskModel(db_path)
+    try:
+        start = time.perf_counter()
+        for offset in range(0, count, batch_size):
+            model.add_tasks(generate(min(batch_size, count - offset), offset))
+        return time.perf_counter() - start
+    finally:
+        model.close()
+
+
+def summarize(samples):
+    """Resume uma lista de durações, em segundos, em milissegundos."""
+    ordered = sorted(samples)
+    return {
+        "runs": len(ordered),
+        "median_ms": statistics.median(ordered) * 1e3,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1e3,
+        "min_ms": ordered[0] * 1e3,
+    }
+
+
+def latency(func, runs=50):
+    """Mede a latência de ``func`` em várias execuções."""
+    func()  # Aquecimento: cache de páginas e de comandos preparados
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def throughput(func, items):
+    """Mede quantas operações por segundo ``func`` executa sobre ``items``."""
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    elapsed = time.perf_counter() - start
+    return {"ops": len(items), "ops_per_s": len(items) / elapsed if elapsed else None}
+
+
+def bench_crud(model, ops=2_000):
+    """Vazão de inserção, leitura, atualização e exclusão de uma tarefa por vez."""
+    rows = list(generate(ops, offset=10_000_000))
+    created = []
+    results = {"add_task": throughput(lambda row: created.append(model.add_task(*row)), rows)}
+    results["get_task"] = throughput(model.get_task, [task.id for task in created])
+    results["update_task"] = throughput(
+        lambda task: model.update_task(task.id, task.description + " *", task.start_date, task.end_date),
+        created,
+    )
+    results["delete_task"] = throughput(model.delete_task, [task.id for task in created])
+
+    # As mesmas operações em lote, para comparação; o banco volta ao tamanho original
+    start = time.perf_counter()
+    task_ids = model.add_tasks(rows)
+    results["add_tasks"] = {"ops": len(task_ids), "ops_per_s": len(task_ids) / (time.perf_counter() - start)}
+    start = time.perf_counter()
+    deleted = model.delete_tasks(task_ids)
+    results["delete_tasks"] = {"ops": len(deleted), "ops_per_s": len(deleted) / (time.perf_counter() - start)}
+    return results
+
+
+def bench_get_tasks(model, count):
+    """Latência das consultas paginadas de ``get_tasks``."""
+    middle = model.get_tasks(limit=1, cursor=(count // 2, count // 2))
+    deep = TaskModel.cursor_for(middle[0], "end_date") if middle else None
+    return {
+        "first_page": latency(lambda: model.get_tasks(limit=50)),
+        "status_filter": latency(lambda: model.get_tasks(status=STATUS_IN_PROGRESS, limit=50)),
+        "order_by_end_date": latency(lambda: model.get_tasks(order_by="-end_date", limit=50)),
+        "deep_page": latency(lambda: model.get_tasks(order_by="end_date", limit=50, cursor=deep)),
+        "date_range": latency(lambda: model.get_tasks_due_between("2024-03-01", "2024-03-07", limit=50)),
+        "text_search": latency(lambda: model.search_tasks("relat", limit=50)),
+        "count_tasks": latency(lambda: model.count_tasks(), runs=10),
+        "get_stats": latency(lambda: model.get_stats(), runs=10),
+    }
+
+
+def bench_validation(controller, ops=2_000):
+    """Custo da validação do controlador em relação à gravação direta no modelo."""
+    rows = list(generate(ops, offset=20_000_000))
+    calls = 20_000
+    start = time.perf_counter()
+    for i in range(calls):
+        controller.prepare_task(*rows[i % ops][:3])
+    prepare = (time.perf_counter() - start) / calls
+
+    model_ids, controller_ids = [], []
+    start = time.perf_counter()
+    for row in rows:
+        model_ids.append(controller.model.add_task(*row).id)
+    direct = (time.perf_counter() - start) / ops
+    start = time.perf_counter()
+    for row in rows:
+        controller_ids.append(controller.add_task(*row[:3])["task"].id)
+    validated = (time.perf_counter() - start) / ops
+    controller.delete_tasks(model_ids + controller_ids)
+    return {
+        "prepare_task_us": prepare * 1e6,
+        "model_add_task_us": direct * 1e6,
+        "controller_add_task_us": validated * 1e6,
+        "overhead_us": (validated - direct) * 1e6,
+    }
+
+
+async def bench_views(controller, runs=20):
+    """Tempo de montagem das views com controles Flet reais."""
+    import flet as ft  # Importado só aqui: o restante da suíte não depende do Flet
+    from view.task_view import ROW_HEIGHT, TaskApp
+    from view.todo_view import TodoApp
+
+    async_controller = AsyncTaskController(controller)
+    results = {}
+
+    # TodoApp: contadores, primeira página e before_update, com o pager vazio
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        app = TodoApp(async_controller)
+        counts = await async_controller.count_tasks()
+        app.active_count, app.completed_count = counts["active"], counts["completed"]
+        await app.load_more_tasks()
+        app.before_update()
+        samples.append(time.perf_counter() - start)
+    results["todo_app_build"] = summarize(samples)
+    results["todo_app_before_update"] = latency(app.before_update, runs=1_000)
+
+    # TaskApp: primeira carga (linhas novas) e recargas (linhas em cache)
+    def new_task_app():
+        app = TaskApp(async_controller)
+        app.tasks_list = ft.ListView(item_extent=ROW_HEIGHT)
+        return app
+
+    samples = []
+    for _ in range(runs):
+        app = new_task_app()
+        start = time.perf_counter()
+        await app.load_tasks()
+        samples.append(time.perf_counter() - start)
+    results["task_app_load_tasks_cold"] = summarize(samples)
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await app.load_tasks()
+        samples.append(time.perf_counter() - start)
+    results["task_app_load_tasks_warm"] = summarize(samples)
+
+    # Fecha apenas os executores: as conexões pertencem ao controlador síncrono
+    async_controller._writer.shutdown(wait=True)
+    async_controller._readers.shutdown(wait=True)
+    return results
+
+
+def run_size(data_dir, count):
+    """Executa todos os benchmarks em um banco com ``count`` tarefas."""
+    db_path = os.path.join(data_dir, f"bench_{count}.db")
+    print(f"[{count}] populando banco...", flush=True)
+    result = {"seed_s": seed(db_path, count)}
+
+    controller = TaskController(TaskModel(db_path))
+    try:
+        print(f"[{count}] CRUD do modelo...", flush=True)
+        result["model_crud"] = bench_crud(controller.model)
+        print(f"[{count}] get_tasks...", flush=True)
+        result["get_tasks"] = bench_get_tasks(controller.model, count)
+        print(f"[{count}] validação do controlador...", flush=True)
+        result["controller_validation"] = bench_validation(controller)
+        print(f"[{count}] views...", flush=True)
+        try:
+            result["views"] = asyncio.run(bench_views(controller))
+        except ImportError as exc:
+            result["views"] = {"skipped": f"Flet indisponível: {exc}"}
+    finally:
+        controller.close()
+    return result
+
+
+def environment():
+    """Identifica o commit e o ambiente da execução."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+    }
+
+
+def flatten(data, prefix=""):
+    """Achata o JSON de resultados em pares ``caminho -> número``."""
+    items = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            items.update(flatten(value, path + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            items[path] = value
+    return items
+
+
+def compare(before_path, after_path):
+    """Mostra a variação de cada métrica entre duas execuções."""
+    with open(before_path, encoding="utf-8") as file:
+        before = json.load(file)
+    with open(after_path, encoding="utf-8") as file:
+        after = json.load(file)
+    print(f"{before['environment']['commit']} -> {after['environment']['commit']}")
+    old, new = flatten(before["results"]), flatten(after["results"])
+    for path in sorted(old.keys() & new.keys()):
+        if old[path] and new[path] is not None:
+            change = (new[path] - old[path]) / old[path] * 100
+            print(f"{path:<60} {old[path]:14.3f} {new[path]:14.3f} {change:+8.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)),
+                        help="tamanhos dos bancos, separados por vírgula")
+    parser.add_argument("--data-dir", help="diretório para guardar e reaproveitar os bancos")
+    parser.add_argument("--output", help="arquivo JSON de saída (padrão: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("ANTES", "DEPOIS"), help="compara dois resultados")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    report = {"environment": environment(), "results": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or tmp
+        os.makedirs(data_dir, exist_ok=True)
+        for count in sizes:
+            report["results"][str(count)] = run_size(data_dir, count)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['environment']['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+    print(f"resultados gravados em {output}")
+
+
+if __name__ == "__main__":
+    main()
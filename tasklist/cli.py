@@ -0,0 +1,324 @@
+# cli.py
+"""Linha de comando para importar, exportar e arquivar tarefas.
+
+Os arquivos são processados em fluxo: a exportação lê as tarefas do cursor do
+SQLite em lotes e a importação valida e grava um bloco de tarefas por vez, de
+modo que a memória usada não depende do tamanho do arquivo.
+
+Uso:
+    tasklist export [--db taskslist.db] [--format csv|jsonl] [--status STATUS] [ARQUIVO]
+    tasklist import [--db taskslist.db] [--format csv|jsonl] [--chunk-size N] ARQUIVO
+    tasklist archive [--db taskslist.db] [--days N] [--batch-size N] [--vacuum]
+
+Use "-" (o padrão na exportação) para a saída ou a entrada padrão.
+"""
+
+import argparse
+import contextlib
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+
+# Os módulos do aplicativo são importados a partir deste diretório
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from controller.task_controller import TaskController  # noqa: E402
+from model.task_model import TaskModel  # noqa: E402
+
+# Campos gravados na exportação, na ordem das colunas
+FIELDS = ("id", "description", "start_date", "end_date", "status")
+
+# Quantidade máxima de erros de importação listados individualmente
+MAX_REPORTED_ERRORS = 20
+
+
+def detect_format(path, given=None):
+    """Define o formato do arquivo pela opção informada ou pela extensão.
+
+    Args:
+        path (str): Caminho do arquivo ("-" para a entrada/saída padrão).
+        given (str, opcional): Formato informado na linha de comando.
+
+    Returns:
+        str: "csv" ou "jsonl".
+    """
+    if given:
+        return given
+    return "jsonl" if path.endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+
+def open_text(path, mode):
+    """Abre um arquivo de texto, ou a entrada/saída padrão quando ``path`` é "-"."""
+    if path == "-":
+        stream = sys.stdin if "r" in mode else sys.stdout
+        return contextlib.nullcontext(stream)
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def open_controller(db_path):
+    """Abre o banco de dados, mantendo a saída padrão livre para os dados.
+
+    Args:
+        db_path (str): Caminho do banco de dados.
+
+    Returns:
+        TaskController: Controlador do banco informado.
+    """
+    # Mensagens de criação/migração do banco não podem se misturar à exportação
+    with contextlib.redirect_stdout(sys.stderr):
+        return TaskController(TaskModel(db_path))
+
+
+def read_csv(file):
+    """Lê tarefas de um arquivo CSV com cabeçalho.
+
+    Yields:
+        dict: Campos de cada tarefa; colunas vazias viram None.
+    """
+    for row in csv.DictReader(file):
+        yield {key: value or None for key, value in row.items()}
+
+
+def read_jsonl(file):
+    """Lê tarefas de um arquivo JSON Lines (um objeto por linha).
+
+    Yields:
+        dict: Campos de cada tarefa.
+
+    Raises:
+        ValueError: Se uma linha não contiver um objeto JSON válido.
+    """
+    for number, line in enumerate(file, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            task = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Linha {number}: JSON inválido ({exc.msg}).") from None
+        if not isinstance(task, dict):
+            raise ValueError(f"Linha {number}: esperado um objeto JSON.")
+        yield task
+
+
+def write_csv(file, tasks):
+    """Grava tarefas em CSV, com cabeçalho.
+
+    Returns:
+        int: Quantidade de tarefas gravadas.
+    """
+    writer = csv.writer(file)
+    writer.writerow(FIELDS)
+    count = 0
+    for task in tasks:
+        writer.writerow(task)
+        count += 1
+    return count
+
+
+def write_jsonl(file, tasks):
+    """Grava tarefas em JSON Lines.
+
+    Returns:
+        int: Quantidade de tarefas gravadas.
+    """
+    count = 0
+    for task in tasks:
+        file.write(json.dumps(task._asdict(), ensure_ascii=False))
+        file.write("\n")
+        count += 1
+    return count
+
+
+def chunks(iterable, size):
+    """Divide um iterável em listas de até ``size`` itens, sem lê-lo por inteiro.
+
+    Yields:
+        list: Próximo bloco de itens.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def report(action, count, elapsed):
+    """Mostra a quantidade de tarefas processadas e a vazão na saída de erro."""
+    rate = count / elapsed if elapsed else 0
+    print(f"{count} tarefas {action} em {elapsed:.1f}s ({rate:.0f} tarefas/s).", file=sys.stderr)
+
+
+def export_tasks(args):
+    """Executa o comando ``export``.
+
+    Returns:
+        int: Código de saída do processo.
+    """
+    if not os.path.exists(args.db):
+        print(f"Banco de dados não encontrado: {args.db}", file=sys.stderr)
+        return 1
+    controller = open_controller(args.db)
+    write = write_jsonl if detect_format(args.output, args.format) == "jsonl" else write_csv
+    filters = {"status": args.status} if args.status else {}
+    start = time.perf_counter()
+    try:
+        with open_text(args.output, "w") as file:
+            count = write(file, controller.iter_tasks(**filters))
+    finally:
+        controller.close()
+    report("exportadas", count, time.perf_counter() - start)
+    return 0
+
+
+def import_tasks(args):
+    """Executa o comando ``import``.
+
+    Cada bloco de ``--chunk-size`` tarefas é validado pelo controlador e gravado
+    em uma transação própria. Tarefas inválidas são ignoradas e listadas.
+
+    Returns:
+        int: Código de saída do processo (1 se alguma tarefa foi rejeitada).
+    """
+    controller = open_controller(args.db)
+    read = read_jsonl if detect_format(args.input, args.format) == "jsonl" else read_csv
+    imported = rejected = 0
+    start = time.perf_counter()
+    try:
+        with open_text(args.input, "r") as file:
+            for chunk in chunks(read(file), args.chunk_size):
+                for result in controller.add_tasks(chunk):
+                    if result["success"]:
+                        imported += 1
+                        continue
+                    rejected += 1
+                    if rejected <= MAX_REPORTED_ERRORS:
+                        print(f"Tarefa {imported + rejected}: {result['message']}", file=sys.stderr)
+    except ValueError as exc:
+        # Os blocos anteriores ao erro já foram gravados
+        print(exc, file=sys.stderr)
+        report("importadas", imported, time.perf_counter() - start)
+        return 2
+    finally:
+        controller.close()
+    report("importadas", imported, time.perf_counter() - start)
+    if rejected:
+        print(f"{rejected} tarefas rejeitadas.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def format_bytes(size):
+    """Formata um tamanho em bytes (None quando desconhecido)."""
+    if size is None:
+        return "?"
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def print_storage(label, stats):
+    """Mostra na saída de erro o tamanho das tabelas e do arquivo do banco."""
+    print(
+        f"{label}: principal {stats['hot_rows']} tarefas ({format_bytes(stats['hot_bytes'])}), "
+        f"arquivo {stats['archived_rows']} tarefas ({format_bytes(stats['archive_bytes'])}), "
+        f"banco {format_bytes(stats['file_bytes'])} ({format_bytes(stats['free_bytes'])} livres)",
+        file=sys.stderr,
+    )
+
+
+def archive_tasks(args):
+    """Executa o comando ``archive``.
+
+    Move para o arquivo as tarefas concluídas há mais de ``--days`` dias e
+    devolve ao sistema o espaço liberado. Com ``--vacuum``, reconstrói o banco
+    por inteiro, o que ativa o vacuum incremental em bancos antigos.
+
+    Returns:
+        int: Código de saída do processo.
+    """
+    if not os.path.exists(args.db):
+        print(f"Banco de dados não encontrado: {args.db}", file=sys.stderr)
+        return 1
+    controller = open_controller(args.db)
+    model = controller.model
+    try:
+        print_storage("Antes", model.storage_stats())
+        start = time.perf_counter()
+        result = controller.archive_completed(args.days, args.batch_size)
+        if not result["success"]:
+            print(result["message"], file=sys.stderr)
+            return 2
+        if args.vacuum:
+            model.vacuum()
+        else:
+            model.incremental_vacuum()
+        report("arquivadas", result["count"], time.perf_counter() - start)
+        print_storage("Depois", model.storage_stats())
+    finally:
+        controller.close()
+    return 0
+
+
+def positive_int(text):
+    """Converte um argumento em inteiro maior que zero.
+
+    Raises:
+        argparse.ArgumentTypeError: Se o valor não for um inteiro positivo.
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"inteiro inválido: {text!r}") from None
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"deve ser maior que zero: {value}")
+    return value
+
+
+def build_parser():
+    """Monta o analisador dos argumentos da linha de comando."""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--db", default="taskslist.db", help="caminho do banco de dados")
+
+    parser = argparse.ArgumentParser(prog="tasklist", description="Importa, exporta e arquiva tarefas.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", parents=[common], help="exporta as tarefas para CSV ou JSON Lines")
+    export.add_argument("output", nargs="?", default="-", help='arquivo de saída ("-" para a saída padrão)')
+    export.add_argument("--format", choices=("csv", "jsonl"), help="formato (padrão: pela extensão)")
+    export.add_argument("--status", help="exporta apenas as tarefas com este status")
+    export.set_defaults(handler=export_tasks)
+
+    import_ = commands.add_parser("import", parents=[common], help="importa tarefas de CSV ou JSON Lines")
+    import_.add_argument("input", help='arquivo de entrada ("-" para a entrada padrão)')
+    import_.add_argument("--format", choices=("csv", "jsonl"), help="formato (padrão: pela extensão)")
+    import_.add_argument("--chunk-size", type=positive_int, default=10_000, help="tarefas gravadas por transação")
+    import_.set_defaults(handler=import_tasks)
+
+    archive = commands.add_parser("archive", parents=[common], help="arquiva as tarefas concluídas antigas")
+    archive.add_argument("--days", type=int, default=30, help="idade mínima da conclusão, em dias")
+    archive.add_argument("--batch-size", type=positive_int, default=1000, help="tarefas movidas por transação")
+    archive.add_argument("--vacuum", action="store_true", help="reconstrói o banco por inteiro (VACUUM)")
+    archive.set_defaults(handler=archive_tasks)
+    return parser
+
+
+def main(argv=None):
+    """Ponto de entrada do comando ``tasklist``."""
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # A saída foi fechada antes do fim (por exemplo, "| head")
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# controller/archiver.py
+
+import sys
+import threading
+import time
+
+from controller.task_controller import TaskController
+from model.task_model import TaskModel
+
+
+class Archiver:
+    """Arquiva periodicamente as tarefas concluídas antigas e compacta o banco.
+
+    A cada ``interval`` segundos, uma thread em segundo plano move para o arquivo
+    as tarefas concluídas há mais de ``max_age_days`` dias, em lotes de
+    ``batch_size``, e devolve ao sistema as páginas liberadas (vacuum incremental).
+    O tamanho das tabelas antes e depois de cada execução fica em ``last_run``.
+
+    Usa um controlador próprio: as sessões abertas recebem as tarefas arquivadas
+    como excluídas pelo barramento de mudanças.
+
+    Args:
+        controller (TaskController): Controlador usado para arquivar.
+        max_age_days (int): Idade mínima da conclusão, em dias.
+        interval (float): Intervalo, em segundos, entre as execuções.
+        batch_size (int): Quantidade de tarefas movidas por transação.
+        initial_delay (float): Espera, em segundos, antes da primeira execução.
+    """
+
+    def __init__(self, controller, max_age_days=30, interval=3600, batch_size=1000, initial_delay=60):
+        self.controller = controller
+        self.max_age_days = max_age_days
+        self.interval = interval
+        self.batch_size = batch_size
+        self.initial_delay = initial_delay
+        self.last_run = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def run_once(self):
+        """Arquiva as tarefas antigas e compacta o banco uma vez.
+
+        Returns:
+            dict: Tarefas arquivadas, páginas liberadas, duração em segundos e
+                tamanho das tabelas antes (``before``) e depois (``after``).
+        """
+        model = self.controller.model
+        start = time.perf_counter()
+        before = model.storage_stats()
+        result = self.controller.archive_completed(self.max_age_days, self.batch_size)
+        pages = model.incremental_vacuum() if result.get("count") else 0
+        self.last_run = {
+            "archived": result.get("count", 0),
+            "pages_freed": pages,
+            "elapsed": time.perf_counter() - start,
+            "before": before,
+            "after": model.storage_stats(),
+        }
+        return self.last_run
+
+    def start(self):
+        """Inicia a thread de arquivamento, se ainda não estiver em execução."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="tasklist-archiver", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Interrompe a thread de arquivamento, aguardando a execução em andamento."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        """Laço da thread: executa ``run_once`` a cada intervalo até ser interrompido."""
+        delay = self.initial_delay
+        while not self._stop.wait(delay):
+            delay = self.interval
+            try:
+                stats = self.run_once()
+            except Exception as exc:
+                # Uma falha (por exemplo, banco bloqueado) é tentada de novo no próximo intervalo
+                print(f"Falha ao arquivar as tarefas concluídas: {exc}", file=sys.stderr)
+                continue
+            if stats["archived"]:
+                print(
+                    f"{stats['archived']} tarefa(s) arquivada(s) em {stats['elapsed']:.2f}s; "
+                    f"tabela principal: {stats['before']['hot_bytes']} -> {stats['after']['hot_bytes']} bytes."
+                )
+
+
+_archivers = {}
+_archivers_lock = threading.Lock()
+
+
+def start_archiver(db_path="taskslist.db", **options):
+    """Inicia o arquivamento em segundo plano de um banco, uma vez por processo.
+
+    Args:
+        db_path (str, opcional): Caminho do banco de dados.
+        **options: Parâmetros do Archiver (max_age_days, interval, batch_size, initial_delay).
+
+    Returns:
+        Archiver: Arquivador em execução do banco.
+    """
+    with _archivers_lock:
+        archiver = _archivers.get(db_path)
+        if archiver is None:
+            archiver = _archivers[db_path] = Archiver(TaskController(TaskModel(db_path)), **options)
+            archiver.start()
+        return archiver
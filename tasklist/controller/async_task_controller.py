@@ -0,0 +1,179 @@
+# controller/async_task_controller.py
+
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from controller.task_controller import TaskController
+
+
+class AsyncTaskController:
+    """Versão assíncrona do TaskController, para uso nos eventos da interface.
+
+    As operações do banco rodam fora do loop de eventos: as escritas em um
+    executor de uma única thread (em ordem, uma de cada vez) e as leituras em um
+    executor próprio, podendo rodar em paralelo com as escritas e entre si.
+
+    Args:
+        controller (TaskController, opcional): Controlador síncrono a ser usado.
+        readers (int): Quantidade de threads de leitura.
+    """
+
+    def __init__(self, controller=None, readers=4):
+        self.controller = controller or TaskController()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tasklist-write")
+        self._readers = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="tasklist-read")
+        # Tarefas que entregam as mudanças de outras sessões (ver ``subscribe``)
+        self._consumers = set()
+
+    async def _read(self, method, *args, **kwargs):
+        """Executa uma leitura do controlador no executor de leitura."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, partial(method, *args, **kwargs))
+
+    async def _write(self, method, *args, **kwargs):
+        """Executa uma escrita do controlador no executor de escrita."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._writer, partial(method, *args, **kwargs))
+
+    def calculate_status(self, start_date, end_date):
+        """Define o status da tarefa com base nas datas (não acessa o banco)."""
+        return self.controller.calculate_status(start_date, end_date)
+
+    async def get_all_tasks(self):
+        """Recupera todas as tarefas do banco de dados."""
+        return await self._read(self.controller.get_all_tasks)
+
+    async def get_task(self, task_id):
+        """Recupera uma tarefa pelo ID."""
+        return await self._read(self.controller.get_task, task_id)
+
+    async def get_tasks(self, **filters):
+        """Recupera uma página de tarefas com filtros e ordenação."""
+        return await self._read(self.controller.get_tasks, **filters)
+
+    async def search_tasks(self, query, limit=50, include_archived=False):
+        """Busca tarefas pela descrição usando o índice de texto completo."""
+        return await self._read(self.controller.search_tasks, query, limit, include_archived)
+
+    async def count_tasks(self):
+        """Conta as tarefas ativas e concluídas."""
+        return await self._read(self.controller.count_tasks)
+
+    async def get_stats(self, days=7):
+        """Retorna os contadores e estatísticas das tarefas (tabelas de resumo)."""
+        return await self._read(self.controller.get_stats, days)
+
+    async def add_task(self, description, start_date=None, end_date=None):
+        """Adiciona uma nova tarefa ao banco de dados, validando os dados."""
+        return await self._write(self.controller.add_task, description, start_date, end_date)
+
+    async def add_tasks(self, tasks):
+        """Adiciona várias tarefas em uma única transação."""
+        return await self._write(self.controller.add_tasks, tasks)
+
+    async def update_task(self, task_id, description, start_date=None, end_date=None):
+        """Atualiza uma tarefa no banco de dados após validação."""
+        return await self._write(self.controller.update_task, task_id, description, start_date, end_date)
+
+    async def update_tasks(self, tasks):
+        """Atualiza várias tarefas em uma única transação."""
+        return await self._write(self.controller.update_tasks, tasks)
+
+    async def rename_task(self, task_id, description):
+        """Altera a descrição de uma tarefa."""
+        return await self._write(self.controller.rename_task, task_id, description)
+
+    async def update_statuses(self, changes):
+        """Altera o status de várias tarefas em uma única transação."""
+        return await self._write(self.controller.update_statuses, list(changes))
+
+    async def delete_task(self, task_id):
+        """Exclui uma tarefa do banco de dados."""
+        return await self._write(self.controller.delete_task, task_id)
+
+    async def delete_tasks(self, task_ids):
+        """Exclui várias tarefas em uma única transação."""
+        return await self._write(self.controller.delete_tasks, list(task_ids))
+
+    async def clear_completed(self):
+        """Exclui todas as tarefas concluídas."""
+        return await self._write(self.controller.clear_completed)
+
+    async def apply_due_statuses(self, today=None):
+        """Atualiza o status das tarefas cujas datas de início ou prazo já chegaram."""
+        return await self._write(self.controller.apply_due_statuses, today)
+
+    async def archive_completed(self, max_age_days=30, batch_size=1000):
+        """Move para o arquivo as tarefas concluídas há mais de ``max_age_days`` dias."""
+        return await self._write(self.controller.archive_completed, max_age_days, batch_size)
+
+    def subscribe(self, handler):
+        """Recebe, no loop de eventos atual, as mudanças feitas por outras sessões.
+
+        As mudanças são entregues por uma única tarefa consumidora, então as
+        chamadas de ``handler`` nunca se sobrepõem; o que chegar enquanto uma
+        chamada está em andamento é agrupado na chamada seguinte. As mudanças
+        feitas por este controlador são ignoradas, pois a própria sessão já as
+        aplicou. Deve ser chamado a partir do loop de eventos.
+
+        Args:
+            handler (callable): Função assíncrona ``handler(changes)``.
+
+        Returns:
+            callable: Função que cancela a assinatura e encerra a entrega.
+        """
+        loop = asyncio.get_running_loop()
+        session_id = self.controller.session_id
+        queue = asyncio.Queue()
+
+        async def consume():
+            while True:
+                changes = await queue.get()
+                while not queue.empty():
+                    changes.extend(queue.get_nowait())
+                try:
+                    await handler(changes)
+                except Exception as exc:
+                    # Uma falha não encerra a assinatura: as próximas mudanças ainda são entregues
+                    print(f"Falha ao aplicar as mudanças de outra sessão: {exc}", file=sys.stderr)
+
+        def consumer_done(task):
+            self._consumers.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                print(f"Entrega de mudanças encerrada: {task.exception()}", file=sys.stderr)
+
+        consumer = loop.create_task(consume())
+        self._consumers.add(consumer)
+        consumer.add_done_callback(consumer_done)
+
+        def receive(changes):
+            # Chamado na thread de escrita de quem fez a mudança
+            changes = [change for change in changes if change.origin != session_id]
+            if not changes or loop.is_closed():
+                return
+            loop.call_soon_threadsafe(queue.put_nowait, changes)
+
+        unsubscribe_feed = self.controller.subscribe(receive)
+
+        def unsubscribe():
+            unsubscribe_feed()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(consumer.cancel)
+
+        return unsubscribe
+
+    def cache_stats(self):
+        """Retorna os contadores do cache de leituras do controlador."""
+        return self.controller.cache_stats()
+
+    def close(self):
+        """Aguarda as operações pendentes, encerra as threads e libera as conexões.
+
+        As conexões compartilhadas só são fechadas quando o último modelo do
+        banco é fechado.
+        """
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+        self.controller.close()
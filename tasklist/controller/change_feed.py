@@ -0,0 +1,95 @@
+# controller/change_feed.py
+
+import threading
+from typing import Any, NamedTuple, Optional
+
+# Tipos de mudança publicados pelo controlador
+INSERT = "insert"  # data: TaskRecord inserido
+UPDATE = "update"  # data: TaskRecord atualizado, ou None se a linha precisa ser relida
+STATUS = "status"  # data: novo status
+DELETE = "delete"  # data: None
+CLEAR = "clear"  # task_id: None; data: status das tarefas excluídas em lote
+RELOAD = "reload"  # task_id: None; mudança em lote sem detalhes por linha
+
+
+class Change(NamedTuple):
+    """Mudança em uma linha da tabela de tarefas, publicada após a gravação.
+
+    Args:
+        kind (str): Tipo da mudança (INSERT, UPDATE, STATUS, DELETE, CLEAR ou RELOAD).
+        task_id (int): ID da tarefa alterada (None para mudanças em lote).
+        data (object, opcional): Dados da mudança, conforme o tipo.
+        origin (str, opcional): Identificador do controlador que fez a mudança.
+    """
+
+    kind: str
+    task_id: Optional[int]
+    data: Any = None
+    origin: Optional[str] = None
+
+
+class ChangeFeed:
+    """Barramento em memória que entrega as mudanças a todas as sessões do processo.
+
+    Os assinantes são chamados na thread que publicou a mudança (a thread de
+    escrita do controlador) e devem apenas repassá-la, sem bloquear.
+    """
+
+    def __init__(self):
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback):
+        """Registra uma função que recebe as listas de mudanças publicadas.
+
+        Args:
+            callback (callable): Função ``callback(changes)``.
+
+        Returns:
+            callable: Função que cancela a assinatura.
+        """
+        with self._lock:
+            # Copia na escrita: a publicação percorre a lista sem o lock
+            self._subscribers = self._subscribers + [callback]
+
+        def unsubscribe():
+            with self._lock:
+                self._subscribers = [item for item in self._subscribers if item is not callback]
+
+        return unsubscribe
+
+    def publish(self, changes):
+        """Entrega uma lista de mudanças a todos os assinantes.
+
+        Args:
+            changes (list): Mudanças (Change) de uma mesma operação.
+        """
+        if not changes:
+            return
+        for callback in self._subscribers:
+            callback(changes)
+
+    @property
+    def subscribers(self):
+        """Quantidade de assinantes registrados."""
+        return len(self._subscribers)
+
+
+_feeds = {}
+_feeds_lock = threading.Lock()
+
+
+def get_change_feed(db_path):
+    """Retorna o barramento de mudanças compartilhado de um banco de dados.
+
+    Args:
+        db_path (str): Caminho do arquivo do banco de dados.
+
+    Returns:
+        ChangeFeed: Barramento usado por todos os controladores do banco.
+    """
+    with _feeds_lock:
+        feed = _feeds.get(db_path)
+        if feed is None:
+            feed = _feeds[db_path] = ChangeFeed()
+        return feed
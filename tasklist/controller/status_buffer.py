@@ -0,0 +1,98 @@
+# controller/status_buffer.py
+
+import asyncio
+import sys
+
+from db.write_queue import is_busy_error
+
+
+class StatusWriteBuffer:
+    """Agrupa mudanças de status para gravá-las em poucas transações.
+
+    Cada mudança substitui a anterior da mesma tarefa, e todas as mudanças feitas
+    em uma janela de ``delay`` segundos são gravadas juntas. Assim, marcar e
+    desmarcar várias vezes a mesma tarefa resulta em uma única escrita com o
+    estado final.
+
+    Se a gravação falhar, as mudanças voltam para a fila; com o banco bloqueado,
+    uma nova tentativa é feita na janela seguinte.
+
+    Deve ser usado a partir do loop de eventos da interface.
+
+    Args:
+        controller (AsyncTaskController): Controlador usado para gravar as mudanças.
+        delay (float): Duração da janela, em segundos, antes de gravar.
+        on_flush (callable, opcional): Corrotina chamada após cada gravação.
+    """
+
+    def __init__(self, controller, delay=0.3, on_flush=None):
+        self.controller = controller
+        self.delay = delay
+        self.on_flush = on_flush
+        self._pending = {}
+        self._timer = None
+        # Gravação iniciada pelo temporizador (referência mantida até o fim)
+        self._task = None
+
+    def set_status(self, task_id, status):
+        """Registra a mudança de status de uma tarefa.
+
+        Args:
+            task_id (int): ID da tarefa.
+            status (str): Novo status da tarefa.
+        """
+        self._pending[task_id] = status
+        self._schedule()
+
+    def _schedule(self):
+        """Agenda a gravação para o fim da janela, se ainda não estiver agendada."""
+        if self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.delay, self._start_flush)
+
+    def _start_flush(self):
+        """Inicia a gravação agendada pelo temporizador."""
+        self._timer = None
+        self._task = asyncio.get_running_loop().create_task(self._scheduled_flush())
+
+    async def _scheduled_flush(self):
+        """Grava as mudanças pendentes, informando a falha em vez de perdê-la."""
+        try:
+            await self.flush()
+        except Exception as exc:
+            print(f"Falha ao gravar as mudanças de status: {exc}", file=sys.stderr)
+            if is_busy_error(exc):
+                self._schedule()
+        finally:
+            self._task = None
+
+    def discard(self, task_id):
+        """Descarta a mudança pendente de uma tarefa (por exemplo, ao excluí-la).
+
+        Args:
+            task_id (int): ID da tarefa.
+        """
+        self._pending.pop(task_id, None)
+
+    async def flush(self):
+        """Grava imediatamente todas as mudanças pendentes.
+
+        Raises:
+            Exception: Erro da gravação; as mudanças voltam para a fila, sem
+                substituir as registradas enquanto isso.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        changes = list(self._pending.items())
+        self._pending.clear()
+        if not changes:
+            return
+        try:
+            await self.controller.update_statuses(changes)
+        except Exception:
+            for task_id, status in changes:
+                self._pending.setdefault(task_id, status)
+            raise
+        if self.on_flush is not None:
+            await self.on_flush()
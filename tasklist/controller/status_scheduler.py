@@ -0,0 +1,202 @@
+# controller/status_scheduler.py
+
+import heapq
+import sys
+import threading
+from datetime import date, datetime, time, timedelta
+
+from controller.change_feed import INSERT, RELOAD, STATUS, UPDATE
+from controller.task_controller import TaskController
+from model.dates import parse_date
+from model.task_model import STATUS_IN_PROGRESS, STATUS_PENDING, TaskModel
+
+
+def transitions_for(record):
+    """Calcula as datas em que uma tarefa muda de status com a passagem do tempo.
+
+    Mesmas regras de ``TaskModel.get_status_transitions``.
+
+    Args:
+        record (TaskRecord): Dados da tarefa.
+
+    Returns:
+        list: Tuplas (dia, id da tarefa), com o dia em AAAA-MM-DD.
+    """
+    try:
+        start_date = parse_date(record.start_date)
+        end_date = parse_date(record.end_date)
+    except ValueError:
+        return []
+    transitions = []
+    if record.status == STATUS_PENDING and start_date:
+        transitions.append((start_date.isoformat(), record.id))
+    if record.status in (STATUS_PENDING, STATUS_IN_PROGRESS) and end_date:
+        transitions.append(((end_date + timedelta(days=1)).isoformat(), record.id))
+    return transitions
+
+
+class StatusScheduler:
+    """Muda o status das tarefas quando chegam as datas de início e os prazos.
+
+    Mantém em um heap as próximas ``batch_size`` datas de mudança, lidas dos
+    índices parciais, e dorme até a mais próxima (meia-noite, no horário local).
+    Ao acordar, grava em um único comando todas as mudanças vencidas, que o
+    controlador publica no barramento para as sessões abertas. O custo depende
+    da quantidade de mudanças, não do tamanho da tabela.
+
+    Tarefas criadas ou alteradas depois da leitura chegam pelo barramento e
+    entram no heap; mudanças em lote sem detalhes e tarefas reabertas (que
+    voltam a ter datas pela frente) fazem o heap ser relido.
+
+    Args:
+        controller (TaskController): Controlador usado para gravar as mudanças.
+        batch_size (int): Quantidade de datas lidas do banco para o heap.
+        max_sleep (float): Espera máxima, em segundos, entre duas verificações
+            (protege contra ajustes do relógio e suspensão do sistema).
+    """
+
+    def __init__(self, controller, batch_size=1000, max_sleep=3600):
+        self.controller = controller
+        self.batch_size = batch_size
+        self.max_sleep = max_sleep
+        self._heap = []
+        # Último dia lido quando o heap não contém todas as mudanças do banco
+        self._horizon = None
+        # O heap precisa ser lido (ou relido) do banco
+        self._stale = True
+        # A primeira execução aplica as mudanças vencidas enquanto o aplicativo estava fechado
+        self._caught_up = False
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._unsubscribe = None
+
+    def run_once(self, today=None):
+        """Aplica as mudanças vencidas e prepara o heap para as próximas.
+
+        Args:
+            today (date, opcional): Dia de referência; por padrão, o dia atual.
+
+        Returns:
+            int: Quantidade de tarefas que mudaram de status.
+        """
+        today = today or date.today()
+        key = today.isoformat()
+        with self._lock:
+            # Com o heap desatualizado, alguma mudança vencida pode não estar nele
+            due = self._stale or not self._caught_up or bool(self._heap and self._heap[0][0] <= key)
+        count = self.controller.apply_due_statuses(today)["count"] if due else 0
+        self._caught_up = True
+
+        with self._lock:
+            while self._heap and self._heap[0][0] <= key:
+                heapq.heappop(self._heap)
+            # Além do horizonte, há mudanças no banco que ainda não estão no heap
+            beyond = self._horizon is not None and (not self._heap or self._heap[0][0] > self._horizon)
+            if self._stale or beyond:
+                transitions = self.controller.model.get_status_transitions(key, self.batch_size)
+                self._heap = transitions  # Lista ordenada: já é um heap
+                self._horizon = transitions[-1][0] if len(transitions) == self.batch_size else None
+                self._stale = False
+        return count
+
+    def next_wakeup(self, now=None):
+        """Calcula quantos segundos faltam para a próxima mudança de status.
+
+        Args:
+            now (datetime, opcional): Instante de referência; por padrão, o atual.
+
+        Returns:
+            float: Segundos até a meia-noite do dia da próxima mudança, limitados a ``max_sleep``.
+        """
+        now = now or datetime.now()
+        with self._lock:
+            if not self._heap:
+                return self.max_sleep
+            day = self._heap[0][0]
+        when = datetime.combine(date.fromisoformat(day), time())
+        return min(max((when - now).total_seconds(), 0.0), self.max_sleep)
+
+    def start(self):
+        """Passa a receber as mudanças do barramento e inicia a thread do agendador."""
+        if self._thread is not None:
+            return
+        self._unsubscribe = self.controller.subscribe(self._on_changes)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="tasklist-status-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Interrompe a thread do agendador, aguardando a execução em andamento."""
+        if self._thread is None:
+            return
+        self._unsubscribe()
+        self._unsubscribe = None
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        """Laço da thread: aplica as mudanças vencidas e dorme até a próxima."""
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as exc:
+                # Uma falha (por exemplo, banco bloqueado) é tentada de novo na próxima verificação
+                print(f"Falha ao atualizar o status das tarefas: {exc}", file=sys.stderr)
+            # Limpa antes de calcular a espera: o que chegar depois ainda acorda a thread
+            self._wake.clear()
+            self._wake.wait(self.next_wakeup())
+
+    def _on_changes(self, changes):
+        """Acrescenta ao heap as datas das tarefas criadas ou alteradas em outras sessões.
+
+        Chamada na thread que gravou as mudanças; acorda o agendador se alguma
+        data for anterior à próxima esperada.
+
+        Args:
+            changes (list): Mudanças (Change) publicadas no barramento.
+        """
+        reload = False
+        transitions = []
+        for change in changes:
+            if change.kind == RELOAD or (change.kind == UPDATE and change.data is None):
+                reload = True
+            elif change.kind in (INSERT, UPDATE):
+                transitions.extend(transitions_for(change.data))
+            elif change.kind == STATUS and change.origin != self.controller.session_id:
+                # A mudança traz só o status: uma tarefa reaberta tem as datas relidas do banco
+                reload = reload or change.data in (STATUS_PENDING, STATUS_IN_PROGRESS)
+        if not reload and not transitions:
+            return
+        with self._lock:
+            earliest = self._heap[0][0] if self._heap else None
+            for item in transitions:
+                heapq.heappush(self._heap, item)
+            self._stale = self._stale or reload
+        if reload or earliest is None or min(transitions)[0] < earliest:
+            self._wake.set()
+
+
+_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+
+def start_status_scheduler(db_path="taskslist.db", **options):
+    """Inicia o agendador de mudanças de status de um banco, uma vez por processo.
+
+    Args:
+        db_path (str, opcional): Caminho do banco de dados.
+        **options: Parâmetros do StatusScheduler (batch_size, max_sleep).
+
+    Returns:
+        StatusScheduler: Agendador em execução do banco.
+    """
+    with _schedulers_lock:
+        scheduler = _schedulers.get(db_path)
+        if scheduler is None:
+            scheduler = _schedulers[db_path] = StatusScheduler(TaskController(TaskModel(db_path)), **options)
+            scheduler.start()
+        return scheduler
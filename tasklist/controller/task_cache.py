@@ -0,0 +1,188 @@
+# controller/task_cache.py
+
+import threading
+from collections import OrderedDict
+
+
+class TaskCache:
+    """Cache em memória de tarefas e de resultados de consultas, com limite LRU.
+
+    Guarda dois tipos de entrada: registros individuais (por ID) e resultados de
+    consultas (pela combinação de método e parâmetros). É seguro para uso por
+    várias threads.
+
+    Args:
+        max_records (int): Quantidade máxima de tarefas individuais guardadas.
+        max_queries (int): Quantidade máxima de resultados de consultas guardados.
+    """
+
+    def __init__(self, max_records=10_000, max_queries=256):
+        self.max_records = max_records
+        self.max_queries = max_queries
+        self.hits = 0
+        self.misses = 0
+        self._records = OrderedDict()
+        self._queries = OrderedDict()
+        self._lock = threading.Lock()
+        # Versão dos dados do banco à qual o conteúdo do cache corresponde
+        self._data_version = None
+
+    def validate(self, data_version):
+        """Descarta todo o conteúdo se os dados do banco mudaram por fora.
+
+        Args:
+            data_version (tuple): Versão atual dos dados (``TaskModel.data_version``).
+        """
+        with self._lock:
+            if data_version != self._data_version:
+                self._records.clear()
+                self._queries.clear()
+                self._data_version = data_version
+
+    def after_write(self, before, after, writes=1):
+        """Registra a versão dos dados após uma escrita feita pelo controlador.
+
+        Se a única mudança entre ``before`` e ``after`` foi a própria escrita, o
+        cache continua válido (e o chamador aplica a mudança com ``patch`` ou
+        ``remove``). Caso contrário, outra escrita aconteceu no meio e o conteúdo
+        é descartado.
+
+        A versão avança uma vez por transação: com a fila de escrita, uma mesma
+        transação pode incluir escritas de outros controladores, e o cache só é
+        mantido se a escrita do controlador foi a única do grupo.
+
+        Args:
+            before (tuple): Versão dos dados antes da escrita.
+            after (tuple): Versão dos dados depois da escrita.
+            writes (int, opcional): Escritas confirmadas na mesma transação.
+        """
+        with self._lock:
+            only_ours = (
+                writes == 1
+                and self._data_version == before
+                and after == (before[0], before[1] + 1)
+            )
+            if not only_ours:
+                self._records.clear()
+                self._queries.clear()
+            self._data_version = after
+
+    def get_query(self, key):
+        """Retorna o resultado guardado de uma consulta.
+
+        Args:
+            key (tuple): Método e parâmetros da consulta.
+
+        Returns:
+            object: Resultado guardado, ou None se não estiver no cache.
+        """
+        with self._lock:
+            result = self._queries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._queries.move_to_end(key)
+            return result
+
+    def put_query(self, key, result, data_version):
+        """Guarda o resultado de uma consulta.
+
+        O resultado é ignorado se os dados mudaram enquanto a consulta era feita.
+
+        Args:
+            key (tuple): Método e parâmetros da consulta.
+            result (object): Resultado a ser guardado.
+            data_version (tuple): Versão dos dados em que a consulta foi feita.
+        """
+        with self._lock:
+            if data_version != self._data_version:
+                return
+            self._queries[key] = result
+            self._queries.move_to_end(key)
+            if len(self._queries) > self.max_queries:
+                self._queries.popitem(last=False)
+
+    def get_record(self, task_id):
+        """Retorna a tarefa guardada com o ID informado.
+
+        Args:
+            task_id (int): ID da tarefa.
+
+        Returns:
+            TaskRecord: Tarefa guardada, ou None se não estiver no cache.
+        """
+        with self._lock:
+            record = self._records.get(task_id)
+            if record is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._records.move_to_end(task_id)
+            return record
+
+    def put_record(self, record, data_version=None):
+        """Guarda (ou substitui) uma tarefa individual.
+
+        Args:
+            record (TaskRecord): Tarefa a ser guardada.
+            data_version (tuple, opcional): Versão dos dados em que a tarefa foi
+                lida; se os dados mudaram desde então, a tarefa é ignorada.
+        """
+        with self._lock:
+            if data_version is not None and data_version != self._data_version:
+                return
+            self._records[record.id] = record
+            self._records.move_to_end(record.id)
+            if len(self._records) > self.max_records:
+                self._records.popitem(last=False)
+
+    def patch(self, record):
+        """Aplica ao cache uma tarefa inserida ou alterada pelo próprio controlador.
+
+        O registro é atualizado e os resultados de consultas são descartados,
+        pois a tarefa pode ter entrado ou saído de qualquer filtro.
+
+        Args:
+            record (TaskRecord): Tarefa inserida ou alterada.
+        """
+        self.put_record(record)
+        self.invalidate_queries()
+
+    def remove(self, task_ids):
+        """Descarta tarefas excluídas ou alteradas sem o registro atualizado.
+
+        Args:
+            task_ids (iterable): IDs das tarefas.
+        """
+        with self._lock:
+            for task_id in task_ids:
+                self._records.pop(task_id, None)
+            self._queries.clear()
+
+    def invalidate_queries(self):
+        """Descarta os resultados de consultas, mantendo as tarefas individuais."""
+        with self._lock:
+            self._queries.clear()
+
+    def clear(self):
+        """Descarta todo o conteúdo do cache."""
+        with self._lock:
+            self._records.clear()
+            self._queries.clear()
+
+    def stats(self):
+        """Retorna os contadores do cache.
+
+        Returns:
+            dict: Acertos, falhas, taxa de acerto e quantidade de entradas.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "records": len(self._records),
+                "queries": len(self._queries),
+            }
@@ -1,15 +1,113 @@
 # controller/task_controller.py
 
-from model.task_model import TaskModel
-from datetime import datetime
+import uuid
+
+from controller.change_feed import CLEAR, DELETE, INSERT, RELOAD, STATUS, UPDATE, Change, get_change_feed
+from controller.task_cache import TaskCache
+from instrumentation import instrumented
+from model.dates import parse_date
+from model.task_model import STATUS_COMPLETED, STATUS_IN_PROGRESS, STATUS_OVERDUE, STATUS_PENDING, TaskModel
+from datetime import date, datetime, timedelta, timezone
 
 class TaskController:
     """Classe para gerenciar a lógica das tarefas, comunicando-se entre a interface e o banco de dados."""
 
-    def __init__(self):
-        """Inicializa o controlador com uma instância do modelo."""
-        self.model = TaskModel()
+    def __init__(self, model=None, cache=None, write_queue=None, feed=None):
+        """Inicializa o controlador com uma instância do modelo.
+
+        Args:
+            model (TaskModel, opcional): Modelo a ser usado. Por padrão, cria um
+                modelo que compartilha as conexões persistentes do banco.
+            cache (TaskCache, opcional): Cache de leituras. Por padrão, cria um
+                cache com os limites padrão.
+            write_queue (WriteQueue, opcional): Fila que agrupa as escritas de
+                várias threads em uma transação. Por padrão, cada escrita usa
+                sua própria transação.
+            feed (ChangeFeed, opcional): Barramento onde as mudanças são
+                publicadas. Por padrão, o barramento compartilhado do banco.
+        """
+        self.model = model or TaskModel()
+        self.cache = cache or TaskCache()
+        self.write_queue = write_queue
+        self.feed = feed or get_change_feed(self.model.db_path)
+        # Identifica as mudanças feitas por este controlador (e pela sua sessão)
+        self.session_id = uuid.uuid4().hex
+
+    def _cached(self, key, load):
+        """Retorna o resultado de uma leitura pelo cache, consultando o banco se necessário.
+
+        Args:
+            key (tuple): Método e parâmetros da consulta.
+            load (callable): Função que faz a consulta no banco.
+
+        Returns:
+            object: Cópia do resultado (lista ou dicionário).
+        """
+        version = self.model.data_version()
+        self.cache.validate(version)
+        result = self.cache.get_query(key)
+        if result is None:
+            result = load()
+            self.cache.put_query(key, result, version)
+        return result.copy()
+
+    def _write(self, operation, *args):
+        """Executa uma escrita no modelo mantendo o cache coerente.
+
+        Args:
+            operation (callable): Método do modelo que faz a escrita.
+            *args: Argumentos do método.
+
+        Returns:
+            object: Retorno do método do modelo.
+        """
+        before = self.model.data_version()
+        if self.write_queue is None:
+            result, writes = operation(*args), 1
+        else:
+            # Aguarda a confirmação do grupo; as demais escritas do grupo podem
+            # ser de outros controladores
+            result, writes = self.write_queue.execute(operation, *args)
+        self.cache.after_write(before, self.model.data_version(), writes)
+        return result
+
+    def _publish(self, kind, task_ids, data=None):
+        """Publica no barramento as mudanças de uma operação já gravada.
+
+        Args:
+            kind (str): Tipo da mudança.
+            task_ids (iterable): IDs das tarefas alteradas.
+            data (object, opcional): Dados da mudança, iguais para todas as tarefas.
+        """
+        self.feed.publish([Change(kind, task_id, data, self.session_id) for task_id in task_ids])
+
+    def subscribe(self, callback):
+        """Recebe as mudanças feitas por qualquer controlador do mesmo banco.
 
+        Args:
+            callback (callable): Função ``callback(changes)``, chamada na thread
+                que gravou a mudança.
+
+        Returns:
+            callable: Função que cancela a assinatura.
+        """
+        return self.feed.subscribe(callback)
+
+    def cache_stats(self):
+        """Retorna os contadores do cache de leituras.
+
+        Returns:
+            dict: Acertos, falhas, taxa de acerto e quantidade de entradas.
+        """
+        return self.cache.stats()
+
+    def close(self):
+        """Grava as escritas pendentes e fecha as conexões com o banco de dados."""
+        if self.write_queue is not None:
+            self.write_queue.close()
+        self.model.close()
+
+    @instrumented
     def add_task(self, description, start_date=None, end_date=None):
         """Adiciona uma nova tarefa ao banco de dados, validando os dados.
 
@@ -19,49 +117,295 @@ class TaskController:
             end_date (str, opcional): Data de conclusão da tarefa.
 
         Returns:
-            dict: Resultado com sucesso ou mensagem de erro.
+            dict: Resultado com sucesso ou mensagem de erro; em caso de sucesso,
+                inclui a tarefa inserida em "task".
+        """
+        # Valida os dados, normaliza as datas e define o status
+        error, fields = self.prepare_task(description, start_date, end_date)
+        if error:
+            return error
+
+        # Chama o modelo para adicionar a tarefa
+        task = self._write(self.model.add_task, *fields)
+        self.cache.patch(task)
+        self._publish(INSERT, [task.id], task)
+        return {"success": True, "message": "Tarefa adicionada com sucesso.", "task": task}
+
+    @instrumented
+    def add_tasks(self, tasks):
+        """Adiciona várias tarefas validando o lote inteiro antes de gravar.
+
+        As tarefas válidas são gravadas em uma única transação.
+
+        Args:
+            tasks (iterable): Dicionários com as chaves "description" e,
+                opcionalmente, "start_date", "end_date" e "status". Do status,
+                apenas "Concluída" é mantido; os demais são recalculados pelas datas.
+
+        Returns:
+            list: Resultado (sucesso ou mensagem de erro) de cada tarefa, na ordem
+                recebida; em caso de sucesso, inclui o ID gerado em "task_id".
+        """
+        results = []
+        rows = []
+        for task in tasks:
+            error, fields = self.prepare_task(task.get("description"), task.get("start_date"), task.get("end_date"))
+            if error:
+                results.append(error)
+                continue
+            if task.get("status") == STATUS_COMPLETED:
+                fields = fields[:3] + (STATUS_COMPLETED,)
+            rows.append(fields)
+            results.append({"success": True, "message": "Tarefa adicionada com sucesso."})
+
+        if rows:
+            task_ids = iter(self._write(self.model.add_tasks, rows))
+            for result in results:
+                if result["success"]:
+                    result["task_id"] = next(task_ids)
+            self.cache.invalidate_queries()
+            self._publish(RELOAD, [None])
+        return results
+
+    @instrumented
+    def prepare_task(self, description, start_date=None, end_date=None):
+        """Valida os dados de uma tarefa e converte as datas uma única vez.
+
+        Args:
+            description (str): Descrição da tarefa.
+            start_date (str | date, opcional): Data de início da tarefa.
+            end_date (str | date, opcional): Data de conclusão da tarefa.
+
+        Returns:
+            tuple: Resultado com a mensagem de erro (ou None) e os campos prontos
+                para gravação: descrição, datas em AAAA-MM-DD e status.
+        """
+        try:
+            start = parse_date(start_date)
+            end = parse_date(end_date)
+        except ValueError as exc:
+            return {"success": False, "message": str(exc)}, None
+
+        error = self.validate_task(description, start, end)
+        if error:
+            return error, None
+
+        status = self.calculate_status(start, end)
+        return None, (
+            description,
+            start.isoformat() if start else None,
+            end.isoformat() if end else None,
+            status,
+        )
+
+    def validate_task(self, description, start_date=None, end_date=None):
+        """Valida os dados de uma tarefa.
+
+        Args:
+            description (str): Descrição da tarefa.
+            start_date (date, opcional): Data de início da tarefa.
+            end_date (date, opcional): Data de conclusão da tarefa.
+
+        Returns:
+            dict: Resultado com a mensagem de erro, ou None se os dados forem válidos.
         """
         # Valida descrição obrigatória
         if not description:
             return {"success": False, "message": "A descrição é obrigatória."}
 
         # Validações de data
-        if start_date and end_date:
-            if start_date >= end_date:
-                return {"success": False, "message": "A data de conclusão deve ser posterior à data de início."}
+        if start_date and end_date and start_date >= end_date:
+            return {"success": False, "message": "A data de conclusão deve ser posterior à data de início."}
 
-        # Define o status com base nas datas
-        status = self.calculate_status(start_date, end_date)
-        
-        # Chama o modelo para adicionar a tarefa
-        self.model.add_task(description, start_date, end_date, status)
-        return {"success": True, "message": "Tarefa adicionada com sucesso."}
+        return None
+
+    def calculate_status(self, start_date, end_date, today=None):
+        """Define o status da tarefa com base nas datas e no dia atual.
 
-    def calculate_status(self, start_date, end_date):
-        """Define o status da tarefa com base nas datas fornecidas.
+        A data de conclusão é o prazo da tarefa: depois dela, a tarefa está atrasada.
+        O status "Concluída" só é atribuído explicitamente (ao marcar a tarefa).
 
         Args:
-            start_date (str): Data de início da tarefa.
-            end_date (str): Data de conclusão da tarefa.
+            start_date (str | date): Data de início da tarefa.
+            end_date (str | date): Data de conclusão (prazo) da tarefa.
+            today (date, opcional): Dia de referência; por padrão, o dia atual.
 
         Returns:
-            str: Status da tarefa ("Pendente", "Em Andamento" ou "Concluída").
+            str: Status da tarefa ("Pendente", "Em Andamento" ou "Atrasada").
         """
-        if not start_date:
-            return "Pendente"
-        elif start_date and not end_date:
-            return "Em Andamento"
-        elif start_date and end_date:
-            return "Concluída"
+        today = today or date.today()
+        start_date = parse_date(start_date)
+        end_date = parse_date(end_date)
+        if end_date and end_date < today:
+            return STATUS_OVERDUE
+        elif start_date and start_date <= today:
+            return STATUS_IN_PROGRESS
+        else:
+            return STATUS_PENDING
 
+    @instrumented
     def get_all_tasks(self):
         """Recupera todas as tarefas do banco de dados.
 
         Returns:
-            list: Lista de dicionários com os dados das tarefas.
+            list: Lista de TaskRecord com os dados das tarefas.
+        """
+        return self._cached(("get_tasks",), self.model.get_tasks)
+
+    @instrumented
+    def get_task(self, task_id):
+        """Recupera uma tarefa pelo ID.
+
+        Args:
+            task_id (int): ID da tarefa.
+
+        Returns:
+            TaskRecord: Tarefa encontrada, ou None se o ID não existir.
+        """
+        version = self.model.data_version()
+        self.cache.validate(version)
+        task = self.cache.get_record(task_id)
+        if task is None:
+            task = self.model.get_task(task_id)
+            if task is not None:
+                self.cache.put_record(task, version)
+        return task
+
+    @instrumented
+    def get_tasks(self, **filters):
+        """Recupera uma página de tarefas, com filtros e ordenação feitos no banco.
+
+        Args:
+            **filters: Filtros aceitos por ``TaskModel.get_tasks`` (status,
+                start_after, end_before, text, order_by, limit e cursor).
+
+        Returns:
+            list: Lista de TaskRecord com os dados das tarefas.
+        """
+        # Listas (ex.: vários status) viram tuplas para a chave ser hashable.
+        key = ("get_tasks", *sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in filters.items()
+        ))
+        return self._cached(key, lambda: self.model.get_tasks(**filters))
+
+    @instrumented
+    def count_tasks(self):
+        """Conta as tarefas ativas e concluídas.
+
+        Returns:
+            dict: Quantidades em "active" e "completed".
+        """
+        def load():
+            total = self.model.count_tasks()
+            completed = self.model.count_tasks(STATUS_COMPLETED)
+            return {"active": total - completed, "completed": completed}
+
+        return self._cached(("count_tasks",), load)
+
+    @instrumented
+    def get_stats(self, days=7):
+        """Retorna os contadores e estatísticas das tarefas, lidos das tabelas de resumo.
+
+        O custo não depende da quantidade de tarefas.
+
+        Args:
+            days (int, opcional): Quantidade de dias do histórico.
+
+        Returns:
+            dict: Tarefas ativas ("active"), concluídas ("completed"), arquivadas
+                ("archived"), quantidade por status ("by_status") e tarefas
+                criadas e concluídas por dia ("daily").
+        """
+        def load():
+            stats = self.model.get_stats(days)
+            by_status = stats["by_status"]
+            completed = by_status.get(STATUS_COMPLETED, 0)
+            return {
+                "active": sum(by_status.values()) - completed,
+                "completed": completed,
+                "archived": sum(stats["archived"].values()),
+                "by_status": by_status,
+                "daily": stats["daily"],
+            }
+
+        return self._cached(("stats", days), load)
+
+    @instrumented
+    def get_due_this_week(self, today=None):
+        """Recupera as tarefas em aberto com prazo na semana atual (segunda a domingo).
+
+        Args:
+            today (date, opcional): Dia de referência; por padrão, o dia atual.
+
+        Returns:
+            list: Lista de TaskRecord, ordenada pelo prazo.
         """
-        return self.model.get_tasks()
+        today = today or date.today()
+        monday = today - timedelta(days=today.weekday())
+        sunday = monday + timedelta(days=6)
+        return self._cached(
+            ("due_between", monday, sunday),
+            lambda: self.model.get_tasks_due_between(monday.isoformat(), sunday.isoformat()),
+        )
 
+    @instrumented
+    def get_overdue_tasks(self, today=None):
+        """Recupera as tarefas em aberto cujo prazo já passou.
+
+        Args:
+            today (date, opcional): Dia de referência; por padrão, o dia atual.
+
+        Returns:
+            list: Lista de TaskRecord, ordenada pelo prazo.
+        """
+        today = today or date.today()
+        return self._cached(("overdue", today), lambda: self.model.get_overdue_tasks(today.isoformat()))
+
+    @instrumented
+    def get_tasks_in_progress(self, today=None):
+        """Recupera as tarefas em aberto que já começaram e ainda estão no prazo.
+
+        Args:
+            today (date, opcional): Dia de referência; por padrão, o dia atual.
+
+        Returns:
+            list: Lista de TaskRecord, ordenada pela data de início.
+        """
+        today = today or date.today()
+        return self._cached(("in_progress", today), lambda: self.model.get_tasks_in_progress(today.isoformat()))
+
+    @instrumented
+    def search_tasks(self, query, limit=50, include_archived=False):
+        """Busca tarefas pela descrição.
+
+        Args:
+            query (str): Texto da busca; cada palavra é tratada como prefixo.
+            limit (int, opcional): Quantidade máxima de tarefas retornadas.
+            include_archived (bool, opcional): Também busca nas tarefas arquivadas.
+
+        Returns:
+            list: Lista de TaskRecord encontrados, das mais recentes para as mais antigas.
+        """
+        if not query or not query.strip():
+            return []
+        return self._cached(
+            ("search", query, limit, include_archived),
+            lambda: self.model.search_tasks(query, limit, include_archived),
+        )
+
+    def iter_tasks(self, **filters):
+        """Percorre as tarefas sem carregar a tabela inteira em memória.
+
+        Args:
+            **filters: Filtros aceitos por ``TaskModel.get_tasks``.
+
+        Yields:
+            TaskRecord: Cada tarefa encontrada.
+        """
+        yield from self.model.iter_tasks(**filters)
+
+    @instrumented
     def update_task(self, task_id, description, start_date=None, end_date=None):
         """Atualiza uma tarefa no banco de dados após validação.
 
@@ -72,18 +416,98 @@ class TaskController:
             end_date (str, opcional): Nova data de conclusão.
 
         Returns:
-            dict: Resultado com sucesso ou mensagem de erro.
+            dict: Resultado com sucesso ou mensagem de erro; em caso de sucesso,
+                inclui a tarefa atualizada em "task".
+        """
+        error, fields = self.prepare_task(description, start_date, end_date)
+        if error:
+            return error
+
+        task = self._write(self.model.update_task, task_id, *fields)
+        if task is None:
+            return {"success": False, "message": "Tarefa não encontrada."}
+        self.cache.patch(task)
+        self._publish(UPDATE, [task.id], task)
+        return {"success": True, "message": "Tarefa atualizada com sucesso.", "task": task}
+
+    @instrumented
+    def update_tasks(self, tasks):
+        """Atualiza várias tarefas validando o lote inteiro antes de gravar.
+
+        As tarefas válidas são gravadas em uma única transação.
+
+        Args:
+            tasks (iterable): Dicionários com as chaves "id", "description" e,
+                opcionalmente, "start_date" e "end_date".
+
+        Returns:
+            list: Resultado (sucesso ou mensagem de erro) de cada tarefa, na ordem
+                recebida; em caso de sucesso, inclui a tarefa atualizada em "task".
+        """
+        results = []
+        rows = []
+        for task in tasks:
+            error, fields = self.prepare_task(task.get("description"), task.get("start_date"), task.get("end_date"))
+            if error:
+                results.append(error)
+                continue
+            rows.append((*fields, task["id"]))
+            results.append(None)  # Preenchido com o resultado da gravação
+
+        if rows:
+            updated = {task.id: task for task in self._write(self.model.update_tasks, rows)}
+            for task in updated.values():
+                self.cache.patch(task)
+            self.feed.publish([Change(UPDATE, task.id, task, self.session_id) for task in updated.values()])
+            task_ids = iter(row[-1] for row in rows)
+            for index, result in enumerate(results):
+                if result is None:
+                    task = updated.get(next(task_ids))
+                    results[index] = (
+                        {"success": True, "message": "Tarefa atualizada com sucesso.", "task": task}
+                        if task else {"success": False, "message": "Tarefa não encontrada."}
+                    )
+        return results
+
+    @instrumented
+    def rename_task(self, task_id, description):
+        """Altera a descrição de uma tarefa, mantendo datas e status.
+
+        Args:
+            task_id (int): ID da tarefa.
+            description (str): Nova descrição da tarefa.
+
+        Returns:
+            dict: Resultado com sucesso ou mensagem de erro; em caso de sucesso,
+                inclui a tarefa atualizada em "task".
         """
         if not description:
             return {"success": False, "message": "A descrição é obrigatória."}
 
-        if start_date and end_date and start_date >= end_date:
-            return {"success": False, "message": "A data de conclusão deve ser posterior à data de início."}
+        task = self._write(self.model.update_description, task_id, description)
+        if task is None:
+            return {"success": False, "message": "Tarefa não encontrada."}
+        self.cache.patch(task)
+        self._publish(UPDATE, [task.id], task)
+        return {"success": True, "message": "Tarefa atualizada com sucesso.", "task": task}
+
+    @instrumented
+    def update_statuses(self, changes):
+        """Altera o status de várias tarefas em uma única transação.
 
-        status = self.calculate_status(start_date, end_date)
-        self.model.update_task(task_id, description, start_date, end_date, status)
-        return {"success": True, "message": "Tarefa atualizada com sucesso."}
+        Args:
+            changes (iterable): Pares (ID da tarefa, novo status).
+
+        Returns:
+            dict: Resultado da atualização.
+        """
+        changes = list(changes)
+        count = self._write(self.model.update_statuses, changes)
+        self.cache.remove(task_id for task_id, _ in changes)
+        self.feed.publish([Change(STATUS, task_id, status, self.session_id) for task_id, status in changes])
+        return {"success": True, "message": f"{count} tarefa(s) atualizada(s).", "count": count}
 
+    @instrumented
     def delete_task(self, task_id):
         """Exclui uma tarefa do banco de dados.
 
@@ -93,5 +517,94 @@ class TaskController:
         Returns:
             dict: Resultado da exclusão.
         """
-        self.model.delete_task(task_id)
-        return {"success": True, "message": "Tarefa excluída com sucesso."}
+        deleted = self._write(self.model.delete_task, task_id)
+        self.cache.remove([task_id])
+        if not deleted:
+            return {"success": False, "message": "Tarefa não encontrada."}
+        self._publish(DELETE, [task_id])
+        return {"success": True, "message": "Tarefa excluída com sucesso.", "task_id": task_id}
+
+    @instrumented
+    def delete_tasks(self, task_ids):
+        """Exclui várias tarefas em uma única transação.
+
+        Args:
+            task_ids (iterable): IDs das tarefas a serem excluídas.
+
+        Returns:
+            list: Resultado da exclusão de cada tarefa, na ordem recebida.
+        """
+        task_ids = list(task_ids)
+        deleted = self._write(self.model.delete_tasks, task_ids)
+        self.cache.remove(task_ids)
+        self._publish(DELETE, deleted)
+        deleted = set(deleted)
+        return [
+            {"success": True, "message": "Tarefa excluída com sucesso.", "task_id": task_id}
+            if task_id in deleted
+            else {"success": False, "message": "Tarefa não encontrada."}
+            for task_id in task_ids
+        ]
+
+    @instrumented
+    def clear_completed(self):
+        """Exclui todas as tarefas concluídas com um único comando.
+
+        Returns:
+            dict: Resultado da exclusão, com a quantidade de tarefas excluídas.
+        """
+        count = self._write(self.model.delete_tasks_by_status, STATUS_COMPLETED)
+        self.cache.clear()
+        if count:
+            self._publish(CLEAR, [None], STATUS_COMPLETED)
+        return {"success": True, "message": f"{count} tarefa(s) excluída(s).", "count": count}
+
+    @instrumented
+    def archive_completed(self, max_age_days=30, batch_size=1000):
+        """Move para o arquivo as tarefas concluídas há mais de ``max_age_days`` dias.
+
+        As tarefas são movidas em lotes de ``batch_size``, cada um em sua própria
+        transação, para não bloquear as demais escritas por muito tempo. Para as
+        sessões abertas, as tarefas arquivadas são publicadas como excluídas.
+
+        Args:
+            max_age_days (int, opcional): Idade mínima da conclusão, em dias.
+            batch_size (int, opcional): Quantidade de tarefas movidas por transação.
+
+        Returns:
+            dict: Resultado do arquivamento, com a quantidade de tarefas movidas.
+        """
+        if max_age_days < 0:
+            return {"success": False, "message": "A idade mínima não pode ser negativa."}
+        # completed_at é gravado pelo SQLite, em UTC
+        cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+        cutoff = cutoff.strftime("%Y-%m-%d %H:%M:%S")
+        count = 0
+        while True:
+            task_ids = self._write(self.model.archive_completed, cutoff, batch_size)
+            if not task_ids:
+                break
+            self.cache.remove(task_ids)
+            self._publish(DELETE, task_ids)
+            count += len(task_ids)
+        return {"success": True, "message": f"{count} tarefa(s) arquivada(s).", "count": count}
+
+    @instrumented
+    def apply_due_statuses(self, today=None):
+        """Atualiza o status das tarefas cujas datas de início ou prazo já chegaram.
+
+        As mudanças são gravadas em um único comando e publicadas no barramento,
+        para que as sessões abertas atualizem as linhas afetadas.
+
+        Args:
+            today (date, opcional): Dia de referência; por padrão, o dia atual.
+
+        Returns:
+            dict: Resultado da atualização, com a quantidade de tarefas alteradas.
+        """
+        today = today or date.today()
+        changes = self._write(self.model.apply_due_statuses, today.isoformat())
+        if changes:
+            self.cache.remove([task_id for task_id, _ in changes])
+            self.feed.publish([Change(STATUS, task_id, status, self.session_id) for task_id, status in changes])
+        return {"success": True, "message": f"{len(changes)} tarefa(s) atualizada(s).", "count": len(changes)}
@@ -0,0 +1,266 @@
+# db/connection.py
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from instrumentation import watch_connection
+
+# Pragmas aplicados a todas as conexões abertas pelo gerenciador
+PRAGMAS = (
+    # Só tem efeito em bancos novos, e precisa vir antes do modo WAL
+    "PRAGMA auto_vacuum = INCREMENTAL;",
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA busy_timeout = 5000;",
+    "PRAGMA cache_size = -16000;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA mmap_size = 134217728;",
+    "PRAGMA foreign_keys = ON;",
+)
+
+
+class ConnectionManager:
+    """Gerencia conexões de longa duração com o banco de dados SQLite.
+
+    Mantém uma única conexão de escrita, protegida por um lock, e um pool
+    de conexões de leitura que podem ser usadas por várias threads ao mesmo
+    tempo (o modo WAL permite leituras concorrentes com a escrita). Uma conexão
+    à parte lê o ``PRAGMA data_version``, para que a verificação do cache não
+    espere pelas escritas em andamento.
+
+    Args:
+        db_path (str): Caminho do arquivo do banco de dados.
+        readers (int): Quantidade de conexões de leitura no pool.
+    """
+
+    def __init__(self, db_path, readers=4):
+        self.db_path = db_path
+        self._write_lock = threading.RLock()
+        self._writer = self._connect()
+        # Conexão usada apenas para ler PRAGMA data_version, com lock próprio
+        self._monitor = self._connect()
+        self._monitor_lock = threading.Lock()
+        # As conexões de leitura são abertas sob demanda, até o limite do pool
+        self._readers = queue.Queue()
+        self._max_readers = readers
+        self._opened_readers = 0
+        self._readers_lock = threading.Lock()
+        self._closed = False
+        # Usuários do gerenciador compartilhado (ver get_connection_manager)
+        self._references = 0
+        # Contador de transações confirmadas por este gerenciador
+        self.write_generation = 0
+        # Contador de mudanças feitas por fora (outros processos, VACUUM)
+        self._external_changes = 0
+        # Últimos valores de data_version lidos no monitor e na conexão de escrita
+        self._monitor_version = self._read_version(self._monitor)
+        self._writer_version = self._read_version(self._writer)
+
+    def _connect(self):
+        """Abre uma nova conexão já configurada com os pragmas do gerenciador.
+
+        Returns:
+            sqlite3.Connection: Conexão pronta para uso.
+        """
+        # isolation_level=None: as transações são controladas explicitamente
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        watch_connection(conn)
+        return conn
+
+    @staticmethod
+    def _read_version(conn):
+        """Lê o ``PRAGMA data_version`` de uma conexão.
+
+        O valor muda quando outra conexão confirma uma transação.
+
+        Args:
+            conn (sqlite3.Connection): Conexão consultada.
+
+        Returns:
+            int: Valor atual do pragma.
+        """
+        return conn.execute("PRAGMA data_version;").fetchone()[0]
+
+    @contextmanager
+    def writer(self):
+        """Fornece a conexão de escrita dentro de uma transação.
+
+        A transação é confirmada ao final do bloco ou desfeita em caso de erro.
+        Blocos aninhados na mesma thread reutilizam a transação externa.
+
+        Yields:
+            sqlite3.Connection: Conexão de escrita.
+        """
+        with self._write_lock:
+            conn = self._writer
+            if conn.in_transaction:
+                yield conn
+                return
+            conn.execute("BEGIN IMMEDIATE;")
+            # Com a transação aberta, outro processo não confirma escritas: o que
+            # mudou desde a última escrita deste gerenciador veio de fora
+            self._check_writer_version()
+            try:
+                yield conn
+                conn.execute("COMMIT;")
+            except BaseException:
+                # Também cobre a falha do próprio COMMIT (banco ocupado, por exemplo)
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK;")
+                raise
+            self.write_generation += 1
+            self._after_commit()
+
+    def _check_writer_version(self):
+        """Conta como externa a mudança vista pela conexão de escrita.
+
+        O ``data_version`` da conexão de escrita não muda com as próprias
+        transações, apenas com as de outras conexões.
+        """
+        version = self._read_version(self._writer)
+        if version != self._writer_version:
+            self._writer_version = version
+            with self._monitor_lock:
+                self._external_changes += 1
+
+    def _after_commit(self):
+        """Registra no monitor a transação confirmada, sem contá-la como externa.
+
+        O monitor é lido antes da conexão de escrita: uma transação de outro
+        processo confirmada logo após o COMMIT aparece na conexão de escrita e é
+        contada como externa.
+        """
+        with self._monitor_lock:
+            self._monitor_version = self._read_version(self._monitor)
+        self._check_writer_version()
+
+    @contextmanager
+    def maintenance(self):
+        """Fornece a conexão de escrita fora de uma transação.
+
+        Para comandos que não podem rodar dentro de uma transação, como VACUUM.
+        As demais escritas aguardam o fim do bloco.
+
+        Yields:
+            sqlite3.Connection: Conexão de escrita.
+        """
+        with self._write_lock:
+            yield self._writer
+
+    def data_version(self):
+        """Identifica o estado atual dos dados do banco.
+
+        Combina o contador de mudanças externas, mantido a partir do
+        ``PRAGMA data_version`` da conexão monitora, com o contador de transações
+        deste gerenciador. Não espera pelas escritas em andamento.
+
+        Returns:
+            tuple: Valor que muda sempre que os dados forem alterados.
+        """
+        with self._monitor_lock:
+            version = self._read_version(self._monitor)
+            if version != self._monitor_version:
+                # Confirmada por fora ou ainda não registrada por _after_commit
+                self._monitor_version = version
+                self._external_changes += 1
+            return (self._external_changes, self.write_generation)
+
+    @contextmanager
+    def reader(self):
+        """Empresta uma conexão de leitura do pool.
+
+        Yields:
+            sqlite3.Connection: Conexão de leitura.
+        """
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def _open_reader(self):
+        """Abre uma nova conexão de leitura ou, com o pool cheio, aguarda uma livre.
+
+        Returns:
+            sqlite3.Connection: Conexão de leitura.
+        """
+        with self._readers_lock:
+            can_open = self._opened_readers < self._max_readers
+            if can_open:
+                self._opened_readers += 1
+        if can_open:
+            return self._connect()
+        return self._readers.get()
+
+    def close(self):
+        """Fecha todas as conexões mantidas pelo gerenciador."""
+        if self._closed:
+            return
+        self._closed = True
+        with self._write_lock:
+            self._writer.close()
+        with self._monitor_lock:
+            self._monitor.close()
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+
+def get_connection_manager(db_path):
+    """Retorna o gerenciador compartilhado para o banco de dados informado.
+
+    Todas as instâncias que usam o mesmo arquivo compartilham as mesmas
+    conexões, evitando abrir o arquivo a cada operação. Cada chamada conta como
+    um usuário, que deve devolver o gerenciador com ``release_connection_manager``.
+
+    Args:
+        db_path (str): Caminho do arquivo do banco de dados.
+
+    Returns:
+        ConnectionManager: Gerenciador de conexões do banco.
+    """
+    with _managers_lock:
+        manager = _managers.get(db_path)
+        if manager is None or manager._closed:
+            manager = ConnectionManager(db_path)
+            _managers[db_path] = manager
+        manager._references += 1
+        return manager
+
+
+def release_connection_manager(manager):
+    """Devolve um gerenciador obtido com ``get_connection_manager``.
+
+    As conexões só são fechadas quando o último usuário devolve o gerenciador;
+    até lá, os demais continuam usando-as normalmente.
+
+    Args:
+        manager (ConnectionManager): Gerenciador a ser devolvido.
+    """
+    with _managers_lock:
+        manager._references -= 1
+        if manager._references > 0:
+            return
+        if _managers.get(manager.db_path) is manager:
+            del _managers[manager.db_path]
+    manager.close()
+
+
+def close_all():
+    """Fecha todos os gerenciadores compartilhados."""
+    with _managers_lock:
+        for manager in _managers.values():
+            manager.close()
+        _managers.clear()
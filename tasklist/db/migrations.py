@@ -0,0 +1,192 @@
+# db/migrations.py
+
+from typing import Callable, NamedTuple
+
+
+class Migration(NamedTuple):
+    """Uma etapa de evolução do esquema do banco de dados.
+
+    Args:
+        version (int): Versão do esquema após aplicar a etapa.
+        description (str): Descrição curta da mudança.
+        apply (callable): Função ``apply(conn)`` que executa a mudança.
+        transactional (bool, opcional): Com False, ``apply(connections)`` recebe o
+            gerenciador de conexões e controla as próprias transações (por
+            exemplo, ``rebuild_table`` em tabelas grandes). A etapa precisa poder
+            ser repetida do início se for interrompida.
+    """
+
+    version: int
+    description: str
+    apply: Callable
+    transactional: bool = True
+
+
+def schema_version(conn):
+    """Lê a versão do esquema gravada no banco (``PRAGMA user_version``).
+
+    Args:
+        conn (sqlite3.Connection): Conexão com o banco.
+
+    Returns:
+        int: Versão atual do esquema.
+    """
+    return conn.execute("PRAGMA user_version;").fetchone()[0]
+
+
+def migrate(connections, migrations):
+    """Aplica, em ordem, as migrações ainda não aplicadas ao banco.
+
+    Quando o esquema já está na última versão, a única consulta feita é a
+    leitura de ``PRAGMA user_version``. Cada migração roda em sua própria
+    transação, junto com a atualização da versão: se falhar, o banco permanece
+    na versão anterior. Migrações não transacionais gravam em várias transações
+    e só atualizam a versão ao terminar.
+
+    Args:
+        connections (ConnectionManager): Gerenciador de conexões do banco.
+        migrations (list): Migrações em qualquer ordem, com versões distintas.
+
+    Returns:
+        list: Migrações aplicadas nesta execução.
+    """
+    migrations = sorted(migrations, key=lambda migration: migration.version)
+    if not migrations:
+        return []
+    latest = migrations[-1].version
+
+    # Caminho rápido: esquema atualizado, nada a verificar
+    with connections.reader() as conn:
+        if schema_version(conn) >= latest:
+            return []
+
+    applied = []
+    for migration in migrations:
+        if not migration.transactional:
+            with connections.reader() as conn:
+                if schema_version(conn) >= migration.version:
+                    continue
+            migration.apply(connections)
+        with connections.writer() as conn:
+            # Relê a versão dentro da transação: outro processo pode ter migrado
+            if schema_version(conn) >= migration.version:
+                continue
+            if migration.transactional:
+                migration.apply(conn)
+            conn.execute(f"PRAGMA user_version = {int(migration.version)};")
+        applied.append(migration)
+    return applied
+
+
+def rebuild_table(connections, table, create_sql, columns, select_columns=None, batch_size=50_000):
+    """Recria uma tabela com nova definição, copiando as linhas em lotes.
+
+    Usado para mudanças que o ``ALTER TABLE`` do SQLite não suporta (trocar o tipo
+    ou as restrições de uma coluna, por exemplo). Cada lote de ``batch_size``
+    linhas é copiado em sua própria transação, de modo que as demais escritas
+    esperam no máximo um lote. Enquanto a cópia não termina, gatilhos temporários
+    repetem na nova tabela as escritas feitas na antiga.
+
+    Ao final, em uma única transação curta, a tabela antiga é substituída pela
+    nova, com os mesmos índices e gatilhos, e o contador do AUTOINCREMENT é
+    mantido (IDs excluídos não são reusados). Uma reconstrução interrompida
+    recomeça do início na próxima execução.
+
+    Deve ser chamada fora de uma transação, por uma migração com
+    ``transactional=False``. As colunas devem incluir a chave primária (rowid).
+
+    Args:
+        connections (ConnectionManager): Gerenciador de conexões do banco.
+        table (str): Nome da tabela a ser recriada.
+        create_sql (str): Comando CREATE TABLE da nova definição, usando
+            ``{table}`` no lugar do nome da tabela.
+        columns (list): Colunas da nova tabela que recebem os dados.
+        select_columns (list, opcional): Expressões da tabela antiga que geram
+            cada coluna. Por padrão, as mesmas colunas.
+        batch_size (int, opcional): Quantidade de linhas copiadas por transação.
+
+    Returns:
+        int: Quantidade de linhas copiadas em lotes.
+    """
+    new_table = f"{table}_rebuild"
+    column_list = ", ".join(columns)
+    select_list = ", ".join(select_columns or columns)
+    mirror = {kind: f"{table}_rebuild_{kind}" for kind in ("insert", "update", "delete")}
+    copy_row = f"""
+        INSERT OR REPLACE INTO {new_table} ({column_list})
+        SELECT {select_list} FROM {table} WHERE rowid = new.rowid;
+    """
+
+    with connections.writer() as conn:
+        # Restos de uma reconstrução interrompida
+        for trigger in mirror.values():
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger};")
+        conn.execute(f"DROP TABLE IF EXISTS {new_table};")
+        conn.execute(create_sql.format(table=new_table))
+        conn.execute(f"CREATE TRIGGER {mirror['insert']} AFTER INSERT ON {table} BEGIN {copy_row} END;")
+        conn.execute(f"""
+            CREATE TRIGGER {mirror['update']} AFTER UPDATE ON {table} BEGIN
+                DELETE FROM {new_table} WHERE rowid = old.rowid;
+                {copy_row}
+            END;
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER {mirror['delete']} AFTER DELETE ON {table} BEGIN
+                DELETE FROM {new_table} WHERE rowid = old.rowid;
+            END;
+        """)
+        # Linhas gravadas depois daqui chegam à nova tabela pelos gatilhos
+        first, last = conn.execute(f"SELECT min(rowid), max(rowid) FROM {table};").fetchone()
+
+    copied = 0
+    if first is not None:
+        # Lotes por intervalo de rowid: cada comando começa direto na posição do lote
+        bound = f"""
+            SELECT max(rowid) FROM (
+                SELECT rowid FROM {table} WHERE rowid > ? AND rowid <= ? ORDER BY rowid LIMIT ?
+            );
+        """
+        insert = f"""
+            INSERT OR IGNORE INTO {new_table} ({column_list})
+            SELECT {select_list} FROM {table} WHERE rowid > ? AND rowid <= ?;
+        """
+        low = first - 1
+        while True:
+            with connections.writer() as conn:
+                high = conn.execute(bound, (low, last, batch_size)).fetchone()[0]
+                if high is None:
+                    break
+                copied += conn.execute(insert, (low, high)).rowcount
+            low = high
+
+    with connections.writer() as conn:
+        schema = conn.execute(
+            f"""
+            SELECT sql FROM sqlite_master
+            WHERE tbl_name = ? AND type IN ('index', 'trigger') AND sql IS NOT NULL
+              AND name NOT IN ({", ".join("?" * len(mirror))})
+            ORDER BY type, rowid;
+            """,
+            (table, *mirror.values()),
+        ).fetchall()
+        has_sequence = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_sequence';"
+        ).fetchone()
+        sequence = None
+        if has_sequence:
+            sequence = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = ?;", (table,)).fetchone()
+        for trigger in mirror.values():
+            conn.execute(f"DROP TRIGGER {trigger};")
+        conn.execute(f"DROP TABLE {table};")
+        conn.execute(f"ALTER TABLE {new_table} RENAME TO {table};")
+        # Índices (type 'index') antes dos gatilhos, na ordem em que foram criados
+        for (sql,) in schema:
+            conn.execute(sql)
+        if sequence is not None:
+            updated = conn.execute(
+                "UPDATE sqlite_sequence SET seq = max(seq, ?) WHERE name = ?;", (sequence[0], table)
+            ).rowcount
+            if not updated:
+                conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?);", (table, sequence[0]))
+    return copied
+
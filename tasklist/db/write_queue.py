@@ -0,0 +1,219 @@
+# db/write_queue.py
+
+import queue
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+
+# Marca de encerramento da thread de escrita
+_STOP = object()
+
+
+def is_busy_error(exc):
+    """Indica se o erro do SQLite é de banco bloqueado por outra conexão.
+
+    Args:
+        exc (Exception): Erro recebido.
+
+    Returns:
+        bool: True para "database is locked" e "database is busy".
+    """
+    message = str(exc).lower()
+    return isinstance(exc, sqlite3.OperationalError) and ("locked" in message or "busy" in message)
+
+
+class WriteQueue:
+    """Fila de escritas gravadas em grupo (group commit) por uma thread dedicada.
+
+    As escritas enviadas por várias threads são acumuladas por até ``max_delay``
+    segundos (ou ``max_batch`` operações) e confirmadas em uma única transação.
+    Cada operação roda dentro de um SAVEPOINT: se falhar, apenas ela é desfeita e
+    as demais do grupo são confirmadas normalmente.
+
+    Quando outro processo mantém o banco bloqueado por mais tempo que o
+    ``busy_timeout`` das conexões, o grupo inteiro é tentado de novo após uma
+    espera crescente (com variação aleatória), até ``retries`` vezes.
+
+    Args:
+        connections (ConnectionManager): Gerenciador de conexões do banco.
+        max_delay (float): Tempo máximo, em segundos, de espera por mais escritas.
+        max_batch (int): Quantidade máxima de operações por transação.
+        retries (int): Novas tentativas de um grupo com o banco bloqueado.
+        backoff (float): Espera, em segundos, antes da primeira nova tentativa.
+    """
+
+    def __init__(self, connections, max_delay=0.001, max_batch=500, retries=8, backoff=0.02):
+        self.connections = connections
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.retries = retries
+        self.backoff = backoff
+        # Contadores: transações, operações e novas tentativas
+        self.groups = 0
+        self.operations = 0
+        self.retried = 0
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="tasklist-write-queue", daemon=True)
+        self._thread.start()
+
+    def submit(self, operation, *args, **kwargs):
+        """Agenda uma escrita.
+
+        ``operation`` é chamada na thread da fila, dentro da transação do grupo.
+        Métodos do ``TaskModel`` podem ser usados diretamente: o ``writer()`` do
+        gerenciador reaproveita a transação já aberta.
+
+        Args:
+            operation (callable): Função que faz a escrita.
+            *args: Argumentos posicionais da função.
+            **kwargs: Argumentos nomeados da função.
+
+        Returns:
+            concurrent.futures.Future: Resultado da função, disponível após a
+                confirmação da transação.
+
+        Raises:
+            RuntimeError: Se a fila já foi fechada.
+        """
+        return self._submit(operation, args, kwargs, counted=False)
+
+    def execute(self, operation, *args, **kwargs):
+        """Agenda uma escrita e aguarda a confirmação do grupo em que foi incluída.
+
+        Além do resultado, informa quantas escritas foram confirmadas na mesma
+        transação, para quem precisa saber se outras escritas a acompanharam
+        (o cache do controlador, por exemplo).
+
+        Args:
+            operation (callable): Função que faz a escrita.
+            *args: Argumentos posicionais da função.
+            **kwargs: Argumentos nomeados da função.
+
+        Returns:
+            tuple: Resultado da função e quantidade de escritas do grupo.
+
+        Raises:
+            RuntimeError: Se a fila já foi fechada.
+        """
+        return self._submit(operation, args, kwargs, counted=True).result()
+
+    def _submit(self, operation, args, kwargs, counted):
+        """Coloca uma escrita na fila.
+
+        Args:
+            counted (bool): Se o resultado inclui a quantidade de escritas do grupo.
+
+        Returns:
+            concurrent.futures.Future: Resultado da escrita.
+        """
+        if self._closed:
+            raise RuntimeError("A fila de escrita está fechada.")
+        future = Future()
+        self._queue.put((future, operation, args, kwargs, counted))
+        return future
+
+    def flush(self):
+        """Aguarda a gravação de todas as escritas enviadas até aqui."""
+        self.submit(lambda: None).result()
+
+    def close(self):
+        """Grava as escritas pendentes e encerra a thread da fila."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def stats(self):
+        """Retorna os contadores da fila.
+
+        Returns:
+            dict: Transações, operações, média de operações por transação e novas tentativas.
+        """
+        return {
+            "groups": self.groups,
+            "operations": self.operations,
+            "ops_per_group": self.operations / self.groups if self.groups else 0.0,
+            "retries": self.retried,
+        }
+
+    def _run(self):
+        """Laço da thread de escrita: monta grupos e os grava."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit(batch)
+
+    def _commit(self, batch):
+        """Grava um grupo de escritas em uma transação, tentando de novo se bloqueado.
+
+        Args:
+            batch (list): Tuplas (future, operação, args, kwargs, counted).
+        """
+        # Descarta as escritas canceladas antes de começar
+        batch = [item for item in batch if item[0].set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        for attempt in range(self.retries + 1):
+            try:
+                with self.connections.writer() as conn:
+                    outcomes = [self._apply(conn, *item[1:4]) for item in batch]
+            except Exception as exc:
+                if is_busy_error(exc) and attempt < self.retries:
+                    self.retried += 1
+                    time.sleep(self.backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+                    continue
+                for future, *_ in batch:
+                    future.set_exception(exc)
+                return
+            break
+
+        self.groups += 1
+        self.operations += len(batch)
+        for (future, *_, counted), (ok, value) in zip(batch, outcomes):
+            if not ok:
+                future.set_exception(value)
+            elif counted:
+                future.set_result((value, len(batch)))
+            else:
+                future.set_result(value)
+
+    @staticmethod
+    def _apply(conn, operation, args, kwargs):
+        """Executa uma operação do grupo dentro de um SAVEPOINT.
+
+        Returns:
+            tuple: (True, resultado) ou (False, exceção) se a operação falhou.
+
+        Raises:
+            sqlite3.OperationalError: Se o banco estiver bloqueado (o grupo é repetido).
+        """
+        conn.execute("SAVEPOINT write_op;")
+        try:
+            result = operation(*args, **kwargs)
+        except Exception as exc:
+            conn.execute("ROLLBACK TO write_op;")
+            conn.execute("RELEASE write_op;")
+            if is_busy_error(exc):
+                raise
+            return False, exc
+        conn.execute("RELEASE write_op;")
+        return True, result
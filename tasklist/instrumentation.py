@@ -0,0 +1,313 @@
+# instrumentation.py
+"""Instrumentação opcional dos caminhos críticos do aplicativo.
+
+Desativada por padrão. Para ativar, defina a variável de ambiente
+``TASKLIST_PROFILE=1`` (ou chame ``enable()`` antes de importar o modelo, o
+controlador e as views). Variáveis adicionais:
+
+- ``TASKLIST_PROFILE_DUMP``: intervalo, em segundos, entre gravações periódicas;
+- ``TASKLIST_PROFILE_FILE``: arquivo que recebe as gravações (uma linha JSON por
+  gravação). Sem ele, as estatísticas vão para a saída de erro.
+
+Quando desativada, ``instrumented`` devolve a própria função decorada, sem
+nenhum invólucro: o custo é zero.
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+
+# Limites superiores, em microssegundos, das faixas do histograma de latência
+BUCKETS_US = (10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 1_000_000)
+
+# Intervalo, em instruções da VM do SQLite, entre chamadas do contador de passos
+PROGRESS_STEPS = 100
+
+ENABLED = os.environ.get("TASKLIST_PROFILE", "").lower() in ("1", "true", "yes", "on")
+
+_lock = threading.Lock()
+_stats = {}
+_local = threading.local()
+_dumper = None
+# Bytes enviados aos clientes pelas páginas observadas (watch_page)
+_sent_bytes = 0
+
+
+class OperationStats:
+    """Contadores de uma operação instrumentada."""
+
+    __slots__ = ("count", "errors", "total", "min", "max", "rows", "steps", "bytes", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.rows = 0
+        self.steps = 0
+        self.bytes = 0
+        self.histogram = [0] * (len(BUCKETS_US) + 1)
+
+    def record(self, elapsed, rows, steps, failed, size=0):
+        """Acrescenta uma execução aos contadores."""
+        self.count += 1
+        self.errors += failed
+        self.total += elapsed
+        self.min = elapsed if self.min is None else min(self.min, elapsed)
+        self.max = max(self.max, elapsed)
+        self.rows += rows
+        self.steps += steps
+        self.bytes += size
+        micros = elapsed * 1e6
+        for index, limit in enumerate(BUCKETS_US):
+            if micros <= limit:
+                break
+        else:
+            index = len(BUCKETS_US)
+        self.histogram[index] += 1
+
+    def percentile(self, fraction):
+        """Estima um percentil pelo limite superior da faixa do histograma, em ms."""
+        target = self.count * fraction
+        seen = 0
+        for index, amount in enumerate(self.histogram):
+            seen += amount
+            if amount and seen >= target:
+                limit = BUCKETS_US[index] if index < len(BUCKETS_US) else self.max * 1e6
+                return min(limit / 1e3, self.max * 1e3)
+        return None
+
+    def as_dict(self):
+        """Converte os contadores em um dicionário serializável."""
+        labels = [f"<={limit}us" for limit in BUCKETS_US] + [f">{BUCKETS_US[-1]}us"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": self.total * 1e3,
+            "mean_ms": self.total / self.count * 1e3 if self.count else None,
+            "min_ms": self.min * 1e3 if self.min is not None else None,
+            "max_ms": self.max * 1e3,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "rows_returned": self.rows,
+            "sqlite_steps": self.steps,
+            "bytes_sent": self.bytes,
+            "histogram": {label: amount for label, amount in zip(labels, self.histogram) if amount},
+        }
+
+
+def enable():
+    """Ativa a instrumentação para os módulos importados a partir daqui."""
+    global ENABLED
+    ENABLED = True
+
+
+def count_rows(result):
+    """Quantidade de linhas devolvidas por uma operação, pelo tipo do resultado.
+
+    Listas e tuplas de registros contam seus itens; um registro isolado conta 1;
+    números, dicionários e ``None`` contam 0.
+    """
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, tuple) and hasattr(result, "_fields"):
+        return 1
+    return 0
+
+
+def _steps():
+    """Instruções da VM do SQLite executadas pela thread atual (aproximado)."""
+    return getattr(_local, "steps", 0)
+
+
+def _progress():
+    """Contador de passos instalado nas conexões (``set_progress_handler``)."""
+    _local.steps = getattr(_local, "steps", 0) + PROGRESS_STEPS
+    return 0
+
+
+def watch_connection(conn):
+    """Conta o trabalho do SQLite feito por uma conexão, se a instrumentação estiver ativa.
+
+    O Python não expõe quantas linhas cada comando percorreu; as instruções
+    executadas pela VM do SQLite são usadas como aproximação.
+
+    Args:
+        conn (sqlite3.Connection): Conexão a ser observada.
+    """
+    if ENABLED:
+        conn.set_progress_handler(_progress, PROGRESS_STEPS)
+
+
+def watch_page(page):
+    """Conta os bytes enviados ao cliente por uma página Flet, se a instrumentação estiver ativa.
+
+    O Flet não expõe o tamanho das mensagens: o envio de comandos da conexão
+    da página (atributo interno) é envolvido para somar o tamanho, em JSON, dos
+    comandos enviados. O valor é aproximado, e nada é contado se a página não
+    tiver esse atributo.
+
+    Args:
+        page (ft.Page): Página a ser observada.
+    """
+    if not ENABLED:
+        return
+    conn = getattr(page, "_Page__conn", None)
+    send = getattr(conn, "send_commands", None)
+    if send is None or getattr(send, "watched", False):
+        return
+
+    def send_commands(session_id, commands):
+        global _sent_bytes
+        size = len(json.dumps(commands, default=vars))
+        with _lock:
+            _sent_bytes += size
+        return send(session_id, commands)
+
+    send_commands.watched = True
+    conn.send_commands = send_commands
+
+
+def sent_bytes():
+    """Total aproximado de bytes enviados pelas páginas observadas com ``watch_page``."""
+    return _sent_bytes
+
+
+def record(name, elapsed, rows=0, steps=0, failed=False, size=0):
+    """Registra uma execução de uma operação.
+
+    Args:
+        name (str): Nome da operação.
+        elapsed (float): Duração, em segundos.
+        rows (int, opcional): Linhas devolvidas.
+        steps (int, opcional): Instruções do SQLite executadas.
+        failed (bool, opcional): Se a operação terminou com exceção.
+        size (int, opcional): Bytes enviados ao cliente.
+    """
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = OperationStats()
+        stats.record(elapsed, rows, steps, failed, size)
+
+
+def instrumented(func=None, *, name=None, rows=count_rows):
+    """Decorador que mede a latência de uma função ou corrotina.
+
+    Sem instrumentação ativa no momento da decoração, devolve a função original.
+
+    Args:
+        func (callable): Função decorada.
+        name (str, opcional): Nome da operação; por padrão, o ``__qualname__``.
+        rows (callable, opcional): Calcula as linhas devolvidas a partir do resultado.
+
+    Returns:
+        callable: Função instrumentada (ou a original).
+    """
+    if func is None:
+        return functools.partial(instrumented, name=name, rows=rows)
+    if not ENABLED:
+        return func
+    label = name or func.__qualname__
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = failed = None
+            try:
+                result = await func(*args, **kwargs)
+                return result
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                record(label, time.perf_counter() - start, rows(result), 0, bool(failed))
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        steps = _steps()
+        start = time.perf_counter()
+        result = failed = None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            record(label, time.perf_counter() - start, rows(result), _steps() - steps, bool(failed))
+
+    return wrapper
+
+
+def stats():
+    """Retorna as estatísticas acumuladas de cada operação.
+
+    Returns:
+        dict: Nome da operação -> contagens, latências (ms), histograma e linhas.
+    """
+    with _lock:
+        return {name: value.as_dict() for name, value in sorted(_stats.items())}
+
+
+def reset():
+    """Zera as estatísticas acumuladas."""
+    with _lock:
+        _stats.clear()
+
+
+def dump(path=None):
+    """Grava as estatísticas atuais como uma linha JSON.
+
+    Args:
+        path (str, opcional): Arquivo de destino (acrescentado). Por padrão,
+            ``TASKLIST_PROFILE_FILE`` ou a saída de erro.
+    """
+    line = json.dumps({"timestamp": time.time(), "operations": stats()}, ensure_ascii=False)
+    path = path or os.environ.get("TASKLIST_PROFILE_FILE")
+    if path:
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+    else:
+        print(line, file=sys.stderr)
+
+
+def start_periodic_dump(interval, path=None):
+    """Grava as estatísticas a cada ``interval`` segundos, em uma thread de fundo.
+
+    Args:
+        interval (float): Intervalo entre gravações, em segundos.
+        path (str, opcional): Arquivo de destino (ver ``dump``).
+
+    Returns:
+        threading.Event: Evento que interrompe as gravações quando acionado.
+    """
+    global _dumper
+    if _dumper is not None:
+        return _dumper
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(interval):
+            dump(path)
+
+    threading.Thread(target=loop, name="tasklist-profile-dump", daemon=True).start()
+    _dumper = stop
+    return stop
+
+
+if ENABLED:
+    # Gravação final ao encerrar e, se configurada, gravação periódica
+    atexit.register(dump)
+    if os.environ.get("TASKLIST_PROFILE_DUMP"):
+        start_periodic_dump(float(os.environ["TASKLIST_PROFILE_DUMP"]))
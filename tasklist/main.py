@@ -1,7 +1,11 @@
 # main.py
 
+import asyncio
+
 import flet as ft
-from view.todo_view import TodoApp
+
+# Tarefas concluídas há mais dias que isso são movidas para o arquivo
+ARCHIVE_AFTER_DAYS = 30
 
 '''
 def main(page: ft.Page):
@@ -17,7 +21,48 @@ def main(page: ft.Page):
 '''
 
 
-def main(page: ft.Page):
+def build_skeleton():
+    """
+    Monta a tela exibida enquanto o aplicativo carrega.
+
+    Returns:
+        ft.Column: Título e indicador de carregamento.
+    """
+    return ft.Column(
+        [
+            ft.Row(
+                [ft.Text(value="Todos", theme_style=ft.TextThemeStyle.HEADLINE_MEDIUM)],
+                alignment=ft.MainAxisAlignment.CENTER,
+            ),
+            ft.ProgressBar(width=300),
+        ],
+        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+    )
+
+
+def load_app():
+    """
+    Importa as views e a camada de dados e abre o banco de dados.
+
+    Executada fora do loop de eventos, enquanto o esqueleto já está na tela.
+    Também inicia, em segundo plano, o arquivamento das tarefas concluídas e
+    o agendador que muda o status das tarefas nas datas de início e nos prazos.
+
+    Returns:
+        TodoApp: Aplicação pronta para ser adicionada à página.
+    """
+    from controller.archiver import start_archiver
+    from controller.status_scheduler import start_status_scheduler
+    from view.todo_view import TodoApp
+
+    app = TodoApp()
+    db_path = app.controller.controller.model.db_path
+    start_archiver(db_path, max_age_days=ARCHIVE_AFTER_DAYS)
+    start_status_scheduler(db_path)
+    return app
+
+
+async def main(page: ft.Page):
     """
     Configura a aplicação e inicia a interface.
     
@@ -29,11 +74,15 @@ def main(page: ft.Page):
     page.horizontal_alignment = ft.CrossAxisAlignment.CENTER  # Alinhamento horizontal.
     page.scroll = ft.ScrollMode.ADAPTIVE  # Configuração do scroll.
 
-    # instancia a aplicação de tarefas
-    #app = TodoApp()
+    # Primeiro quadro: exibido antes de importar as views e abrir o banco.
+    skeleton = build_skeleton()
+    page.add(skeleton)
 
-    # Cria a aplicação e adiciona à página.
-    page.add(TodoApp())
+    # Cria a aplicação e troca o esqueleto por ela; a primeira página de
+    # tarefas é carregada quando a aplicação é montada (did_mount).
+    app = await asyncio.to_thread(load_app)
+    page.controls.remove(skeleton)
+    page.add(app)
 
 
 # Ponto de entrada do aplicativo
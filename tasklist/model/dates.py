@@ -0,0 +1,65 @@
+# model/dates.py
+
+from datetime import date, datetime
+
+# Formatos aceitos na entrada de datas, além do ISO-8601
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d")
+
+
+def parse_date(value):
+    """Converte o valor informado pelo usuário em uma data.
+
+    Args:
+        value (str | date | None): Data em texto (AAAA-MM-DD, DD/MM/AAAA, ...) ou objeto date.
+
+    Returns:
+        date: Data convertida, ou None se o valor estiver vazio.
+
+    Raises:
+        ValueError: Se o texto não estiver em um formato reconhecido.
+
+    >>> parse_date("31/12/2024")
+    datetime.date(2024, 12, 31)
+    >>> parse_date("") is None
+    True
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    if not text:
+        return None
+    # Caminho rápido para o formato gravado no banco (AAAA-MM-DD)
+    if len(text) == 10 and text[4] == "-":
+        try:
+            return date.fromisoformat(text)
+        except ValueError:
+            pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            pass
+    try:
+        return datetime.fromisoformat(text).date()
+    except ValueError:
+        raise ValueError(f"Data inválida: {text}. Use AAAA-MM-DD ou DD/MM/AAAA.") from None
+
+
+def to_iso(value):
+    """Normaliza uma data para o formato gravado no banco (AAAA-MM-DD).
+
+    Args:
+        value (str | date | None): Data a ser normalizada.
+
+    Returns:
+        str: Data no formato ISO-8601, ou None se o valor estiver vazio.
+
+    >>> to_iso("01/02/2024")
+    '2024-02-01'
+    """
+    parsed = parse_date(value)
+    return parsed.isoformat() if parsed else None
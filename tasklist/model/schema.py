@@ -0,0 +1,293 @@
+# model/schema.py
+
+from db.migrations import Migration
+from model.dates import to_iso
+
+# Padrão GLOB de uma data já normalizada (AAAA-MM-DD)
+ISO_DATE_GLOB = "[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]"
+
+# Quantidade de linhas processadas por vez nas migrações de dados
+BATCH_SIZE = 10_000
+
+
+def create_tasks_table(conn):
+    """Cria a tabela de tarefas e os índices usados por filtros e ordenação.
+
+    Args:
+        conn (sqlite3.Connection): Conexão de escrita, dentro de uma transação.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            description TEXT NOT NULL,
+            start_date TEXT,
+            end_date TEXT,
+            status TEXT
+        );
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_start_date ON tasks (start_date);")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_end_date ON tasks (end_date);")
+
+
+def create_search_index(conn):
+    """Cria o índice FTS5 das descrições e os gatilhos que o mantêm sincronizado.
+
+    Args:
+        conn (sqlite3.Connection): Conexão de escrita, dentro de uma transação.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts';"
+    ).fetchone()
+    if exists:
+        return
+    # Tabela de conteúdo externo: o texto fica apenas em tasks
+    conn.execute("""
+        CREATE VIRTUAL TABLE tasks_fts USING fts5(
+            description,
+            content = 'tasks',
+            content_rowid = 'id',
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3 4'
+        );
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts (rowid, description) VALUES (new.id, new.description);
+        END;
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, description) VALUES ('delete', old.id, old.description);
+        END;
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF description ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, description) VALUES ('delete', old.id, old.description);
+            INSERT INTO tasks_fts (rowid, description) VALUES (new.id, new.description);
+        END;
+    """)
+    # Indexa as tarefas que já existiam antes da busca textual
+    conn.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild');")
+
+
+def normalize_dates(conn):
+    """Converte as datas gravadas em texto livre para AAAA-MM-DD, em lotes.
+
+    Datas vazias passam a ser nulas. Datas que não puderem ser interpretadas
+    são mantidas como estão, para não perder informação.
+
+    Args:
+        conn (sqlite3.Connection): Conexão de escrita, dentro de uma transação.
+    """
+    last_id = 0
+    invalid = 0
+    while True:
+        rows = conn.execute(f"""
+            SELECT id, start_date, end_date FROM tasks
+            WHERE id > ? AND (start_date NOT GLOB '{ISO_DATE_GLOB}' OR end_date NOT GLOB '{ISO_DATE_GLOB}')
+            ORDER BY id
+            LIMIT ?;
+        """, (last_id, BATCH_SIZE)).fetchall()
+        if not rows:
+            break
+        changes = []
+        for task_id, start_date, end_date in rows:
+            normalized = []
+            for value in (start_date, end_date):
+                try:
+                    normalized.append(to_iso(value))
+                except ValueError:
+                    normalized.append(value)
+                    invalid += 1
+            changes.append((*normalized, task_id))
+        conn.executemany("UPDATE tasks SET start_date = ?, end_date = ? WHERE id = ?;", changes)
+        last_id = rows[-1][0]
+    if invalid:
+        print(f"{invalid} data(s) inválida(s) mantida(s) sem conversão.")
+
+
+def initial_schema(conn):
+    """Versão 1: tabela de tarefas, índices, busca textual e datas normalizadas.
+
+    Todas as etapas são idempotentes, então também servem para adotar bancos
+    criados antes do controle de versões.
+    """
+    create_tasks_table(conn)
+    create_search_index(conn)
+    normalize_dates(conn)
+
+
+def archive_schema(conn):
+    """Versão 2: data de conclusão das tarefas e tabela de tarefas arquivadas.
+
+    ``completed_at`` é mantida por gatilhos: recebe o instante (UTC) em que a
+    tarefa passou a "Concluída" e volta a ser nula se ela for reaberta. As
+    tarefas concluídas existentes recebem o instante da migração.
+    """
+    conn.execute("ALTER TABLE tasks ADD COLUMN completed_at TEXT;")
+    conn.execute("UPDATE tasks SET completed_at = datetime('now') WHERE status = 'Concluída';")
+    conn.execute("""
+        CREATE INDEX idx_tasks_completed_at ON tasks (completed_at)
+        WHERE completed_at IS NOT NULL;
+    """)
+    conn.execute("""
+        CREATE TRIGGER tasks_completed_at_insert AFTER INSERT ON tasks
+        WHEN new.status = 'Concluída' BEGIN
+            UPDATE tasks SET completed_at = datetime('now') WHERE id = new.id;
+        END;
+    """)
+    conn.execute("""
+        CREATE TRIGGER tasks_completed_at_update AFTER UPDATE OF status ON tasks
+        WHEN new.status IS NOT old.status BEGIN
+            UPDATE tasks
+            SET completed_at = CASE WHEN new.status = 'Concluída' THEN datetime('now') END
+            WHERE id = new.id;
+        END;
+    """)
+
+    # Mesmos IDs da tabela principal (AUTOINCREMENT garante que não são reusados)
+    conn.execute("""
+        CREATE TABLE tasks_archive (
+            id INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            start_date TEXT,
+            end_date TEXT,
+            status TEXT,
+            completed_at TEXT,
+            archived_at TEXT NOT NULL
+        );
+    """)
+    conn.execute("""
+        CREATE VIRTUAL TABLE tasks_archive_fts USING fts5(
+            description,
+            content = 'tasks_archive',
+            content_rowid = 'id',
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3 4'
+        );
+    """)
+    conn.execute("""
+        CREATE TRIGGER tasks_archive_fts_insert AFTER INSERT ON tasks_archive BEGIN
+            INSERT INTO tasks_archive_fts (rowid, description) VALUES (new.id, new.description);
+        END;
+    """)
+    conn.execute("""
+        CREATE TRIGGER tasks_archive_fts_delete AFTER DELETE ON tasks_archive BEGIN
+            INSERT INTO tasks_archive_fts (tasks_archive_fts, rowid, description)
+            VALUES ('delete', old.id, old.description);
+        END;
+    """)
+
+
+def summary_schema(conn):
+    """Versão 3: tabelas de resumo mantidas por gatilhos.
+
+    ``task_status_counts`` guarda a quantidade de tarefas por status, na tabela
+    principal e no arquivo (status nulo é gravado como ''). ``task_daily_stats``
+    guarda, por dia (UTC), as tarefas criadas e concluídas. Assim, contadores e
+    estatísticas são lidos sem percorrer as tarefas.
+
+    Como as tarefas não têm data de criação, o histórico de criadas começa na
+    migração; o de concluídas é preenchido a partir de ``completed_at``.
+    """
+    conn.execute("""
+        CREATE TABLE task_status_counts (
+            status TEXT PRIMARY KEY,
+            count INTEGER NOT NULL DEFAULT 0,
+            archived INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID;
+    """)
+    conn.execute("""
+        CREATE TABLE task_daily_stats (
+            day TEXT PRIMARY KEY,
+            created INTEGER NOT NULL DEFAULT 0,
+            completed INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID;
+    """)
+
+    conn.execute("""
+        INSERT INTO task_status_counts (status, count)
+        SELECT coalesce(status, ''), count(*) FROM tasks GROUP BY 1;
+    """)
+    conn.execute("""
+        INSERT INTO task_status_counts (status, archived)
+        SELECT coalesce(status, ''), count(*) FROM tasks_archive GROUP BY 1
+        ON CONFLICT (status) DO UPDATE SET archived = excluded.archived;
+    """)
+    conn.execute("""
+        INSERT INTO task_daily_stats (day, completed)
+        SELECT date(completed_at), count(*) FROM (
+            SELECT completed_at FROM tasks WHERE completed_at IS NOT NULL
+            UNION ALL
+            SELECT completed_at FROM tasks_archive WHERE completed_at IS NOT NULL
+        )
+        GROUP BY 1;
+    """)
+
+    # Tabela principal: contagem por status e tarefas criadas/concluídas no dia
+    conn.execute("""
+        CREATE TRIGGER task_summary_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO task_status_counts (status, count) VALUES (coalesce(new.status, ''), 1)
+            ON CONFLICT (status) DO UPDATE SET count = count + 1;
+            INSERT INTO task_daily_stats (day, created, completed)
+            VALUES (date('now'), 1, new.status IS 'Concluída')
+            ON CONFLICT (day) DO UPDATE
+            SET created = created + 1, completed = completed + excluded.completed;
+        END;
+    """)
+    conn.execute("""
+        CREATE TRIGGER task_summary_delete AFTER DELETE ON tasks BEGIN
+            UPDATE task_status_counts SET count = count - 1 WHERE status = coalesce(old.status, '');
+        END;
+    """)
+    conn.execute("""
+        CREATE TRIGGER task_summary_update AFTER UPDATE OF status ON tasks
+        WHEN new.status IS NOT old.status BEGIN
+            UPDATE task_status_counts SET count = count - 1 WHERE status = coalesce(old.status, '');
+            INSERT INTO task_status_counts (status, count) VALUES (coalesce(new.status, ''), 1)
+            ON CONFLICT (status) DO UPDATE SET count = count + 1;
+            INSERT INTO task_daily_stats (day, completed)
+            SELECT date('now'), 1 WHERE new.status IS 'Concluída'
+            ON CONFLICT (day) DO UPDATE SET completed = completed + 1;
+        END;
+    """)
+
+    # Arquivo: contagem por status (a tarefa sai da tabela principal pelo DELETE)
+    conn.execute("""
+        CREATE TRIGGER task_summary_archive_insert AFTER INSERT ON tasks_archive BEGIN
+            INSERT INTO task_status_counts (status, archived) VALUES (coalesce(new.status, ''), 1)
+            ON CONFLICT (status) DO UPDATE SET archived = archived + 1;
+        END;
+    """)
+    conn.execute("""
+        CREATE TRIGGER task_summary_archive_delete AFTER DELETE ON tasks_archive BEGIN
+            UPDATE task_status_counts SET archived = archived - 1 WHERE status = coalesce(old.status, '');
+        END;
+    """)
+
+
+def status_schedule_schema(conn):
+    """Versão 4: índices das próximas mudanças de status por data.
+
+    Índices parciais, apenas das tarefas que ainda podem mudar de status: as
+    pendentes pela data de início e as em aberto pelo prazo. Assim, buscar as
+    próximas mudanças, ou as já vencidas, percorre só as tarefas envolvidas.
+    """
+    conn.execute("""
+        CREATE INDEX idx_tasks_pending_start ON tasks (start_date)
+        WHERE status = 'Pendente';
+    """)
+    conn.execute("""
+        CREATE INDEX idx_tasks_open_end ON tasks (end_date)
+        WHERE status IN ('Pendente', 'Em Andamento');
+    """)
+
+
+# Migrações do esquema, em ordem de versão. Novas mudanças entram no fim da lista.
+MIGRATIONS = [
+    Migration(1, "Tabela de tarefas, índices, busca textual e datas normalizadas", initial_schema),
+    Migration(2, "Data de conclusão e tabela de tarefas arquivadas", archive_schema),
+    Migration(3, "Tabelas de resumo: tarefas por status e por dia", summary_schema),
+    Migration(4, "Índices das mudanças de status agendadas", status_schedule_schema),
+]
@@ -1,38 +1,84 @@
 # model/task_model.py
 
-import sqlite3
 import os
+import sqlite3
+
+from db.connection import get_connection_manager, release_connection_manager
+from db.migrations import migrate
+from instrumentation import instrumented
+from model.schema import MIGRATIONS
+from model.task_record import TaskRecord
+
+# Status possíveis de uma tarefa
+STATUS_PENDING = "Pendente"
+STATUS_IN_PROGRESS = "Em Andamento"
+STATUS_COMPLETED = "Concluída"
+STATUS_OVERDUE = "Atrasada"
+
+# Colunas retornadas nas consultas de tarefas
+COLUMNS = "id, description, start_date, end_date, status"
+
+# Busca textual em uma tabela de tarefas (principal ou arquivo) pelo seu índice FTS5
+SEARCH_QUERY = """
+    SELECT {table}.id, {table}.description, {table}.start_date, {table}.end_date, {table}.status
+    FROM {table}_fts
+    JOIN {table} ON {table}.id = {table}_fts.rowid
+    WHERE {table}_fts MATCH ?
+    ORDER BY {table}_fts.rowid DESC
+    LIMIT ?
+"""
+
+# Colunas aceitas para ordenação em get_tasks
+ORDER_COLUMNS = ("id", "description", "start_date", "end_date", "status")
 
 class TaskModel:
     """Modelo para gerenciar operações de banco de dados da lista de tarefas."""
 
-    def __init__(self):
-        """Inicializa a conexão com o banco de dados e cria a tabela se necessário."""
+    def __init__(self, db_path="taskslist.db", connections=None):
+        """Inicializa a conexão com o banco de dados e cria a tabela se necessário.
+
+        Args:
+            db_path (str, opcional): Caminho do banco de dados.
+            connections (ConnectionManager, opcional): Gerenciador de conexões
+                a ser usado. Por padrão, usa o gerenciador compartilhado do banco.
+        """
         # Caminho do banco de dados
-        self.db_path = "taskslist.db"
+        self.db_path = db_path
+        # Verifica se o arquivo existe antes de abrir as conexões, que o criam
+        created = not os.path.exists(self.db_path)
+        # Conexões persistentes (uma de escrita e um pool de leitura)
+        self.connections = connections or get_connection_manager(self.db_path)
+        # Só o gerenciador compartilhado é devolvido ao fechar; o recebido pertence a quem o criou
+        self._shared = connections is None
         # Inicializa o banco de dados
-        self.initialize_database()
-
-    def initialize_database(self):
-        """Verifica e cria o banco de dados e a tabela de tarefas, se ainda não existirem."""
-        # Verifica se o arquivo do banco de dados existe
-        if not os.path.exists(self.db_path):
-            # Conecta e cria a tabela
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS tasks (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        description TEXT NOT NULL,
-                        start_date TEXT,
-                        end_date TEXT,
-                        status TEXT
-                    );
-                """)
-                conn.commit()
-                print("Banco de dados criado com sucesso.")
-
-    def add_task(self, description, start_date=None, end_date=None, status="Pendente"):
+        self.initialize_database(created)
+
+    def initialize_database(self, created=False):
+        """Aplica as migrações pendentes do esquema do banco de dados.
+
+        Se o esquema já estiver atualizado, apenas a versão gravada no banco é lida.
+
+        Args:
+            created (bool, opcional): Indica se o arquivo do banco acabou de ser criado.
+        """
+        applied = migrate(self.connections, MIGRATIONS)
+        if created:
+            print("Banco de dados criado com sucesso.")
+        elif applied:
+            print(f"Banco de dados atualizado para a versão {applied[-1].version}.")
+
+    def close(self):
+        """Libera as conexões usadas pelo modelo.
+
+        As conexões compartilhadas só são fechadas quando o último modelo do
+        mesmo banco é fechado.
+        """
+        if self._shared:
+            self._shared = False
+            release_connection_manager(self.connections)
+
+    @instrumented
+    def add_task(self, description, start_date=None, end_date=None, status=STATUS_PENDING):
         """Adiciona uma nova tarefa ao banco de dados.
 
         Args:
@@ -40,32 +86,551 @@ class TaskModel:
             start_date (str, opcional): Data de início da tarefa.
             end_date (str, opcional): Data de conclusão da tarefa.
             status (str): Status da tarefa.
+
+        Returns:
+            TaskRecord: Tarefa inserida, incluindo o ID gerado.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+        with self.connections.writer() as conn:
+            row = conn.execute(f"""
                 INSERT INTO tasks (description, start_date, end_date, status)
-                VALUES (?, ?, ?, ?);
-            """, (description, start_date, end_date, status))
-            conn.commit()
+                VALUES (?, ?, ?, ?)
+                RETURNING {COLUMNS};
+            """, (description, start_date, end_date, status)).fetchone()
+        return TaskRecord._make(row)
+
+    @instrumented
+    def add_tasks(self, tasks):
+        """Adiciona várias tarefas em uma única transação.
+
+        Args:
+            tasks (iterable): Tuplas (descrição, data de início, data de conclusão, status).
+
+        Returns:
+            list: IDs gerados, na ordem das tarefas recebidas.
+        """
+        # executemany não devolve as linhas do RETURNING: um comando por tarefa, na mesma transação
+        query = """
+            INSERT INTO tasks (description, start_date, end_date, status)
+            VALUES (?, ?, ?, ?)
+            RETURNING id;
+        """
+        with self.connections.writer() as conn:
+            return [conn.execute(query, task).fetchone()[0] for task in tasks]
+
+    @instrumented
+    def get_tasks(self, status=None, start_after=None, end_before=None, text=None,
+                  order_by="id", limit=None, cursor=None):
+        """Obtém tarefas do banco de dados, com filtros, ordenação e paginação.
+
+        A paginação é feita por chave (keyset): ``cursor`` é o valor retornado por
+        ``cursor_for`` para a última tarefa da página anterior, então cada página
+        custa o mesmo independentemente da posição na tabela.
+
+        Args:
+            status (str | tuple, opcional): Filtra pelo status da tarefa; com uma
+                tupla, aceita qualquer um dos status informados.
+            start_after (str, opcional): Filtra tarefas com início a partir desta data.
+            end_before (str, opcional): Filtra tarefas com conclusão até esta data.
+            text (str, opcional): Filtra tarefas cuja descrição contém o texto.
+            order_by (str, opcional): Coluna de ordenação; prefixo "-" para ordem decrescente.
+            limit (int, opcional): Quantidade máxima de tarefas retornadas.
+            cursor (tuple, opcional): Posição da última tarefa da página anterior.
+
+        Returns:
+            list: Lista de TaskRecord.
+        """
+        query, params = self._select_query(status, start_after, end_before, text, order_by, limit, cursor)
+        with self.connections.reader() as conn:
+            db_cursor = conn.cursor()
+            db_cursor.row_factory = TaskRecord.row_factory
+            return db_cursor.execute(query, params).fetchall()
+
+    @instrumented
+    def get_task(self, task_id):
+        """Obtém uma tarefa pelo ID.
+
+        Args:
+            task_id (int): ID da tarefa.
+
+        Returns:
+            TaskRecord: Tarefa encontrada, ou None se o ID não existir.
+        """
+        with self.connections.reader() as conn:
+            row = conn.execute(f"SELECT {COLUMNS} FROM tasks WHERE id = ?;", (task_id,)).fetchone()
+        return TaskRecord._make(row) if row else None
+
+    @instrumented
+    def data_version(self):
+        """Identifica o estado atual dos dados, para detectar escritas de outros processos.
+
+        Returns:
+            tuple: Valor que muda sempre que os dados do banco forem alterados.
+        """
+        return self.connections.data_version()
+
+    def iter_tasks(self, batch_size=1000, **filters):
+        """Percorre as tarefas sem carregar a tabela inteira em memória.
+
+        As linhas são lidas do cursor do SQLite em lotes de ``batch_size``.
+        A conexão de leitura fica reservada até o gerador ser esgotado ou fechado.
+
+        Args:
+            batch_size (int, opcional): Quantidade de linhas lidas por vez.
+            **filters: Os mesmos filtros aceitos por ``get_tasks``.
+
+        Yields:
+            TaskRecord: Cada tarefa encontrada.
+        """
+        query, params = self._select_query(**filters)
+        with self.connections.reader() as conn:
+            db_cursor = conn.cursor()
+            db_cursor.row_factory = TaskRecord.row_factory
+            db_cursor.execute(query, params)
+            try:
+                while True:
+                    batch = db_cursor.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    yield from batch
+            finally:
+                db_cursor.close()
+
+    def _select_query(self, status=None, start_after=None, end_before=None, text=None,
+                      order_by="id", limit=None, cursor=None):
+        """Monta a consulta de tarefas usada por ``get_tasks`` e ``iter_tasks``.
+
+        Returns:
+            tuple: Comando SQL e seus parâmetros.
+        """
+        column, descending = self._order_column(order_by)
+        where = []
+        params = []
+
+        if isinstance(status, (tuple, list)):
+            where.append(f"status IN ({', '.join('?' * len(status))})")
+            params.extend(status)
+        elif status is not None:
+            where.append("status = ?")
+            params.append(status)
+        if start_after is not None:
+            where.append("start_date >= ?")
+            params.append(start_after)
+        if end_before is not None:
+            where.append("end_date <= ?")
+            params.append(end_before)
+        if text:
+            escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            where.append("description LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        if cursor is not None:
+            clause, cursor_params = self._cursor_clause(column, descending, cursor)
+            where.append(clause)
+            params.extend(cursor_params)
+
+        direction = "DESC" if descending else "ASC"
+        query = f"SELECT {COLUMNS} FROM tasks"
+        if where:
+            query += " WHERE " + " AND ".join(f"({clause})" for clause in where)
+        if column == "id":
+            query += f" ORDER BY id {direction}"
+        else:
+            query += f" ORDER BY {column} {direction}, id {direction}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return query + ";", params
+
+    @instrumented
+    def get_tasks_due_between(self, first_day, last_day, limit=None):
+        """Obtém as tarefas em aberto com prazo (data de conclusão) no intervalo.
+
+        Args:
+            first_day (str): Primeiro dia do intervalo (AAAA-MM-DD).
+            last_day (str): Último dia do intervalo (AAAA-MM-DD), inclusive.
+            limit (int, opcional): Quantidade máxima de tarefas retornadas.
+
+        Returns:
+            list: Lista de TaskRecord, ordenada pelo prazo.
+        """
+        return self._select_open(
+            "end_date BETWEEN ? AND ?", [first_day, last_day], "end_date", limit
+        )
+
+    @instrumented
+    def get_overdue_tasks(self, today, limit=None):
+        """Obtém as tarefas em aberto cujo prazo é anterior ao dia informado.
+
+        Args:
+            today (str): Dia de referência (AAAA-MM-DD).
+            limit (int, opcional): Quantidade máxima de tarefas retornadas.
+
+        Returns:
+            list: Lista de TaskRecord, ordenada pelo prazo.
+        """
+        return self._select_open("end_date < ?", [today], "end_date", limit)
+
+    @instrumented
+    def get_tasks_in_progress(self, today, limit=None):
+        """Obtém as tarefas em aberto já iniciadas e ainda dentro do prazo no dia informado.
+
+        Args:
+            today (str): Dia de referência (AAAA-MM-DD).
+            limit (int, opcional): Quantidade máxima de tarefas retornadas.
+
+        Returns:
+            list: Lista de TaskRecord, ordenada pela data de início.
+        """
+        return self._select_open(
+            "start_date <= ? AND (end_date IS NULL OR end_date >= ?)", [today, today], "start_date", limit
+        )
+
+    def _select_open(self, condition, params, order_column, limit):
+        """Executa uma consulta por datas restrita às tarefas não concluídas.
+
+        A condição usa apenas colunas indexadas, então o SQLite percorre somente o
+        trecho do índice de datas que atende ao intervalo.
+
+        Returns:
+            list: Lista de TaskRecord.
+        """
+        query = f"""
+            SELECT {COLUMNS} FROM tasks
+            WHERE ({condition}) AND status IS NOT '{STATUS_COMPLETED}'
+            ORDER BY {order_column}, id
+        """
+        params = list(params)
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self.connections.reader() as conn:
+            db_cursor = conn.cursor()
+            db_cursor.row_factory = TaskRecord.row_factory
+            return db_cursor.execute(query + ";", params).fetchall()
+
+    @instrumented
+    def get_status_transitions(self, today, limit=1000):
+        """Obtém as próximas datas em que tarefas em aberto mudam de status.
+
+        Uma tarefa pendente passa a "Em Andamento" na data de início, e uma tarefa
+        em aberto passa a "Atrasada" no dia seguinte ao prazo. As consultas
+        percorrem os índices parciais dessas tarefas (fixados com INDEXED BY, pois
+        sem ANALYZE o SQLite prefere o índice de status) e param no limite.
+
+        Args:
+            today (str): Dia de referência (AAAA-MM-DD); só datas posteriores são retornadas.
+            limit (int, opcional): Quantidade máxima de mudanças retornadas.
+
+        Returns:
+            list: Tuplas (dia, id da tarefa), ordenadas pelo dia.
+        """
+        with self.connections.reader() as conn:
+            starts = conn.execute(f"""
+                SELECT start_date, id FROM tasks INDEXED BY idx_tasks_pending_start
+                WHERE status = '{STATUS_PENDING}' AND start_date > ?
+                ORDER BY start_date
+                LIMIT ?;
+            """, (today, limit)).fetchall()
+            deadlines = conn.execute(f"""
+                SELECT date(end_date, '+1 day'), id FROM tasks INDEXED BY idx_tasks_open_end
+                WHERE status IN ('{STATUS_PENDING}', '{STATUS_IN_PROGRESS}') AND end_date >= ?
+                ORDER BY end_date
+                LIMIT ?;
+            """, (today, limit)).fetchall()
+        # Datas inválidas (mantidas sem conversão) não geram mudanças
+        transitions = [item for item in starts + deadlines if item[0] is not None]
+        transitions.sort()
+        return transitions[:limit]
+
+    @instrumented
+    def apply_due_statuses(self, today):
+        """Atualiza, em um único comando, o status das tarefas cujas datas já chegaram.
+
+        Segue as regras de ``TaskController.calculate_status``: tarefas em aberto
+        com prazo anterior a ``today`` ficam atrasadas, e tarefas pendentes já
+        iniciadas ficam em andamento. Só as tarefas vencidas são percorridas.
+
+        Args:
+            today (str): Dia de referência (AAAA-MM-DD).
+
+        Returns:
+            list: Tuplas (id, novo status) das tarefas alteradas.
+        """
+        with self.connections.writer() as conn:
+            return conn.execute(f"""
+                UPDATE tasks
+                SET status = CASE WHEN end_date < :today THEN '{STATUS_OVERDUE}' ELSE '{STATUS_IN_PROGRESS}' END
+                WHERE id IN (
+                    SELECT id FROM tasks INDEXED BY idx_tasks_pending_start
+                    WHERE status = '{STATUS_PENDING}' AND start_date <= :today
+                    UNION ALL
+                    SELECT id FROM tasks INDEXED BY idx_tasks_open_end
+                    WHERE status IN ('{STATUS_PENDING}', '{STATUS_IN_PROGRESS}') AND end_date < :today
+                )
+                RETURNING id, status;
+            """, {"today": today}).fetchall()
+
+    @instrumented
+    def search_tasks(self, query, limit=50, include_archived=False):
+        """Busca tarefas pela descrição usando o índice de texto completo.
+
+        Cada palavra da busca é tratada como prefixo, então "rel men" encontra
+        "Relatório mensal". As tarefas mais recentes vêm primeiro: ordenar pelo
+        rowid deixa o FTS5 parar no limite, em vez de calcular a relevância de
+        todas as tarefas encontradas.
+
+        Args:
+            query (str): Texto digitado pelo usuário.
+            limit (int, opcional): Quantidade máxima de tarefas retornadas.
+            include_archived (bool, opcional): Também busca nas tarefas arquivadas.
+
+        Returns:
+            list: Lista de TaskRecord encontrados.
+        """
+        match = self._match_expression(query)
+        if not match:
+            return []
+        query = SEARCH_QUERY.format(table="tasks")
+        params = (match, limit)
+        if include_archived:
+            # Cada tabela contribui com até ``limit`` tarefas; o resultado é reordenado
+            query = f"""
+                SELECT * FROM ({query}) UNION ALL SELECT * FROM ({SEARCH_QUERY.format(table="tasks_archive")})
+                ORDER BY id DESC
+                LIMIT ?
+            """
+            params = (match, limit, match, limit, limit)
+        with self.connections.reader() as conn:
+            db_cursor = conn.cursor()
+            db_cursor.row_factory = TaskRecord.row_factory
+            return db_cursor.execute(query + ";", params).fetchall()
+
+    @staticmethod
+    def _match_expression(query):
+        """Converte o texto digitado em uma expressão MATCH do FTS5 com prefixos.
+
+        Args:
+            query (str): Texto digitado pelo usuário.
+
+        Returns:
+            str: Expressão MATCH, ou string vazia se não houver palavras.
+        """
+        terms = []
+        for word in query.split():
+            # Aspas isolam a palavra da sintaxe do FTS5 (operadores, parênteses etc.)
+            terms.append('"' + word.replace('"', '""') + '"*')
+        return " ".join(terms)
+
+    @instrumented
+    def archive_completed(self, completed_before, limit=1000):
+        """Move para o arquivo um lote de tarefas concluídas antes do instante informado.
+
+        As tarefas são copiadas para ``tasks_archive`` e excluídas de ``tasks`` na
+        mesma transação, das mais antigas para as mais recentes.
+
+        Args:
+            completed_before (str): Instante limite, em UTC (AAAA-MM-DD HH:MM:SS).
+            limit (int, opcional): Quantidade máxima de tarefas movidas.
+
+        Returns:
+            list: IDs das tarefas arquivadas (vazia quando não há mais o que arquivar).
+        """
+        with self.connections.writer() as conn:
+            task_ids = [row[0] for row in conn.execute("""
+                SELECT id FROM tasks
+                WHERE completed_at IS NOT NULL AND completed_at < ?
+                ORDER BY completed_at
+                LIMIT ?;
+            """, (completed_before, limit))]
+            if not task_ids:
+                return []
+            placeholders = ", ".join("?" * len(task_ids))
+            conn.execute(f"""
+                INSERT INTO tasks_archive (id, description, start_date, end_date, status, completed_at, archived_at)
+                SELECT id, description, start_date, end_date, status, completed_at, datetime('now')
+                FROM tasks WHERE id IN ({placeholders});
+            """, task_ids)
+            conn.execute(f"DELETE FROM tasks WHERE id IN ({placeholders});", task_ids)
+        return task_ids
+
+    @instrumented
+    def count_archived(self):
+        """Conta as tarefas arquivadas.
+
+        Returns:
+            int: Quantidade de tarefas no arquivo.
+        """
+        with self.connections.reader() as conn:
+            return conn.execute("SELECT coalesce(sum(archived), 0) FROM task_status_counts;").fetchone()[0]
+
+    @instrumented
+    def storage_stats(self):
+        """Mede o tamanho das tabelas e do arquivo do banco.
+
+        O tamanho de cada tabela vem da tabela virtual ``dbstat``, quando o SQLite
+        foi compilado com ela; caso contrário, fica como None.
+
+        Returns:
+            dict: Linhas e bytes das tabelas principal e de arquivo, bytes do
+                arquivo e bytes em páginas livres.
+        """
+        with self.connections.reader() as conn:
+            page_size = conn.execute("PRAGMA page_size;").fetchone()[0]
+            page_count = conn.execute("PRAGMA page_count;").fetchone()[0]
+            free_pages = conn.execute("PRAGMA freelist_count;").fetchone()[0]
+            try:
+                sizes = dict(conn.execute("""
+                    SELECT name, sum(pgsize) FROM dbstat
+                    WHERE name IN ('tasks', 'tasks_archive')
+                    GROUP BY name;
+                """))
+            except sqlite3.OperationalError:
+                sizes = {}
+            hot_rows = conn.execute("SELECT count(*) FROM tasks;").fetchone()[0]
+            archived_rows = conn.execute("SELECT count(*) FROM tasks_archive;").fetchone()[0]
+        return {
+            "hot_rows": hot_rows,
+            "hot_bytes": sizes.get("tasks"),
+            "archived_rows": archived_rows,
+            "archive_bytes": sizes.get("tasks_archive"),
+            "file_bytes": page_size * page_count,
+            "free_bytes": page_size * free_pages,
+        }
+
+    @instrumented
+    def incremental_vacuum(self, pages=None):
+        """Devolve ao sistema as páginas livres do banco (``PRAGMA incremental_vacuum``).
 
-    def get_tasks(self):
-        """Obtém todas as tarefas do banco de dados.
+        Só tem efeito em bancos com ``auto_vacuum = INCREMENTAL`` (os criados por
+        esta versão, ou convertidos com ``vacuum``); nos demais, não libera nada.
+
+        Args:
+            pages (int, opcional): Quantidade máxima de páginas liberadas. Por
+                padrão, todas as páginas livres.
+
+        Returns:
+            int: Quantidade de páginas liberadas.
+        """
+        with self.connections.writer() as conn:
+            before = conn.execute("PRAGMA freelist_count;").fetchone()[0]
+            conn.execute(f"PRAGMA incremental_vacuum({int(pages or 0)});").fetchall()
+            after = conn.execute("PRAGMA freelist_count;").fetchone()[0]
+        return before - after
+
+    @instrumented
+    def vacuum(self):
+        """Reconstrói o arquivo do banco, ativando o modo ``auto_vacuum = INCREMENTAL``.
+
+        Operação demorada em bancos grandes, durante a qual as escritas aguardam.
+        Necessária uma única vez para bancos criados antes do arquivamento.
+        """
+        with self.connections.maintenance() as conn:
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+            conn.execute("VACUUM;")
+
+    @instrumented
+    def count_tasks(self, status=None):
+        """Conta as tarefas do banco de dados pela tabela de resumo, sem percorrê-las.
+
+        Args:
+            status (str, opcional): Conta apenas as tarefas com este status.
+
+        Returns:
+            int: Quantidade de tarefas (fora do arquivo).
+        """
+        with self.connections.reader() as conn:
+            if status is None:
+                row = conn.execute("SELECT coalesce(sum(count), 0) FROM task_status_counts;").fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT coalesce(sum(count), 0) FROM task_status_counts WHERE status = ?;", (status,)
+                ).fetchone()
+        return row[0]
+
+    @instrumented
+    def get_stats(self, days=7):
+        """Lê as estatísticas das tabelas de resumo mantidas pelos gatilhos.
+
+        Args:
+            days (int, opcional): Quantidade de dias (UTC, incluindo hoje) do histórico.
+
+        Returns:
+            dict: Tarefas por status em "by_status" e "archived" (status nulo
+                como None) e, em "daily", tuplas (dia, criadas, concluídas) dos
+                últimos ``days`` dias com alguma atividade, do mais antigo ao mais recente.
+        """
+        with self.connections.reader() as conn:
+            counts = conn.execute("SELECT status, count, archived FROM task_status_counts;").fetchall()
+            daily = conn.execute("""
+                SELECT day, created, completed FROM task_daily_stats
+                WHERE day > date('now', ?)
+                ORDER BY day;
+            """, (f"-{int(days)} days",)).fetchall()
+        return {
+            "by_status": {status or None: count for status, count, _ in counts if count},
+            "archived": {status or None: archived for status, _, archived in counts if archived},
+            "daily": daily,
+        }
+
+    @staticmethod
+    def cursor_for(task, order_by="id"):
+        """Monta o cursor de paginação a partir da última tarefa de uma página.
+
+        Args:
+            task (TaskRecord): Última tarefa da página.
+            order_by (str, opcional): Mesma ordenação usada na consulta.
 
         Returns:
-            list: Lista de dicionários representando as tarefas.
+            tuple: Valor da coluna de ordenação e ID da tarefa.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, description, start_date, end_date, status FROM tasks;")
-            rows = cursor.fetchall()
-            tasks = [
-                {"id": row[0], "description": row[1], "start_date": row[2], "end_date": row[3], "status": row[4]}
-                for row in rows
-            ]
-        return tasks
+        column, _ = TaskModel._order_column(order_by)
+        return (getattr(task, column), task.id)
 
-    def update_task(self, task_id, description, start_date=None, end_date=None, status="Pendente"):
+    @staticmethod
+    def _order_column(order_by):
+        """Valida a coluna de ordenação.
+
+        Args:
+            order_by (str): Nome da coluna, com prefixo "-" opcional.
+
+        Returns:
+            tuple: Nome da coluna e se a ordem é decrescente.
+        """
+        descending = order_by.startswith("-")
+        column = order_by.lstrip("-")
+        if column not in ORDER_COLUMNS:
+            raise ValueError(f"Ordenação inválida: {order_by}")
+        return column, descending
+
+    @staticmethod
+    def _cursor_clause(column, descending, cursor):
+        """Monta a condição que seleciona as tarefas posteriores ao cursor.
+
+        O SQLite ordena valores nulos antes dos demais em ordem crescente (e depois,
+        em ordem decrescente), o que é levado em conta para as colunas opcionais.
+
+        Args:
+            column (str): Coluna de ordenação.
+            descending (bool): Se a ordem é decrescente.
+            cursor (tuple): Valor da coluna e ID da última tarefa vista.
+
+        Returns:
+            tuple: Condição SQL e seus parâmetros.
+        """
+        value, last_id = cursor
+        op = "<" if descending else ">"
+        if column == "id":
+            return f"id {op} ?", [last_id]
+        if value is None:
+            if descending:
+                return f"{column} IS NULL AND id < ?", [last_id]
+            return f"{column} IS NOT NULL OR ({column} IS NULL AND id > ?)", [last_id]
+        if descending:
+            return f"{column} < ? OR {column} IS NULL OR ({column} = ? AND id < ?)", [value, value, last_id]
+        # Comparação de tuplas: o SQLite posiciona a busca direto no índice da coluna
+        return f"({column}, id) > (?, ?)", [value, last_id]
+
+    @instrumented
+    def update_task(self, task_id, description, start_date=None, end_date=None, status=STATUS_PENDING):
         """Atualiza uma tarefa no banco de dados.
 
         Args:
@@ -74,23 +639,115 @@ class TaskModel:
             start_date (str, opcional): Nova data de início.
             end_date (str, opcional): Nova data de conclusão.
             status (str): Novo status da tarefa.
+
+        Returns:
+            TaskRecord: Tarefa atualizada, ou None se o ID não existir.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+        with self.connections.writer() as conn:
+            row = conn.execute(f"""
                 UPDATE tasks
-                SET description = ?, start_date = ?, end_date = ?, status = ?
-                WHERE id = ?;
-            """, (description, start_date, end_date, status, task_id))
-            conn.commit()
+                SET description = ?, start_date = ?, end_date = ?,
+                    status = CASE WHEN status = '{STATUS_COMPLETED}' THEN status ELSE ? END
+                WHERE id = ?
+                RETURNING {COLUMNS};
+            """, (description, start_date, end_date, status, task_id)).fetchone()
+        return TaskRecord._make(row) if row else None
+
+    @instrumented
+    def update_tasks(self, tasks):
+        """Atualiza várias tarefas em uma única transação.
+
+        Args:
+            tasks (iterable): Tuplas (descrição, data de início, data de conclusão, status, ID).
+
+        Returns:
+            list: TaskRecord das tarefas atualizadas; IDs inexistentes ficam de fora.
+        """
+        query = f"""
+            UPDATE tasks
+            SET description = ?, start_date = ?, end_date = ?,
+                status = CASE WHEN status = '{STATUS_COMPLETED}' THEN status ELSE ? END
+            WHERE id = ?
+            RETURNING {COLUMNS};
+        """
+        with self.connections.writer() as conn:
+            rows = [conn.execute(query, task).fetchone() for task in tasks]
+        return [TaskRecord._make(row) for row in rows if row]
 
+    @instrumented
+    def update_description(self, task_id, description):
+        """Altera apenas a descrição de uma tarefa.
+
+        Args:
+            task_id (int): ID da tarefa.
+            description (str): Nova descrição da tarefa.
+
+        Returns:
+            TaskRecord: Tarefa atualizada, ou None se o ID não existir.
+        """
+        with self.connections.writer() as conn:
+            row = conn.execute(f"""
+                UPDATE tasks SET description = ? WHERE id = ?
+                RETURNING {COLUMNS};
+            """, (description, task_id)).fetchone()
+        return TaskRecord._make(row) if row else None
+
+    @instrumented
+    def update_statuses(self, changes):
+        """Altera o status de várias tarefas em uma única transação.
+
+        Args:
+            changes (iterable): Pares (ID da tarefa, novo status).
+
+        Returns:
+            int: Quantidade de tarefas atualizadas.
+        """
+        with self.connections.writer() as conn:
+            cursor = conn.executemany(
+                "UPDATE tasks SET status = ? WHERE id = ?;",
+                ((status, task_id) for task_id, status in changes),
+            )
+        return cursor.rowcount
+
+    @instrumented
     def delete_task(self, task_id):
         """Exclui uma tarefa do banco de dados.
 
         Args:
             task_id (int): ID da tarefa a ser excluída.
+
+        Returns:
+            bool: Indica se a tarefa existia e foi excluída.
+        """
+        with self.connections.writer() as conn:
+            cursor = conn.execute("DELETE FROM tasks WHERE id = ?;", (task_id,))
+        return cursor.rowcount > 0
+
+    @instrumented
+    def delete_tasks(self, task_ids):
+        """Exclui várias tarefas em uma única transação.
+
+        Args:
+            task_ids (iterable): IDs das tarefas a serem excluídas.
+
+        Returns:
+            list: IDs das tarefas excluídas; IDs inexistentes ficam de fora.
+        """
+        with self.connections.writer() as conn:
+            rows = [conn.execute("DELETE FROM tasks WHERE id = ? RETURNING id;", (task_id,)).fetchone()
+                    for task_id in task_ids]
+        return [row[0] for row in rows if row]
+
+    @instrumented
+    def delete_tasks_by_status(self, status):
+        """Exclui, em um único comando, todas as tarefas com o status informado.
+
+        Args:
+            status (str): Status das tarefas a serem excluídas.
+
+        Returns:
+            int: Quantidade de tarefas excluídas.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM tasks WHERE id = ?;", (task_id,))
-            conn.commit()
+        with self.connections.writer() as conn:
+            cursor = conn.execute("DELETE FROM tasks WHERE status = ?;", (status,))
+        return cursor.rowcount
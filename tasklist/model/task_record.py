@@ -0,0 +1,22 @@
+# model/task_record.py
+
+from typing import NamedTuple, Optional
+
+
+class TaskRecord(NamedTuple):
+    """Registro imutável e compacto de uma tarefa, como lida do banco de dados.
+
+    Por ser uma tupla nomeada (sem ``__dict__``), ocupa bem menos memória que um
+    dicionário por linha e é criada diretamente a partir da linha do SQLite.
+    """
+
+    id: int
+    description: str
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    status: Optional[str] = None
+
+    @classmethod
+    def row_factory(cls, cursor, row):
+        """Fábrica de linhas para ``sqlite3``: converte cada linha em TaskRecord."""
+        return cls._make(row)
@@ -0,0 +1,89 @@
+# view/task_pager.py
+
+import asyncio
+from collections import OrderedDict
+
+
+class TaskPager:
+    """Carrega tarefas sob demanda, página a página, para listas virtualizadas.
+
+    As linhas já construídas ficam em um cache LRU limitado, de modo que recarregar
+    a lista (por exemplo, ao trocar de filtro) reaproveita os controles existentes
+    sem manter um controle por tarefa da tabela em memória.
+
+    Args:
+        fetch_page (callable): Função assíncrona ``fetch_page(limit, cursor)`` que
+            retorna a próxima página de tarefas.
+        build_row (callable): Função que constrói o controle de uma tarefa.
+        cursor_for (callable): Função que monta o cursor a partir da última tarefa.
+        page_size (int): Quantidade de tarefas por página.
+        cache_size (int): Quantidade máxima de linhas mantidas no cache.
+    """
+
+    def __init__(self, fetch_page, build_row, cursor_for, page_size=50, cache_size=500):
+        self.fetch_page = fetch_page
+        self.build_row = build_row
+        self.cursor_for = cursor_for
+        self.page_size = page_size
+        self.cache_size = cache_size
+        self.cursor = None
+        self.exhausted = False
+        # Muda a cada reset: descarta a página buscada antes da troca de filtro
+        self._generation = 0
+        # Evita que duas rolagens seguidas busquem a mesma página
+        self._lock = asyncio.Lock()
+        # Cache LRU: ID da tarefa -> (dados da tarefa, controle construído)
+        self._rows = OrderedDict()
+
+    def reset(self):
+        """Volta para a primeira página, mantendo o cache de linhas."""
+        self.cursor = None
+        self.exhausted = False
+        self._generation += 1
+
+    async def next_page(self):
+        """Busca a próxima página de tarefas.
+
+        Returns:
+            list: Pares (tarefa, controle) da página; vazia quando não há mais tarefas.
+        """
+        async with self._lock:
+            if self.exhausted:
+                return []
+            generation = self._generation
+            tasks = await self.fetch_page(self.page_size, self.cursor)
+            if generation != self._generation:
+                return []
+            if len(tasks) < self.page_size:
+                self.exhausted = True
+            if tasks:
+                self.cursor = self.cursor_for(tasks[-1])
+        return [(task, self.row_for(task)) for task in tasks]
+
+    def row_for(self, task):
+        """Retorna o controle de uma tarefa, reaproveitando o cache quando possível.
+
+        Args:
+            task (TaskRecord): Dados da tarefa.
+
+        Returns:
+            ft.Control: Controle que representa a tarefa.
+        """
+        cached = self._rows.get(task.id)
+        if cached is not None and cached[0] == task:
+            self._rows.move_to_end(task.id)
+            return cached[1]
+        row = self.build_row(task)
+        self._rows[task.id] = (task, row)
+        self._rows.move_to_end(task.id)
+        if len(self._rows) > self.cache_size:
+            self._rows.popitem(last=False)
+        return row
+
+    def invalidate(self, task_id):
+        """Descarta a linha em cache de uma tarefa.
+
+        Args:
+            task_id (int): ID da tarefa.
+        """
+        self._rows.pop(task_id, None)
@@ -1,23 +1,60 @@
 # view/main_view.py
 
+import asyncio
+
 import flet as ft
-from controller.task_controller import TaskController
+from controller.async_task_controller import AsyncTaskController
+from controller.change_feed import CLEAR, DELETE, INSERT, RELOAD, STATUS, UPDATE
+from instrumentation import instrumented
+from model.task_model import TaskModel
+from view.task_pager import TaskPager
+from view.update_scheduler import UpdateScheduler
 from datetime import datetime
 
+# Altura fixa de cada linha, usada pela lista virtualizada
+ROW_HEIGHT = 48
+
+# Tempo de espera, em segundos, após a última tecla antes de buscar
+SEARCH_DELAY = 0.25
+
 class TaskApp:
     """Classe principal para a interface do aplicativo de lista de tarefas."""
 
-    def __init__(self):
-        """Inicializa o controlador de tarefas e configura o layout."""
-        self.controller = TaskController()
-        self.tasks = []
+    def __init__(self, controller=None):
+        """Inicializa o controlador de tarefas e configura o layout.
+
+        Args:
+            controller (AsyncTaskController, opcional): Controlador a ser usado.
+        """
+        # As operações do banco rodam fora do loop de eventos da interface
+        self.controller = controller or AsyncTaskController()
+        # Só encerra ao final da sessão o controlador que ela mesma criou
+        self._owns_controller = controller is None
+        self.page = None
+        # Agrupa as atualizações da interface em um envio por ciclo do loop de eventos
+        self.updates = None
+        # Linhas exibidas, indexadas pelo ID da tarefa
+        self.task_rows = {}
+        # Busca em andamento (a lista mostra apenas os resultados enquanto houver texto)
+        self.search_query = ""
+        self._search_task = None
+        # Cancela a assinatura das mudanças de outras sessões
+        self._unsubscribe = None
+        # Busca as tarefas sob demanda, conforme a lista é rolada
+        self.pager = TaskPager(
+            fetch_page=lambda limit, cursor: self.controller.get_tasks(limit=limit, cursor=cursor),
+            build_row=self.create_task_row,
+            cursor_for=TaskModel.cursor_for,
+        )
 
-    def main(self, page: ft.Page):
+    async def main(self, page: ft.Page):
         """Configura e exibe a interface do aplicativo.
 
         Args:
             page (ft.Page): Página principal da interface Flet.
         """
+        self.page = page
+        self.updates = UpdateScheduler(page)
         page.title = "Aplicativo de Lista de Tarefas"
         page.scroll = "auto"
 
@@ -29,8 +66,15 @@ class TaskApp:
         # Botão de adição/atualização
         self.submit_button = ft.ElevatedButton(text="Adicionar Tarefa", on_click=self.add_task)
 
-        # Contêiner para exibir tarefas
-        self.tasks_list = ft.Column()
+        # Campo de busca, com espera entre as teclas digitadas
+        self.search_field = ft.TextField(label="Buscar", width=300, on_change=self.search_changed)
+
+        # Lista virtualizada: apenas as linhas visíveis são renderizadas
+        self.tasks_list = ft.ListView(
+            height=ROW_HEIGHT * 12,
+            item_extent=ROW_HEIGHT,
+            on_scroll=self.on_scroll,
+        )
 
         # Adicionando componentes à página
         page.add(
@@ -39,42 +83,189 @@ class TaskApp:
                 self.start_date_field,
                 self.end_date_field,
                 self.submit_button,
+                self.search_field,
                 self.tasks_list
             ])
         )
 
-        # Carregar tarefas existentes
-        self.load_tasks()
+        # Recebe as mudanças feitas por outras sessões até a sessão ser encerrada
+        self._unsubscribe = self.controller.subscribe(self.apply_changes)
+        page.on_close = self.close_session
+
+        # As tarefas chegam depois que a tela já foi exibida
+        page.run_task(self.load_initial)
+
+    async def close_session(self, event=None):
+        """Cancela a assinatura das mudanças e encerra o controlador da sessão.
+
+        As conexões compartilhadas com as outras sessões continuam abertas.
+        """
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._owns_controller:
+            # Aguarda as operações em andamento fora do loop de eventos
+            await asyncio.to_thread(self.controller.close)
 
-    def load_tasks(self):
-        """Carrega todas as tarefas do banco de dados e atualiza a lista na interface."""
-        self.tasks = self.controller.get_all_tasks()
+    async def load_initial(self):
+        """Carrega a primeira página de tarefas e atualiza a página."""
+        await self.load_tasks()
+        self.updates.schedule()
+
+    @instrumented
+    async def load_tasks(self):
+        """Carrega a primeira página de tarefas do banco de dados na interface."""
+        self.task_rows.clear()
         self.tasks_list.controls.clear()
-        for task in self.tasks:
-            self.tasks_list.controls.append(self.create_task_row(task))
+        self.pager.reset()
+        await self.load_more_tasks()
+
+    @instrumented
+    async def load_more_tasks(self):
+        """Acrescenta à lista a próxima página de tarefas.
+
+        Returns:
+            bool: Indica se alguma tarefa foi carregada.
+        """
+        page = await self.pager.next_page()
+        for task, row in page:
+            self.task_rows[task.id] = row
+            self.tasks_list.controls.append(row)
+        return bool(page)
+
+    async def on_scroll(self, event):
+        """Carrega mais tarefas quando a rolagem se aproxima do fim da lista.
+
+        Args:
+            event (ft.OnScrollEvent): Evento de rolagem da lista.
+        """
+        if self.pager.exhausted or self.search_query:
+            return
+        if event.pixels >= event.max_scroll_extent - ROW_HEIGHT * 5:
+            if await self.load_more_tasks():
+                self.updates.schedule(self.tasks_list)
+
+    @instrumented
+    async def apply_changes(self, changes):
+        """Aplica às linhas exibidas as mudanças feitas por outras sessões.
+
+        Args:
+            changes (list): Mudanças (Change) recebidas do controlador.
+        """
+        for change in changes:
+            if change.kind in (RELOAD, CLEAR):
+                # Mudança em lote: a lista é recarregada (os resultados de uma
+                # busca em andamento são atualizados na próxima busca)
+                if not self.search_query:
+                    await self.load_tasks()
+                    break
+            elif change.kind == INSERT:
+                self.insert_task_row(change.data)
+            elif change.kind == DELETE:
+                self.remove_task_row(change.task_id)
+            elif change.kind in (UPDATE, STATUS) and change.task_id in self.task_rows:
+                task = change.data if change.kind == UPDATE else None
+                if task is None:
+                    task = await self.controller.get_task(change.task_id)
+                if task is not None:
+                    self.patch_task_row(task)
+        self.updates.schedule(self.tasks_list)
+
+    def insert_task_row(self, task):
+        """Adiciona à lista a linha de uma tarefa recém-criada.
+
+        Se ainda houver páginas a carregar, a tarefa aparecerá quando a lista
+        chegar ao fim.
+
+        Args:
+            task (TaskRecord): Dados da tarefa.
+        """
+        if not self.pager.exhausted or self.search_query:
+            return
+        row = self.pager.row_for(task)
+        self.task_rows[task.id] = row
+        self.tasks_list.controls.append(row)
+
+    def patch_task_row(self, task):
+        """Substitui apenas a linha de uma tarefa alterada.
+
+        Args:
+            task (TaskRecord): Dados atualizados da tarefa.
+        """
+        old_row = self.task_rows.get(task.id)
+        if old_row is None:
+            return
+        row = self.pager.row_for(task)
+        index = self.tasks_list.controls.index(old_row)
+        self.tasks_list.controls[index] = row
+        self.task_rows[task.id] = row
+
+    def remove_task_row(self, task_id):
+        """Remove da lista a linha de uma tarefa excluída.
+
+        Args:
+            task_id (int): ID da tarefa excluída.
+        """
+        self.pager.invalidate(task_id)
+        row = self.task_rows.pop(task_id, None)
+        if row is not None:
+            self.tasks_list.controls.remove(row)
+
+    async def search_changed(self, event):
+        """Agenda a busca, cancelando a anterior se o usuário continuar digitando.
+
+        Args:
+            event (ft.ControlEvent): Evento de alteração do campo de busca.
+        """
+        if self._search_task is not None:
+            self._search_task.cancel()
+        self._search_task = asyncio.create_task(self.search_tasks(self.search_field.value))
+
+    @instrumented
+    async def search_tasks(self, query):
+        """Exibe as tarefas encontradas pela busca, ou a lista completa sem busca.
+
+        Args:
+            query (str): Texto da busca.
+        """
+        await asyncio.sleep(SEARCH_DELAY)
+        self.search_query = query.strip()
+        if not self.search_query:
+            await self.load_tasks()
+        else:
+            tasks = await self.controller.search_tasks(self.search_query)
+            self.task_rows.clear()
+            self.tasks_list.controls.clear()
+            for task in tasks:
+                row = self.pager.row_for(task)
+                self.task_rows[task.id] = row
+                self.tasks_list.controls.append(row)
+        self.updates.schedule(self.tasks_list)
 
     def create_task_row(self, task):
         """Cria uma linha visual para uma tarefa.
 
         Args:
-            task (dict): Dicionário com dados da tarefa.
+            task (TaskRecord): Dados da tarefa.
 
         Returns:
             ft.Row: Linha contendo a tarefa e seus botões de controle.
         """
         return ft.Row(
+            height=ROW_HEIGHT,
             controls=[
-                ft.Text(f"ID: {task['id']}"),
-                ft.Text(task["description"]),
-                ft.Text(f"Início: {task['start_date'] or 'N/A'}"),
-                ft.Text(f"Conclusão: {task['end_date'] or 'N/A'}"),
-                ft.Text(f"Status: {task['status']}"),
+                ft.Text(f"ID: {task.id}"),
+                ft.Text(task.description),
+                ft.Text(f"Início: {task.start_date or 'N/A'}"),
+                ft.Text(f"Conclusão: {task.end_date or 'N/A'}"),
+                ft.Text(f"Status: {task.status}"),
                 ft.IconButton(icon=ft.icons.EDIT, on_click=lambda e: self.edit_task(task)),
-                ft.IconButton(icon=ft.icons.DELETE, on_click=lambda e: self.delete_task(task['id']))
+                ft.IconButton(icon=ft.icons.DELETE, on_click=lambda e: self.page.run_task(self.delete_task, task.id))
             ]
         )
 
-    def add_task(self, event):
+    @instrumented
+    async def add_task(self, event):
         """Adiciona uma nova tarefa com os dados do formulário.
 
         Args:
@@ -85,12 +276,13 @@ class TaskApp:
         end_date = self.end_date_field.value
 
         # Chama o controlador para adicionar a tarefa
-        result = self.controller.add_task(description, start_date, end_date)
+        result = await self.controller.add_task(description, start_date, end_date)
 
         # Exibe mensagem de feedback
         if result["success"]:
-            self.load_tasks()  # Recarrega a lista de tarefas
+            self.insert_task_row(result["task"])  # Exibe apenas a nova tarefa
             self.clear_form()
+            self.updates.schedule()
         else:
             print(result["message"])
 
@@ -98,15 +290,17 @@ class TaskApp:
         """Preenche o formulário com os dados de uma tarefa para edição.
 
         Args:
-            task (dict): Dados da tarefa a ser editada.
+            task (TaskRecord): Dados da tarefa a ser editada.
         """
-        self.description_field.value = task["description"]
-        self.start_date_field.value = task["start_date"] or ""
-        self.end_date_field.value = task["end_date"] or ""
+        self.description_field.value = task.description
+        self.start_date_field.value = task.start_date or ""
+        self.end_date_field.value = task.end_date or ""
         self.submit_button.text = "Atualizar Tarefa"
-        self.submit_button.on_click = lambda e: self.update_task(task["id"])
+        self.submit_button.on_click = lambda e: self.page.run_task(self.update_task, task.id)
+        self.updates.schedule()
 
-    def update_task(self, task_id):
+    @instrumented
+    async def update_task(self, task_id):
         """Atualiza uma tarefa existente com os dados do formulário.
 
         Args:
@@ -117,24 +311,28 @@ class TaskApp:
         end_date = self.end_date_field.value
 
         # Chama o controlador para atualizar a tarefa
-        result = self.controller.update_task(task_id, description, start_date, end_date)
+        result = await self.controller.update_task(task_id, description, start_date, end_date)
 
         # Exibe mensagem de feedback
         if result["success"]:
-            self.load_tasks()
+            self.patch_task_row(result["task"])  # Atualiza apenas a linha alterada
             self.clear_form()
+            self.updates.schedule()
         else:
             print(result["message"])
 
-    def delete_task(self, task_id):
+    @instrumented
+    async def delete_task(self, task_id):
         """Exclui uma tarefa com base no ID fornecido.
 
         Args:
             task_id (int): ID da tarefa a ser excluída.
         """
-        result = self.controller.delete_task(task_id)
+        result = await self.controller.delete_task(task_id)
         print(result["message"])  # Exibe a mensagem de sucesso
-        self.load_tasks()  # Recarrega a lista de tarefas
+        if result["success"]:
+            self.remove_task_row(task_id)  # Remove apenas a linha excluída
+            self.updates.schedule()
 
     def clear_form(self):
         """Limpa o formulário de tarefas."""
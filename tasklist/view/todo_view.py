@@ -1,4 +1,26 @@
+import asyncio
+
 import flet as ft
+from controller.async_task_controller import AsyncTaskController
+from controller.change_feed import CLEAR, DELETE, INSERT, RELOAD, STATUS, UPDATE
+from controller.status_buffer import StatusWriteBuffer
+from instrumentation import instrumented
+from model.task_model import STATUS_COMPLETED, STATUS_IN_PROGRESS, STATUS_OVERDUE, STATUS_PENDING, TaskModel
+from view.task_pager import TaskPager
+from view.update_scheduler import UpdateScheduler
+
+# Altura fixa de cada tarefa, usada pela lista virtualizada
+TASK_HEIGHT = 60
+
+# Dias exibidos no painel de estatísticas
+STATS_DAYS = 7
+
+# Status consultados no banco para cada filtro da lista (None: todos)
+FILTER_STATUSES = {
+    "all": None,
+    "active": (STATUS_PENDING, STATUS_IN_PROGRESS, STATUS_OVERDUE),
+    "completed": STATUS_COMPLETED,
+}
 
 class Task(ft.Column):
     """
@@ -8,17 +30,28 @@ class Task(ft.Column):
         task_name (str): O nome da tarefa.
         task_status_change (callable): Função de callback para alterar o status da tarefa.
         task_delete (callable): Função de callback para deletar a tarefa.
+        task_rename (callable, opcional): Função de callback para salvar o novo nome.
+        task_id (int, opcional): ID da tarefa no banco de dados.
+        completed (bool, opcional): Indica se a tarefa já está concluída.
+        request_update (callable, opcional): Função que agenda a atualização de um
+            controle. Por padrão, a tarefa é atualizada na hora.
     """
-    def __init__(self, task_name, task_status_change, task_delete):
+    def __init__(
+        self, task_name, task_status_change, task_delete, task_rename=None, task_id=None, completed=False,
+        request_update=None,
+    ):
         super().__init__()
-        self.completed = False  # Indica se a tarefa foi concluída.
+        self.task_id = task_id  # ID da tarefa no banco de dados.
+        self.completed = completed  # Indica se a tarefa foi concluída.
         self.task_name = task_name  # Nome da tarefa.
         self.task_status_change = task_status_change  # Callback para mudanças de status.
         self.task_delete = task_delete  # Callback para deletar a tarefa.
+        self.task_rename = task_rename  # Callback para salvar o novo nome.
+        self.request_update = request_update  # Agenda a atualização da interface.
 
         # Checkbox para exibir a tarefa com seu status.
         self.display_task = ft.Checkbox(
-            value=False, label=self.task_name, on_change=self.status_changed
+            value=completed, label=self.task_name, on_change=self.status_changed
         )
 
         # Campo de texto para edição do nome da tarefa.
@@ -74,39 +107,73 @@ class Task(ft.Column):
         self.edit_name.value = self.display_task.label  # Preenche o campo de texto com o nome atual.
         self.display_view.visible = False  # Oculta a visualização principal.
         self.edit_view.visible = True  # Exibe a visualização de edição.
-        self.update()  # Atualiza a interface.
+        self.schedule_update()  # Atualiza a interface.
 
-    def save_clicked(self, e):
+    async def save_clicked(self, e):
         """Callback para salvar o nome editado da tarefa."""
         self.display_task.label = self.edit_name.value  # Atualiza o nome da tarefa.
+        if self.task_rename:
+            await self.task_rename(self)  # Chama o callback para salvar o novo nome.
         self.display_view.visible = True  # Exibe a visualização principal.
         self.edit_view.visible = False  # Oculta a visualização de edição.
-        self.update()  # Atualiza a interface.
+        self.schedule_update()  # Atualiza a interface.
+
+    def schedule_update(self):
+        """Atualiza a tarefa na interface, pelo agendador da aplicação quando houver."""
+        if self.request_update is not None:
+            self.request_update(self)
+        else:
+            self.update()
 
-    def status_changed(self, e):
+    async def status_changed(self, e):
         """Callback para alterar o status da tarefa."""
         self.completed = self.display_task.value  # Atualiza o estado de conclusão.
-        self.task_status_change(self)  # Chama o callback para notificar a mudança.
+        await self.task_status_change(self)  # Chama o callback para notificar a mudança.
 
-    def delete_clicked(self, e):
+    async def delete_clicked(self, e):
         """Callback para deletar a tarefa."""
-        self.task_delete(self)  # Chama o callback para deletar a tarefa.
+        await self.task_delete(self)  # Chama o callback para deletar a tarefa.
 
 class TodoApp(ft.Column):
     """
     Gerencia a aplicação de lista de tarefas (To-Do).
 
     Args:
-        Nenhum argumento é necessário.
+        controller (AsyncTaskController, opcional): Controlador usado para persistir as tarefas.
     """
-    def __init__(self):
+    def __init__(self, controller=None):
         super().__init__()
+        # As operações do banco rodam fora do loop de eventos da interface.
+        self.controller = controller or AsyncTaskController()
+        # Só o controlador criado pela própria sessão é fechado ao sair da página.
+        self._owns_controller = controller is None
+        # Agrupa as mudanças de status em poucas transações.
+        self.status_buffer = StatusWriteBuffer(self.controller, on_flush=self.stats_changed)
+        # Tarefas carregadas, indexadas pelo ID.
+        self.task_controls = {}
+        # Contadores lidos da tabela de resumo e mantidos a cada mudança, sem percorrer a lista.
+        self.active_count = 0
+        self.completed_count = 0
+        # Cancela o recebimento das mudanças feitas por outras sessões.
+        self._unsubscribe = None
+        # Agrupa as atualizações da interface; criado quando a aplicação é montada.
+        self.updates = None
+        # Busca as tarefas do filtro selecionado sob demanda, conforme a lista é rolada.
+        self.pager = TaskPager(
+            fetch_page=lambda limit, cursor: self.controller.get_tasks(
+                status=FILTER_STATUSES[self.current_filter()], limit=limit, cursor=cursor
+            ),
+            build_row=self.create_task,
+            cursor_for=TaskModel.cursor_for,
+        )
         # Campo de texto para adicionar novas tarefas.
         self.new_task = ft.TextField(
             hint_text="What needs to be done?", on_submit=self.add_clicked, expand=True
         )
-        # Contêiner para exibir as tarefas.
-        self.tasks = ft.Column()
+        # Lista virtualizada para exibir as tarefas: apenas as visíveis são renderizadas.
+        self.tasks = ft.ListView(
+            height=TASK_HEIGHT * 8, item_extent=TASK_HEIGHT, on_scroll=self.on_scroll
+        )
 
         # Filtro de tarefas (todas, ativas ou concluídas).
         self.filter = ft.Tabs(
@@ -118,6 +185,8 @@ class TodoApp(ft.Column):
 
         # Texto indicando a quantidade de tarefas restantes.
         self.items_left = ft.Text("0 items left")
+        # Painel com as tarefas por status e as criadas/concluídas nos últimos dias.
+        self.stats_panel = ft.Text("", size=12)
 
         # Configuração da interface principal.
         self.controls = [
@@ -148,51 +217,344 @@ class TodoApp(ft.Column):
                             ),
                         ],
                     ),
+                    self.stats_panel,
                 ],
             ),
         ]
 
-    def add_clicked(self, e):
-        """Adiciona uma nova tarefa à lista."""
+    def create_task(self, record):
+        """Cria o controle de uma tarefa a partir dos dados do banco."""
+        task = Task(
+            record.description,
+            self.task_status_change,
+            self.task_delete,
+            self.task_rename,
+            task_id=record.id,
+            completed=record.status == STATUS_COMPLETED,
+            request_update=self.request_update,
+        )
+        task.record = record  # Mantém as datas para recalcular o status.
+        return task
+
+    def did_mount(self):
+        """Carrega as tarefas salvas depois que a aplicação é exibida."""
+        self.updates = UpdateScheduler(self.page)
+        self.page.run_task(self.load_initial)
+
+    def request_update(self, *controls):
+        """Agenda a atualização de controles (por padrão, da aplicação inteira).
+
+        As atualizações pedidas no mesmo ciclo do loop de eventos são enviadas
+        juntas. Antes de a aplicação ser montada, os controles são atualizados na hora.
+
+        Args:
+            *controls (ft.Control): Controles alterados.
+        """
+        if self.updates is None:
+            for control in controls or (self,):
+                control.update()
+        else:
+            self.updates.schedule(*(controls or (self,)))
+
+    @instrumented
+    async def load_initial(self):
+        """Carrega os contadores e a primeira página de tarefas salvas."""
+        if self._unsubscribe is None:
+            # Recebe as mudanças das outras sessões a partir daqui.
+            self._unsubscribe = self.controller.subscribe(self.apply_changes)
+        await self.load_counts()
+        await self.load_more_tasks()
+        self.request_update()
+
+    async def load_counts(self):
+        """Recarrega os contadores e o painel de estatísticas da tabela de resumo."""
+        stats = await self.controller.get_stats(STATS_DAYS)
+        self.active_count = stats["active"]
+        self.completed_count = stats["completed"]
+        self.show_stats(stats)
+
+    async def load_stats(self):
+        """Recarrega apenas o painel de estatísticas.
+
+        Os contadores da lista continuam os mantidos pela interface, que já
+        incluem as mudanças de status ainda não gravadas.
+        """
+        self.show_stats(await self.controller.get_stats(STATS_DAYS))
+
+    async def stats_changed(self):
+        """Atualiza o painel depois que as mudanças de status pendentes são gravadas."""
+        await self.load_stats()
+        if self.page is not None:
+            self.request_update()
+
+    def show_stats(self, stats):
+        """Exibe no painel as tarefas por status e as criadas/concluídas no período.
+
+        Args:
+            stats (dict): Estatísticas retornadas por ``get_stats``.
+        """
+        by_status = " · ".join(
+            f"{status}: {count}" for status, count in sorted(stats["by_status"].items(), key=lambda item: str(item[0]))
+        )
+        created = sum(day[1] for day in stats["daily"])
+        completed = sum(day[2] for day in stats["daily"])
+        self.stats_panel.value = (
+            f"{by_status or 'No tasks'} · archived: {stats['archived']}\n"
+            f"Last {STATS_DAYS} days: {created} created, {completed} completed"
+        )
+
+    @instrumented
+    async def load_more_tasks(self):
+        """Acrescenta à lista a próxima página de tarefas salvas."""
+        page = await self.pager.next_page()
+        for record, task in page:
+            if record.id not in self.task_controls:
+                self.apply_filter(task)
+                self.task_controls[record.id] = task
+                self.tasks.controls.append(task)
+        return bool(page)
+
+    async def on_scroll(self, e):
+        """Carrega mais tarefas quando a rolagem se aproxima do fim da lista."""
+        if not self.pager.exhausted and e.pixels >= e.max_scroll_extent - TASK_HEIGHT * 5:
+            if await self.load_more_tasks():
+                self.request_update()
+
+    def will_unmount(self):
+        """Grava as mudanças pendentes e encerra a sessão ao sair da página."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        self.page.run_task(self.close_session)
+
+    async def close_session(self):
+        """Grava as mudanças pendentes e encerra as threads do controlador da sessão.
+
+        As conexões compartilhadas com as outras sessões continuam abertas.
+        """
+        try:
+            await self.status_buffer.flush()
+        finally:
+            if self._owns_controller:
+                # Aguarda as operações em andamento fora do loop de eventos
+                await asyncio.to_thread(self.controller.close)
+
+    @instrumented
+    async def apply_changes(self, changes):
+        """Aplica às tarefas carregadas as mudanças feitas por outras sessões.
+
+        Apenas as linhas afetadas são alteradas. Os contadores são ajustados
+        quando a mudança traz o status da tarefa; caso contrário, são relidos.
+        Tarefas que passaram do prazo geram um aviso.
+
+        Args:
+            changes (list): Mudanças (Change) recebidas do controlador.
+        """
+        recount = False
+        overdue = 0
+        for change in changes:
+            if change.kind == STATUS and change.data == STATUS_OVERDUE:
+                overdue += 1
+            if change.kind == RELOAD:
+                # Mudança em lote sem detalhes: volta para a primeira página.
+                await self.reload_tasks()
+                recount = True
+                continue
+            if change.kind == CLEAR:
+                self.tasks.controls = [task for task in self.tasks.controls if not task.completed]
+                self.task_controls = {task.task_id: task for task in self.tasks.controls}
+                recount = True
+                continue
+
+            task = self.task_controls.get(change.task_id)
+            if change.kind == INSERT:
+                completed = change.data.status == STATUS_COMPLETED
+                self.completed_count += completed
+                self.active_count += not completed
+                # Se ainda houver páginas a carregar, a tarefa aparece ao rolar.
+                if task is None and self.pager.exhausted:
+                    task = self.pager.row_for(change.data)
+                    self.apply_filter(task)
+                    self.task_controls[task.task_id] = task
+                    self.tasks.controls.append(task)
+            elif task is None:
+                # Tarefa não carregada: não há linha a alterar, nem status anterior.
+                recount = True
+            elif change.kind == DELETE:
+                self.adjust_counts(task.completed, None)
+                self.pager.invalidate(task.task_id)
+                del self.task_controls[task.task_id]
+                self.tasks.controls.remove(task)
+            elif change.kind in (UPDATE, STATUS):
+                record = change.data
+                if change.kind == STATUS:
+                    record = task.record._replace(status=change.data)
+                elif record is None:
+                    record = await self.controller.get_task(change.task_id)
+                    if record is None:
+                        continue
+                self.adjust_counts(task.completed, record.status == STATUS_COMPLETED)
+                self.refresh_task(task, record)
+        if recount:
+            await self.load_counts()
+        else:
+            await self.load_stats()
+        if overdue:
+            self.notify(f"{overdue} task(s) past the deadline")
+        self.request_update()
+
+    def notify(self, message):
+        """Exibe um aviso temporário na parte inferior da página.
+
+        Args:
+            message (str): Texto do aviso.
+        """
+        if self.page is not None:
+            self.page.open(ft.SnackBar(ft.Text(message)))
+
+    def adjust_counts(self, was_completed, completed):
+        """Ajusta os contadores para uma tarefa que mudou de estado ou foi removida.
+
+        Args:
+            was_completed (bool): Se a tarefa estava concluída.
+            completed (bool): Se a tarefa está concluída agora (None se foi removida).
+        """
+        if was_completed:
+            self.completed_count -= 1
+        else:
+            self.active_count -= 1
+        if completed is not None:
+            self.completed_count += completed
+            self.active_count += not completed
+
+    def refresh_task(self, task, record):
+        """Atualiza, no próprio controle, os dados exibidos de uma tarefa.
+
+        Args:
+            task (Task): Controle da tarefa.
+            record (TaskRecord): Dados atualizados da tarefa.
+        """
+        self.pager.invalidate(task.task_id)
+        task.record = record
+        task.completed = record.status == STATUS_COMPLETED
+        task.display_task.value = task.completed
+        task.display_task.label = record.description
+        self.apply_filter(task)
+
+    @instrumented
+    async def add_clicked(self, e):
+        """Adiciona uma nova tarefa à lista e ao banco de dados."""
         if self.new_task.value:
-            task = Task(self.new_task.value, self.task_status_change, self.task_delete)
+            result = await self.controller.add_task(self.new_task.value)
+            if not result["success"]:
+                print(result["message"])
+                return
+            task = self.pager.row_for(result["task"])
+            self.apply_filter(task)
+            self.active_count += 1
+            self.task_controls[task.task_id] = task
             self.tasks.controls.append(task)  # Adiciona a nova tarefa.
             self.new_task.value = ""  # Limpa o campo de texto.
             self.new_task.focus()  # Mantém o foco no campo de texto.
-            self.update()  # Atualiza a interface.
+            await self.load_stats()
+            self.request_update()  # Atualiza a interface.
+
+    def current_filter(self):
+        """Retorna o filtro selecionado ("all", "active" ou "completed")."""
+        return self.filter.tabs[self.filter.selected_index].text
+
+    def apply_filter(self, task):
+        """Define a visibilidade de uma tarefa conforme o filtro selecionado."""
+        status = self.current_filter()
+        task.visible = (
+            status == "all"
+            or (status == "active" and not task.completed)
+            or (status == "completed" and task.completed)
+        )
+
+    @instrumented
+    async def task_status_change(self, task):
+        """Registra a mudança de status e atualiza a interface."""
+        self.apply_filter(task)
+        if task.completed:
+            self.active_count -= 1
+            self.completed_count += 1
+            status = STATUS_COMPLETED
+        else:
+            self.active_count += 1
+            self.completed_count -= 1
+            status = self.controller.calculate_status(task.record.start_date, task.record.end_date)
+        self.status_buffer.set_status(task.task_id, status)
+        self.request_update()
 
-    def task_status_change(self, task):
-        """Atualiza a interface ao mudar o status de uma tarefa."""
-        self.update()
+    @instrumented
+    async def task_rename(self, task):
+        """Salva o novo nome de uma tarefa; se falhar, volta a exibir o nome gravado."""
+        result = await self.controller.rename_task(task.task_id, task.display_task.label)
+        if result["success"]:
+            task.record = result["task"]
+        else:
+            print(result["message"])
+            task.display_task.label = task.record.description
 
-    def task_delete(self, task):
-        """Remove uma tarefa da lista."""
+    @instrumented
+    async def task_delete(self, task):
+        """Remove uma tarefa da lista e do banco de dados."""
+        self.status_buffer.discard(task.task_id)
+        await self.controller.delete_task(task.task_id)
+        if task.completed:
+            self.completed_count -= 1
+        else:
+            self.active_count -= 1
+        self.pager.invalidate(task.task_id)
+        self.task_controls.pop(task.task_id, None)
         self.tasks.controls.remove(task)  # Remove a tarefa.
-        self.update()  # Atualiza a interface.
+        await self.load_stats()
+        self.request_update()  # Atualiza a interface.
 
-    def tabs_changed(self, e):
-        """Atualiza a lista ao mudar o filtro de visualização."""
-        self.update()
+    @instrumented
+    async def tabs_changed(self, e):
+        """Recarrega a lista com as tarefas do filtro selecionado.
 
-    def clear_clicked(self, e):
-        """Remove todas as tarefas concluídas."""
-        for task in self.tasks.controls[:]:
+        O filtro faz parte da consulta: a primeira página já traz apenas as
+        tarefas do filtro, e as demais são carregadas ao rolar a lista.
+        """
+        await self.reload_tasks()
+        self.request_update()
+
+    async def reload_tasks(self):
+        """Volta para a primeira página da lista, reaproveitando as linhas em cache.
+
+        As mudanças de status pendentes são gravadas antes, para que a consulta
+        já veja as tarefas marcadas e desmarcadas há pouco.
+        """
+        await self.status_buffer.flush()
+        self.task_controls.clear()
+        self.tasks.controls.clear()
+        self.pager.reset()
+        await self.load_more_tasks()
+
+    @instrumented
+    async def clear_clicked(self, e):
+        """Remove todas as tarefas concluídas com um único comando no banco."""
+        await self.status_buffer.flush()  # Garante que as conclusões pendentes foram gravadas.
+        await self.controller.clear_completed()
+        self.completed_count = 0
+        remaining = []
+        for task in self.tasks.controls:
             if task.completed:
-                self.task_delete(task)
+                self.pager.invalidate(task.task_id)
+                self.task_controls.pop(task.task_id, None)
+            else:
+                remaining.append(task)
+        self.tasks.controls = remaining
+        await self.load_stats()
+        self.request_update()  # Uma única atualização para todo o lote.
 
+    @instrumented
     def before_update(self):
-        """Atualiza o status das tarefas visíveis e a contagem de itens restantes."""
-        status = self.filter.tabs[self.filter.selected_index].text
-        count = 0
-        for task in self.tasks.controls:
-            task.visible = (
-                status == "all"
-                or (status == "active" and not task.completed)
-                or (status == "completed" and task.completed)
-            )
-            if not task.completed:
-                count += 1
-        self.items_left.value = f"{count} active item(s) left"
+        """Atualiza a contagem de itens restantes a partir dos contadores."""
+        self.items_left.value = f"{self.active_count} active item(s) left"
 
 '''
 def main(page: ft.Page):
@@ -0,0 +1,131 @@
+# view/update_scheduler.py
+
+import threading
+import time
+
+import instrumentation
+
+# Duração de um quadro, em segundos: intervalo padrão entre envios
+FRAME = 1 / 60
+
+
+class UpdateScheduler:
+    """Agrupa as atualizações da interface em um único ``page.update()`` por ciclo.
+
+    Os handlers marcam os controles alterados com ``schedule`` em vez de chamar
+    ``update()`` em cada um. Após ``delay`` segundos (um quadro, por padrão),
+    uma única chamada a ``page.update(*controles)`` envia todas as mudanças ao
+    cliente, inclusive as que chegaram em ciclos diferentes do loop. Controles
+    dentro de outro controle marcado são descartados: a atualização do
+    ancestral já os inclui.
+
+    Pode ser chamado de qualquer thread (o Flet executa os handlers síncronos
+    fora do loop de eventos); o envio acontece sempre no loop da página.
+
+    Args:
+        page (ft.Page): Página que envia as atualizações.
+        delay (float | None): Espera, em segundos, antes de enviar. Com 0, agrupa
+            as chamadas do mesmo ciclo do loop; com None, envia cada atualização
+            na hora, sem agrupar.
+        loop (asyncio.AbstractEventLoop, opcional): Loop onde as atualizações
+            são enviadas. Por padrão, o loop da página.
+    """
+
+    def __init__(self, page, delay=FRAME, loop=None):
+        self.page = page
+        self.delay = delay
+        self.loop = loop or page.loop
+        # Controles marcados, na ordem da primeira marcação
+        self._dirty = {}
+        self._pending = 0
+        self._scheduled = False
+        self._lock = threading.Lock()
+        # Contadores: pedidos de atualização, envios e controles enviados
+        self.requests = 0
+        self.flushes = 0
+        self.controls_sent = 0
+        instrumentation.watch_page(page)
+
+    def schedule(self, *controls):
+        """Marca controles para atualização (por padrão, a página inteira).
+
+        Args:
+            *controls (ft.Control): Controles alterados.
+        """
+        with self._lock:
+            for control in controls or (self.page,):
+                self._dirty.setdefault(id(control), control)
+            self._pending += 1
+            if self._scheduled:
+                return
+            self._scheduled = self.delay is not None
+        if self.delay is None:
+            self.flush()
+        elif self.delay:
+            self.loop.call_soon_threadsafe(self.loop.call_later, self.delay, self.flush)
+        else:
+            self.loop.call_soon_threadsafe(self.flush)
+
+    def flush(self):
+        """Envia em uma única chamada as atualizações marcadas até aqui."""
+        with self._lock:
+            controls = list(self._dirty.values())
+            requests = self._pending
+            self._dirty.clear()
+            self._pending = 0
+            self._scheduled = False
+        controls = self._roots(controls)
+        if not controls:
+            return
+
+        start = time.perf_counter()
+        sent = instrumentation.sent_bytes()
+        if controls[0] is self.page:
+            self.page.update()
+        else:
+            self.page.update(*controls)
+        self.requests += requests
+        self.flushes += 1
+        self.controls_sent += len(controls)
+        if instrumentation.ENABLED:
+            instrumentation.record(
+                "UpdateScheduler.flush",
+                time.perf_counter() - start,
+                rows=requests,
+                size=instrumentation.sent_bytes() - sent,
+            )
+
+    def stats(self):
+        """Retorna os contadores do agendador.
+
+        Returns:
+            dict: Pedidos de atualização, envios, média de pedidos por envio e
+                controles enviados.
+        """
+        return {
+            "requests": self.requests,
+            "flushes": self.flushes,
+            "requests_per_flush": self.requests / self.flushes if self.flushes else 0.0,
+            "controls_sent": self.controls_sent,
+        }
+
+    def _roots(self, controls):
+        """Descarta os controles contidos em outro controle marcado.
+
+        Args:
+            controls (list): Controles marcados.
+
+        Returns:
+            list: Controles a enviar.
+        """
+        if any(control is self.page for control in controls):
+            return [self.page]
+        dirty = {id(control) for control in controls}
+        roots = []
+        for control in controls:
+            parent = getattr(control, "parent", None)
+            while parent is not None and id(parent) not in dirty:
+                parent = getattr(parent, "parent", None)
+            if parent is None:
+                roots.append(control)
+        return roots